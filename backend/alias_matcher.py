@@ -0,0 +1,87 @@
+from collections import deque
+from typing import Callable, Dict, FrozenSet, Iterable, List, Set
+
+# Separator used when scanning several tokens in one pass. normalize_text strips
+# everything that is not a word character, whitespace or Devanagari, so no
+# normalized alias can contain it and matches never cross token boundaries.
+TOKEN_SEPARATOR = "\x00"
+
+
+class _Automaton:
+    """Aho-Corasick automaton mapping pattern occurrences to canonical names."""
+
+    def __init__(self, patterns: Dict[str, Set[str]]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.out: List[FrozenSet[str]] = [frozenset()]
+
+        # 🔹 Trie of all patterns
+        for pattern, canonicals in patterns.items():
+            state = 0
+            for ch in pattern:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(frozenset())
+                state = nxt
+            self.out[state] = self.out[state] | frozenset(canonicals)
+
+        # 🔹 Failure links (BFS), merging outputs so search needs no suffix walk
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.out[nxt] = self.out[nxt] | self.out[self.fail[nxt]]
+
+    def search(self, text: str) -> Set[str]:
+        goto, fail, out = self.goto, self.fail, self.out
+        found: Set[str] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found |= out[state]
+        return found
+
+
+class AliasMatcher:
+    """Prebuilt multi-pattern matcher over the normalized condition aliases.
+
+    One automaton is compiled per language ("en", "hi", ...), so a single pass
+    over the query text returns every canonical condition whose alias occurs in
+    it. Instances are immutable; callers rebuild and swap the reference when the
+    alias map changes.
+    """
+
+    def __init__(self, aliases: dict, normalize: Callable[[str], str]):
+        per_lang: Dict[str, Dict[str, Set[str]]] = {}
+        for canonical, lang_map in aliases.items():
+            for lang, terms in lang_map.items():
+                for term in terms:
+                    pattern = normalize(term)
+                    if pattern:
+                        per_lang.setdefault(lang, {}).setdefault(pattern, set()).add(canonical)
+        self.pattern_count = sum(len(p) for p in per_lang.values())
+        self._automata = {lang: _Automaton(patterns) for lang, patterns in per_lang.items()}
+
+    def match(self, text: str, lang: str) -> Set[str]:
+        """Return canonical conditions whose alias (in `lang`) occurs in `text`."""
+        automaton = self._automata.get(lang)
+        if automaton is None or not text:
+            return set()
+        return automaton.search(text)
+
+    def match_tokens(self, tokens: Iterable[str], lang: str) -> Set[str]:
+        """Like match(), but an alias must occur inside a single token."""
+        return self.match(TOKEN_SEPARATOR.join(tokens), lang)
@@ -0,0 +1,112 @@
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from backend.alias_matcher import AliasMatcher
+from backend.fuzzy_index import FuzzyIndex
+
+
+class AliasSnapshot:
+    """Immutable view of condition_aliases.json with its pre-normalized indexes."""
+
+    def __init__(self, aliases: dict, normalize: Callable[[str], str],
+                 overrides: Dict[str, Optional[str]], mtime: Optional[float]):
+        self.aliases = aliases
+        self.mtime = mtime
+        self.loaded_at = time.time()
+        self._normalize = normalize
+        self._order = {canonical: i for i, canonical in enumerate(aliases)}
+
+        # 🔹 normalized term -> canonical (overrides first, then file order; first wins)
+        self.index: Dict[str, Optional[str]] = {}
+        for pseudo, canonical in overrides.items():
+            self.index.setdefault(normalize(pseudo), canonical)
+        # 🔹 lang -> raw term -> canonical, for exact slot values
+        self.terms: Dict[str, Dict[str, str]] = {}
+        for canonical, lang_map in aliases.items():
+            for lang, terms in lang_map.items():
+                for term in terms:
+                    self.index.setdefault(normalize(term), canonical)
+                    self.terms.setdefault(lang, {}).setdefault(term, canonical)
+
+        self.matcher = AliasMatcher(aliases, normalize)
+        self.raw_matcher = AliasMatcher(aliases, str)
+        self.fuzzy = FuzzyIndex(term for term, canonical in self.index.items() if canonical)
+
+    def resolve(self, raw: str) -> Optional[str]:
+        """Canonical condition whose alias (any language) equals `raw` after normalization."""
+        return self.index.get(self._normalize(raw))
+
+    def resolve_fuzzy(self, normalized: str, cutoff: float = 0.7) -> Optional[str]:
+        """Canonical condition of the closest alias to an already normalized query."""
+        matches = self.fuzzy.close_matches(normalized, n=1, cutoff=cutoff)
+        return self.index[matches[0]] if matches else None
+
+    def canonical_for(self, term: str, lang: str) -> Optional[str]:
+        """Canonical condition listing `term` verbatim as a `lang` alias."""
+        return self.terms.get(lang, {}).get(term)
+
+    def first_mentioned(self, text: str, lang: str) -> Optional[str]:
+        """First canonical (in file order) with a raw `lang` alias contained in `text`."""
+        found = self.raw_matcher.match(text, lang)
+        if not found:
+            return None
+        return min(found, key=self._order.__getitem__)
+
+
+class AliasRegistry:
+    """Process-wide owner of the condition alias map.
+
+    The file is parsed once; later calls to get() only stat it (at most every
+    `check_interval` seconds) and rebuild the snapshot when its mtime changes.
+    reload() forces a rebuild, e.g. from an admin endpoint. Snapshots are
+    swapped by reference, so readers never observe a partially built index.
+    """
+
+    def __init__(self, path: str, normalize: Callable[[str], str],
+                 overrides: Optional[Dict[str, Optional[str]]] = None,
+                 check_interval: float = 2.0):
+        self.path = path
+        self.normalize = normalize
+        self.overrides = overrides or {}
+        self.check_interval = check_interval
+        self._snapshot: Optional[AliasSnapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def _read(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"❌ Failed to load aliases from {self.path}: {e}")
+            return self._snapshot.aliases if self._snapshot else {}
+
+    def reload(self) -> AliasSnapshot:
+        with self._lock:
+            mtime = self._mtime()
+            snapshot = AliasSnapshot(self._read(), self.normalize, self.overrides, mtime)
+            self._snapshot = snapshot
+            self._checked_at = time.monotonic()
+            return snapshot
+
+    def get(self) -> AliasSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.reload()
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            if self._mtime() != snapshot.mtime:
+                return self.reload()
+        return snapshot
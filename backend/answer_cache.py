@@ -0,0 +1,110 @@
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import event, select, text
+from sqlalchemy.orm import object_session
+
+# table -> (model, looked-up column, row -> answer text)
+Lookup = Tuple[type, object, Callable[[object], str]]
+
+
+class AnswerCache:
+    """Keyword -> answer tables for DialogueManager.query_database.
+
+    The keywords a response can look up are the closed COLUMN_KEYWORDS lists,
+    so each table is read once and every answer precomputed with the same
+    rule as `column ILIKE '%keyword%'` + first(): the first row in rowid
+    order whose column contains the keyword, case-insensitively (missing
+    keywords map to ""). ORM inserts/updates/deletes on the looked-up models
+    drop the tables immediately; writes from other processes (the seed
+    scripts) are picked up by a rebuild every `refresh_interval` seconds.
+    If the build fails (e.g. the legacy tables do not exist yet) get()
+    returns None (until the next refresh) and the caller queries SQL.
+    """
+
+    def __init__(self, session_factory: Callable, lookups: Dict[str, Lookup],
+                 keywords: Dict[str, Iterable[str]], refresh_interval: float = 60.0):
+        self.session_factory = session_factory
+        self.lookups = lookups
+        self.keywords = {table: tuple(words) for table, words in keywords.items() if table in lookups}
+        self.refresh_interval = refresh_interval
+        self._answers: Optional[Dict[str, Dict[str, str]]] = None
+        self._built_at = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._stats = {"builds": 0, "invalidations": 0}
+        for model, _, _ in lookups.values():
+            for name in ("after_insert", "after_update", "after_delete"):
+                event.listen(model, name, self._on_change)
+
+    def _on_change(self, mapper, connection, target):
+        self.invalidate()
+        # Rebuilds between flush and commit would still read the old rows
+        session = object_session(target)
+        if session is not None:
+            event.listen(session, "after_commit", lambda _session: self.invalidate(), once=True)
+
+    def invalidate(self):
+        # Lock-free: ORM writers must never wait behind a rebuild
+        self._generation += 1
+        self._answers = None
+        self._built_at = 0.0
+        self._stats["invalidations"] += 1
+
+    def _read(self, db) -> Dict[str, Dict[str, str]]:
+        answers: Dict[str, Dict[str, str]] = {}
+        for table, (model, column, fmt) in self.lookups.items():
+            rows = db.execute(select(model.__table__).order_by(text("rowid"))).all()
+            values = [(str(getattr(row, column.key) or "").lower(), row) for row in rows]
+            answers[table] = {
+                keyword: next((fmt(row) for value, row in values if keyword.lower() in value), "")
+                for keyword in self.keywords.get(table, ())
+            }
+        return answers
+
+    def _build(self, db=None) -> Dict[str, Dict[str, str]]:
+        if db is not None:
+            return self._read(db)
+        with self.session_factory() as own:
+            return self._read(own)
+
+    def get(self, db=None) -> Optional[Dict[str, Dict[str, str]]]:
+        """Current tables, rebuilding them if stale; None if they are unavailable.
+
+        `db` (the caller's request session) is used for the rebuild so it
+        needs no second pooled connection. Callers that arrive while another
+        thread is rebuilding get the current tables (or None) instead of
+        queueing: a request thread holding a connection must not wait on a
+        builder that may itself be waiting for a connection.
+        """
+        if time.monotonic() - self._built_at < self.refresh_interval:
+            return self._answers
+        if not self._lock.acquire(blocking=False):
+            return self._answers
+        try:
+            if time.monotonic() - self._built_at < self.refresh_interval:
+                return self._answers
+            generation = self._generation
+            try:
+                built = self._build(db)
+                self._stats["builds"] += 1
+            except Exception as e:
+                print(f"⚠️ Answer cache unavailable, querying the database: {e}")
+                built = None
+            if generation == self._generation:
+                self._answers = built
+                self._built_at = time.monotonic()
+            return built
+        finally:
+            self._lock.release()
+
+    def lookup(self, table: str, keyword: str, db=None) -> Optional[str]:
+        """Precomputed answer, or None when the caller should query SQL."""
+        answers = self.get(db)
+        if answers is None:
+            return None
+        return answers.get(table, {}).get(keyword)
+
+    def stats(self) -> dict:
+        return dict(self._stats, built=self._answers is not None)
@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class ClaimsCache:
+    """LRU of verified JWT -> (claims, expiry).
+
+    An entry is only served until the token's own `exp`, so a cached token
+    expires exactly when jose would start rejecting it. Tokens without `exp`
+    and tokens that fail verification are never cached. Cached claims are
+    shared between requests; treat them as read-only.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get(self, token: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None:
+                claims, expires = entry
+                if expires > time.time():
+                    self._entries.move_to_end(token)
+                    self._stats["hits"] += 1
+                    return claims
+                del self._entries[token]
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, token: str, claims: dict):
+        expires = claims.get("exp")
+        if not isinstance(expires, (int, float)):
+            return
+        with self._lock:
+            self._entries[token] = (claims, expires)
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return dict(self._stats, size=len(self._entries))
+
+
+class UserCache:
+    """Short-TTL cache of user rows by email for get_current_user.
+
+    Holds detached User instances (expunged from the session that loaded
+    them), so they are plain read-only snapshots: handlers that change a
+    user re-load it in their own session. Profile writes call invalidate();
+    unknown emails are not cached, so a new registration is seen at once.
+    """
+
+    def __init__(self, ttl: float = 30.0, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def get(self, email: str, load: Callable[[], object]):
+        """Cached user for `email`, else load() (cached if not None)."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(email)
+                self._stats["hits"] += 1
+                return entry[1]
+            self._stats["misses"] += 1
+            generation = self._generation
+        user = load()
+        if user is not None:
+            with self._lock:
+                if generation != self._generation:
+                    return user  # invalidated while loading; may be the old row
+                self._entries[email] = (now + self.ttl, user)
+                self._entries.move_to_end(email)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return user
+
+    def invalidate(self, email: Optional[str] = None):
+        """Drop one user (or everyone when `email` is None)."""
+        with self._lock:
+            if email is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(email, None)
+            self._generation += 1
+            self._stats["invalidations"] += 1
+
+    def stats(self) -> dict:
+        return dict(self._stats, size=len(self._entries))
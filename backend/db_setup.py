@@ -0,0 +1,106 @@
+from typing import List, Tuple
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+
+# -----------------------
+# Connection pragmas
+# -----------------------
+# Applied to every new DBAPI connection. WAL lets the dashboard read while the
+# chat/log writers commit; synchronous=NORMAL is durable across app crashes in
+# WAL mode (only an OS crash can lose the last commits); busy_timeout makes a
+# second writer wait for the lock instead of failing with "database is locked".
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "temp_store": "MEMORY",
+    "cache_size": -20000,       # KiB (negative) => ~20 MB page cache per connection
+    "mmap_size": 134217728,     # 128 MB
+}
+
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas: dict = None):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in (pragmas or SQLITE_PRAGMAS).items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def create_sqlite_engine(url: str, pragmas: dict = None, **kwargs) -> Engine:
+    """create_engine() for the wellness DB with the pragmas applied on every connect."""
+    connect_args = kwargs.pop("connect_args", {})
+    connect_args.setdefault("check_same_thread", False)
+    engine = create_engine(url, connect_args=connect_args, **kwargs)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection, pragmas)
+
+    return engine
+
+
+# -----------------------
+# Versioned migrations
+# -----------------------
+# (version, description, statements). The applied version is stored in
+# PRAGMA user_version, so each step runs once per database file. Append new
+# steps with the next version number; never edit a step that has shipped.
+MIGRATIONS: List[Tuple[int, str, List[str]]] = [
+    (1, "indexes on analytics / history filter and sort columns", [
+        "CREATE INDEX IF NOT EXISTS ix_query_logs_timestamp ON query_logs (timestamp)",
+        "CREATE INDEX IF NOT EXISTS ix_query_logs_day ON query_logs (date(timestamp))",
+        "CREATE INDEX IF NOT EXISTS ix_query_logs_email_timestamp ON query_logs (email, timestamp)",
+        "CREATE INDEX IF NOT EXISTS ix_query_logs_matched_timestamp ON query_logs (matched_condition, timestamp)",
+        "CREATE INDEX IF NOT EXISTS ix_chat_logs_user_timestamp ON chat_logs (user_id, timestamp)",
+        "CREATE INDEX IF NOT EXISTS ix_chat_logs_timestamp ON chat_logs (timestamp)",
+        "CREATE INDEX IF NOT EXISTS ix_messages_day ON messages (date(timestamp))",
+        "CREATE INDEX IF NOT EXISTS ix_feedback_thumbs ON feedback (thumbs)",
+        "CREATE INDEX IF NOT EXISTS ix_feedback_timestamp ON feedback (timestamp)",
+        "ANALYZE",
+    ]),
+    # Frozen copy of backend.rollups.REBUILD_STATEMENTS as shipped; a rollup schema change gets its own step
+    (2, "backfill analytics rollups from query_logs", [
+        "DELETE FROM query_rollups",
+        "INSERT INTO query_rollups (day, hour, intent, language, matched, count) "
+        "SELECT coalesce(date(timestamp), ''), coalesce(CAST(strftime('%H', timestamp) AS INTEGER), -1), "
+        "coalesce(intent, ''), coalesce(language, ''), matched_condition IS NOT NULL, count(*) "
+        "FROM query_logs GROUP BY 1, 2, 3, 4, 5",
+        "DELETE FROM unknown_query_counts",
+        "INSERT INTO unknown_query_counts (query_text, count, last_seen) "
+        "SELECT coalesce(query_text, ''), count(*), max(timestamp) "
+        "FROM query_logs WHERE matched_condition IS NULL GROUP BY 1",
+    ]),
+    (3, "kb_version stamp bumped by triggers on every conditions write", [
+        "CREATE TABLE IF NOT EXISTS kb_version (id INTEGER PRIMARY KEY CHECK (id = 1), version INTEGER NOT NULL)",
+        "INSERT OR IGNORE INTO kb_version (id, version) VALUES (1, 0)",
+        "CREATE TRIGGER IF NOT EXISTS trg_conditions_insert_kb_version AFTER INSERT ON conditions "
+        "BEGIN UPDATE kb_version SET version = version + 1 WHERE id = 1; END",
+        "CREATE TRIGGER IF NOT EXISTS trg_conditions_update_kb_version AFTER UPDATE ON conditions "
+        "BEGIN UPDATE kb_version SET version = version + 1 WHERE id = 1; END",
+        "CREATE TRIGGER IF NOT EXISTS trg_conditions_delete_kb_version AFTER DELETE ON conditions "
+        "BEGIN UPDATE kb_version SET version = version + 1 WHERE id = 1; END",
+    ]),
+]
+
+
+def schema_version(engine: Engine) -> int:
+    with engine.connect() as conn:
+        return conn.execute(text("PRAGMA user_version")).scalar() or 0
+
+
+def run_migrations(engine: Engine, migrations: List[Tuple[int, str, List[str]]] = None) -> int:
+    """Apply pending migrations (each in its own transaction). Returns the final version."""
+    current = schema_version(engine)
+    for version, description, statements in (migrations or MIGRATIONS):
+        if version <= current:
+            continue
+        with engine.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+            conn.execute(text(f"PRAGMA user_version = {int(version)}"))
+        print(f"✅ DB migration {version} applied: {description}")
+        current = version
+    return current
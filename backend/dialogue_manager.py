@@ -1,10 +1,19 @@
-import re
-from difflib import get_close_matches
+import os
+import threading
+from contextlib import nullcontext
 from typing import List, Dict
 
 from backend.main import SessionLocal
 from backend.models import Symptom, Medication, WellnessTip, FirstAid
 from backend.knowledge_base import LANGUAGE_MAP
+from backend.fuzzy_index import index_for
+from backend.answer_cache import AnswerCache
+from backend.query_normalizer import QueryNormalizer
+from backend.intent_rules import intent_rules, load_keyword_sets
+from backend.intent_classifier import DEFAULT_THRESHOLD, get_classifier
+
+# 🔹 "rules" (data_structured/intent_rules.json) or "model" (batched intent classifier, falls back to rules)
+INTENT_BACKEND = os.getenv("WELLBOT_INTENT_BACKEND", "rules")
 
 # 🔹 Canonical symptom mapping
 SYMPTOM_CANONICAL = {
@@ -78,107 +87,101 @@ STATIC_RESPONSES = {
     "express_emotion": "I'm here for you. It's okay to feel this way."
 }
 
-# 🔹 Keyword lists for each table
-COLUMN_KEYWORDS = {
-    "symptoms": [
-        "headache", "fever", "cough", "cold", "nausea", "pain", "fatigue", "dizziness", "sore throat"
-    ],
-    "medications": [
-        "fever", "cold", "pain", "headache", "dizziness", "fatigue", "nausea", "sore throat"
-    ],
-    "first_aid": [
-        "burn", "cut", "sprain", "bleeding", "injury", "headache", "choking", "snake bite"
-    ],
-    "wellness_tips": [
-        "hydration", "diet", "sleep", "stress", "anxiety", "energy", "routine", "fatigue", "mental health", "exercise"
-    ]
+# 🔹 Keyword lists for each table: keyword_sets in data_structured/intent_rules.json, which the
+# symptom / medication / wellness / first-aid intent rules use too (read once; restart after editing)
+COLUMN_KEYWORDS = load_keyword_sets()
+
+# 🔹 Legacy table lookups: table -> (model, keyword column, answer format)
+LEGACY_LOOKUPS = {
+    "symptoms": (Symptom, Symptom.symptom_name, lambda r: f"Symptom info: {r.description}"),
+    "medications": (Medication, Medication.condition, lambda r: f"Recommended medicine: {r.medicine_name}"),
+    "wellness_tips": (WellnessTip, WellnessTip.category, lambda r: f"Wellness tip: {r.tip_text}"),
+    "first_aid": (FirstAid, FirstAid.issue, lambda r: f"First aid steps: {r.steps}"),
 }
 
-class DialogueManager:
-    def __init__(self):
-        self.db = SessionLocal()
+# 🔹 Precomputed keyword -> answer per table (COLUMN_KEYWORDS is the closed keyword set)
+answer_cache = AnswerCache(SessionLocal, LEGACY_LOOKUPS, COLUMN_KEYWORDS)
 
-    def normalize_query(self, text: str) -> str:
-        text = text.lower().strip()
-        text = re.sub(r"[^\w\s]", "", text)
+# 🔹 Hindi -> English, then canonical symptoms, then synonyms (compiled once, memoized)
+query_normalizer = QueryNormalizer([LANGUAGE_MAP, SYMPTOM_CANONICAL, SYNONYM_MAP])
 
-        for hindi, eng in LANGUAGE_MAP.items():
-            text = text.replace(hindi, eng)
 
-        for raw, canonical in SYMPTOM_CANONICAL.items():
-            text = text.replace(raw, canonical)
+def infer_intents(query: str) -> List[str]:
+    """Keyword-rule intents for one query (data_structured/intent_rules.json)."""
+    return intent_rules.get().match(query_normalizer.normalize(query))
 
-        for raw, canonical in SYNONYM_MAP.items():
-            text = text.replace(raw, canonical)
 
-        return text
+def infer_intents_batch(queries: List[str]) -> List[List[str]]:
+    """Keyword-rule intents for many queries, e.g. to relabel logged queries offline."""
+    return intent_rules.get().match_batch(query_normalizer.normalize(q) for q in queries)
+
+# Serializes appends to unmatched_queries.log across request threads
+_unmatched_lock = threading.Lock()
+
+
+class DialogueManager:
+    """Stateless response engine, safe to share across request threads.
+
+    Lookups come from the shared answer cache. The SQL fallback uses the
+    caller's request session when one is passed (so a request never holds
+    two pooled connections at once), else a short-lived session from
+    `session_factory`; no session is held for the whole process.
+    """
+
+    def __init__(self, intent_backend: str = None, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self.intent_backend = intent_backend or INTENT_BACKEND
+        self._model_warned = False
+
+    def normalize_query(self, text: str) -> str:
+        return query_normalizer.normalize(text)
 
     def extract_keyword(self, text: str, keywords: List[str], intent: str = "") -> str:
         text = self.normalize_query(text)
         for word in keywords:
             if word in text:
                 return word
+        keyword_index = index_for(tuple(keywords))
         for token in text.split():
             if token in SYNONYM_MAP and SYNONYM_MAP[token] in keywords:
                 return SYNONYM_MAP[token]
-            match = get_close_matches(token, keywords, n=1, cutoff=0.7)
+            match = keyword_index.close_matches(token, n=1, cutoff=0.7)
             if match:
                 return match[0]
         return ""
 
     def infer_intents(self, query: str) -> List[str]:
-        query_lower = self.normalize_query(query)
-        intents = []
-
-        # Prioritize medication if medicine-related terms are present
-        if any(word in query_lower for word in ["pill", "tablet", "medicine", "drug", "remedy"]):
-            intents.append("ask_about_medication")
-
-        if any(word in query_lower for word in ["hello", "hi", "hey", "greetings", "good morning", "good evening", "नमस्ते", "सुप्रभात"]):
-            intents.append("greeting")
-
-        if any(word in query_lower for word in COLUMN_KEYWORDS["symptoms"]):
-            intents.append("ask_about_symptom")
-
-        if any(word in query_lower for word in COLUMN_KEYWORDS["medications"]):
-            if "ask_about_medication" not in intents:
-                intents.append("ask_about_medication")
-
-        if any(word in query_lower for word in COLUMN_KEYWORDS["wellness_tips"]):
-            intents.append("ask_about_wellness_tip")
-
-        if any(word in query_lower for word in ["overwhelmed", "anxious", "hopeless", "isolated", "not okay", "depressed", "worried"]):
-            intents.append("express_emotion")
-
-        if any(word in query_lower for word in COLUMN_KEYWORDS["first_aid"]):
-            intents.append("query_first_aid")
-
-        return intents if intents else []
-
-    def query_database(self, table: str, keyword: str) -> str:
+        if self.intent_backend == "model":
+            try:
+                return get_classifier().predict(query, threshold=DEFAULT_THRESHOLD)["intents"]
+            except Exception as e:
+                # This call only: a transient failure must not switch the shared engine to rules for
+                # good. A model that cannot load keeps failing fast on its cached load error.
+                if not self._model_warned:
+                    self._model_warned = True
+                    print(f"⚠️ Intent model unavailable, using keyword rules: {e}")
+        return self.infer_intents_rules(query)
+
+    def infer_intents_rules(self, query: str) -> List[str]:
+        return intent_rules.get().match(self.normalize_query(query))
+
+    def query_database(self, table: str, keyword: str, db=None) -> str:
+        answer = answer_cache.lookup(table, keyword, db)
+        if answer is not None:
+            return answer
+        lookup = LEGACY_LOOKUPS.get(table)
+        if lookup is None:
+            return ""
+        model, column, fmt = lookup
         try:
-            if table == "symptoms":
-                result = self.db.query(Symptom).filter(Symptom.symptom_name.ilike(f"%{keyword}%")).first()
-                return f"Symptom info: {result.description}" if result else ""
-
-            elif table == "medications":
-                result = self.db.query(Medication).filter(Medication.condition.ilike(f"%{keyword}%")).first()
-                return f"Recommended medicine: {result.medicine_name}" if result else ""
-
-            elif table == "wellness_tips":
-                result = self.db.query(WellnessTip).filter(WellnessTip.category.ilike(f"%{keyword}%")).first()
-                return f"Wellness tip: {result.tip_text}" if result else ""
-
-            elif table == "first_aid":
-                result = self.db.query(FirstAid).filter(FirstAid.issue.ilike(f"%{keyword}%")).first()
-                return f"First aid steps: {result.steps}" if result else ""
+            with nullcontext(db) if db is not None else self.session_factory() as session:
+                result = session.query(model).filter(column.ilike(f"%{keyword}%")).first()
+                return fmt(result) if result else ""
 
         except Exception as e:
             return f"⚠️ Database error: {str(e)}"
 
-        return ""
-
-    def generate_response(self, query_text: str) -> Dict[str, str]:
+    def generate_response(self, query_text: str, db=None) -> Dict[str, str]:
         intents = self.infer_intents(query_text)
         query_clean = self.normalize_query(query_text)
 
@@ -195,15 +198,15 @@ class DialogueManager:
             if not keyword:
                 continue
 
-            response = self.query_database(table, keyword)
+            response = self.query_database(table, keyword, db)
             if response:
                 return {"intent": intent, "response": response}
 
         # Log unmatched queries for future training
-        with open("unmatched_queries.log", "a", encoding="utf-8") as f:
+        with _unmatched_lock, open("unmatched_queries.log", "a", encoding="utf-8") as f:
             f.write(query_text + "\n")
 
         return {"intent": "unknown", "response": "No exact match found in the knowledge base."}
 
     def close(self):
-        self.db.close()
+        """Kept for callers of the old API; there is no per-instance session to release."""
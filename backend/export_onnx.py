@@ -0,0 +1,69 @@
+"""Export backend/intent_model_multi to ONNX (fp32 + dynamic int8) for CPU serving.
+
+    python -m backend.export_onnx [--model-dir backend/intent_model_multi] [--opset 17]
+
+Writes <model-dir>/onnx/model.onnx and model.int8.onnx. Select one at serve
+time with WELLBOT_INTENT_RUNTIME=onnx or WELLBOT_INTENT_RUNTIME=onnx-int8.
+Needs torch, transformers, onnx and onnxruntime.
+"""
+import argparse
+from pathlib import Path
+
+from backend.intent_classifier import MODEL_DIR, RUNTIMES, onnx_dir
+
+
+def export(model_dir: Path, opset: int = 17) -> dict:
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    out_dir = onnx_dir(model_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    fp32_path = out_dir / RUNTIMES["onnx"]
+    int8_path = out_dir / RUNTIMES["onnx-int8"]
+
+    tokenizer = AutoTokenizer.from_pretrained(str(model_dir))
+    model = AutoModelForSequenceClassification.from_pretrained(str(model_dir))
+    model.eval()
+
+    sample = tokenizer(["export sample", "नमूना वाक्य"], return_tensors="pt", padding=True)
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    with torch.inference_mode():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            str(fp32_path),
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            do_constant_folding=True,
+            dynamo=False,
+        )
+    print(f"✅ Exported fp32 graph to {fp32_path}")
+
+    # Weights of MatMul/Gemm become int8; activations are quantized per batch at run time
+    quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+    print(f"✅ Quantized int8 graph to {int8_path}")
+
+    return {
+        "onnx": fp32_path.stat().st_size,
+        "onnx-int8": int8_path.stat().st_size,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the intent model to ONNX fp32 + int8.")
+    parser.add_argument("--model-dir", type=Path, default=MODEL_DIR)
+    parser.add_argument("--opset", type=int, default=17)
+    args = parser.parse_args()
+    sizes = export(args.model_dir, args.opset)
+    for runtime, size in sizes.items():
+        print(f"   {runtime:<10} {size / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
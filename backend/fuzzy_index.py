@@ -0,0 +1,64 @@
+from collections import Counter
+from difflib import SequenceMatcher
+from functools import lru_cache
+from heapq import nlargest
+from typing import Dict, Iterable, List, Tuple
+
+
+class FuzzyIndex:
+    """Character n-gram inverted index with difflib-compatible scoring.
+
+    Choices are split into padded n-grams (code points, so Devanagari matras
+    and conjuncts work like any other character). A query only looks at the
+    choices that share n-grams with it, keeps the `max_candidates` with the
+    largest overlap, and scores those with SequenceMatcher.ratio() — the same
+    score difflib.get_close_matches uses — instead of scanning every choice.
+    Keep this module free of third-party imports: the Streamlit app uses it too.
+    """
+
+    def __init__(self, choices: Iterable[str], n: int = 2, max_candidates: int = 32):
+        self.n = n
+        self.max_candidates = max_candidates
+        self.choices: List[str] = list(dict.fromkeys(c for c in choices if c))
+        self._postings: Dict[str, List[int]] = {}
+        for i, choice in enumerate(self.choices):
+            for gram in set(self._grams(choice)):
+                self._postings.setdefault(gram, []).append(i)
+
+    def _grams(self, text: str) -> List[str]:
+        pad = " " * (self.n - 1)
+        padded = f"{pad}{text}{pad}"
+        return [padded[i:i + self.n] for i in range(len(padded) - self.n + 1)]
+
+    def search(self, query: str, k: int = 3, cutoff: float = 0.6) -> List[Tuple[str, float]]:
+        """Return up to `k` (choice, score) pairs with score >= cutoff, best first."""
+        if not query or not self.choices:
+            return []
+        overlap: Counter = Counter()
+        for gram in set(self._grams(query)):
+            for i in self._postings.get(gram, ()):
+                overlap[i] += 1
+        if not overlap:
+            return []
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(query)
+        scored = []
+        for i, _ in overlap.most_common(self.max_candidates):
+            matcher.set_seq1(self.choices[i])
+            if (matcher.real_quick_ratio() >= cutoff and
+                    matcher.quick_ratio() >= cutoff):
+                score = matcher.ratio()
+                if score >= cutoff:
+                    scored.append((score, self.choices[i]))
+        return [(choice, score) for score, choice in nlargest(k, scored)]
+
+    def close_matches(self, query: str, n: int = 3, cutoff: float = 0.6) -> List[str]:
+        """Drop-in replacement for difflib.get_close_matches(query, choices, n, cutoff)."""
+        return [choice for choice, _ in self.search(query, k=n, cutoff=cutoff)]
+
+
+@lru_cache(maxsize=64)
+def index_for(choices: Tuple[str, ...]) -> FuzzyIndex:
+    """Shared index for a fixed keyword tuple (e.g. one COLUMN_KEYWORDS list)."""
+    return FuzzyIndex(choices)
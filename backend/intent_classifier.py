@@ -0,0 +1,276 @@
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Inference-only wrapper around the fine-tuned multi-label model in
+# backend/intent_model_multi. torch/transformers are imported on first load so
+# the API and the rule-based dialogue path keep working without them.
+MODEL_DIR = Path(__file__).parent / "intent_model_multi"
+DEFAULT_THRESHOLD = 0.3
+
+# 🔹 Runtimes: PyTorch fp32, or the ONNX graphs written by backend/export_onnx.py into onnx_dir()
+RUNTIMES = {
+    "torch": None,
+    "onnx": "model.onnx",
+    "onnx-int8": "model.int8.onnx",
+}
+
+
+def onnx_dir(model_dir: Path = MODEL_DIR) -> Path:
+    return model_dir / "onnx"
+
+_STOP = object()
+
+
+class _Pending:
+    __slots__ = ("text", "future")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.future: Future = Future()
+
+
+class IntentClassifier:
+    """Loads the intent model once and serves concurrent callers in micro-batches.
+
+    Callers block in scores()/predict(); a single worker thread takes the first
+    waiting request, keeps collecting until `max_batch_size` requests are queued
+    or `max_wait_ms` has passed, then runs one padded forward pass under
+    torch.inference_mode() and hands each caller its own sigmoid scores.
+    """
+
+    def __init__(self, model_dir: Path = MODEL_DIR, max_batch_size: int = 16,
+                 max_wait_ms: float = 5.0, max_length: int = 64, device: Optional[str] = None,
+                 runtime: str = "torch"):
+        if runtime not in RUNTIMES:
+            raise ValueError(f"Unknown intent runtime '{runtime}' (expected one of {', '.join(RUNTIMES)})")
+        self.model_dir = Path(model_dir)
+        self.runtime = runtime
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_length = max_length
+        self.device = device
+        self.labels: List[str] = []
+        self._model = None
+        self._tokenizer = None
+        self._torch = None
+        self._session = None
+        self._input_names: List[str] = []
+        self._load_error: Optional[Exception] = None
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "batches": 0, "max_batch": 0, "errors": 0}
+
+    # -----------------------
+    # Model loading
+    # -----------------------
+    def _read_labels(self) -> List[str]:
+        with open(self.model_dir / "label_map.json", "r", encoding="utf-8") as f:
+            id2label = json.load(f)["id2label"]
+        return [id2label[str(i)] for i in range(len(id2label))]
+
+    def load(self):
+        """Load tokenizer + model (idempotent). Raises if torch/transformers or weights are missing.
+
+        A failed load is remembered, so callers that fall back to the keyword
+        rules do not retry (and re-import) on every request.
+        """
+        with self._lock:
+            if self.loaded:
+                return
+            if self._load_error is not None:
+                raise RuntimeError(f"intent model failed to load: {self._load_error}")
+            try:
+                self._load()
+            except Exception as e:
+                self._load_error = e
+                raise
+
+    def _load(self):
+        if self.runtime != "torch":
+            return self._load_onnx()
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        self.labels = self._read_labels()
+        device = self.device or ("cuda" if torch.cuda.is_available() else "cpu")
+        tokenizer = AutoTokenizer.from_pretrained(str(self.model_dir))
+        model = AutoModelForSequenceClassification.from_pretrained(
+            str(self.model_dir),
+            num_labels=len(self.labels),
+            problem_type="multi_label_classification",
+        )
+        model.to(device)
+        model.eval()
+        self.device = device
+        self._torch = torch
+        self._tokenizer = tokenizer
+        self._model = model
+        print(f"✅ Intent classifier loaded from {self.model_dir} on {device}")
+
+    def _load_onnx(self):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        path = onnx_dir(self.model_dir) / RUNTIMES[self.runtime]
+        if not path.exists():
+            raise FileNotFoundError(f"{path} not found; run python -m backend.export_onnx")
+        self.labels = self._read_labels()
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session = ort.InferenceSession(str(path), options, providers=["CPUExecutionProvider"])
+        self._input_names = [i.name for i in session.get_inputs()]
+        self._tokenizer = AutoTokenizer.from_pretrained(str(self.model_dir))
+        self.device = "cpu"
+        self._session = session
+        print(f"✅ Intent classifier ({self.runtime}) loaded from {path}")
+
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None or self._session is not None
+
+    # -----------------------
+    # Batched inference
+    # -----------------------
+    def _forward(self, enc) -> List[List[float]]:
+        """Sigmoid scores for an already padded batch (pt tensors or np arrays)."""
+        if self._session is not None:
+            import numpy as np
+
+            feed = {name: np.asarray(enc[name], dtype=np.int64) for name in self._input_names}
+            logits = self._session.run(None, feed)[0]
+            return (1.0 / (1.0 + np.exp(-logits))).tolist()
+        torch = self._torch
+        enc = {k: v.to(self.device) for k, v in enc.items()}
+        with torch.inference_mode():
+            return torch.sigmoid(self._model(**enc).logits).cpu().tolist()
+
+    @property
+    def _tensor_type(self) -> str:
+        return "np" if self._session is not None else "pt"
+
+    def score_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        """One forward pass over `texts` (padded to the longest). Used by the worker."""
+        if not self.loaded:
+            self.load()
+        enc = self._tokenizer(texts, return_tensors=self._tensor_type, truncation=True,
+                              padding=True, max_length=self.max_length)
+        return [dict(zip(self.labels, row)) for row in self._forward(enc)]
+
+    def score_many(self, texts: List[str], batch_size: int = 32) -> List[Dict[str, float]]:
+        """Offline scoring of many texts, bypassing the request queue.
+
+        Texts are tokenized once without padding, sorted by token length and
+        cut into batches, so each batch is padded only to its own longest
+        text; results come back in input order.
+        """
+        if not self.loaded:
+            self.load()
+        if not texts:
+            return []
+        enc = self._tokenizer(list(texts), truncation=True, max_length=self.max_length)
+        keys = list(enc.keys())
+        order = sorted(range(len(texts)), key=lambda i: len(enc["input_ids"][i]))
+        results: List[Optional[Dict[str, float]]] = [None] * len(texts)
+        for start in range(0, len(order), batch_size):
+            chunk = order[start:start + batch_size]
+            features = [{k: enc[k][i] for k in keys} for i in chunk]
+            padded = self._tokenizer.pad(features, padding=True, return_tensors=self._tensor_type)
+            for i, row in zip(chunk, self._forward(padded)):
+                results[i] = dict(zip(self.labels, row))
+        return results
+
+    def _ensure_worker(self):
+        if not self.loaded:
+            self.load()
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._run, name="intent-classifier", daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait
+            stopping = False
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                results = self.score_batch([p.text for p in batch])
+            except Exception as e:
+                self._stats["errors"] += 1
+                for p in batch:
+                    p.future.set_exception(e)
+            else:
+                for p, scores in zip(batch, results):
+                    p.future.set_result(scores)
+            self._stats["batches"] += 1
+            self._stats["requests"] += len(batch)
+            self._stats["max_batch"] = max(self._stats["max_batch"], len(batch))
+            if stopping:
+                return
+
+    def scores(self, text: str, timeout: Optional[float] = 30.0) -> Dict[str, float]:
+        """Sigmoid score per intent label for one text (micro-batched with concurrent callers)."""
+        self._ensure_worker()
+        pending = _Pending(text or "")
+        self._queue.put(pending)
+        return pending.future.result(timeout=timeout)
+
+    def predict(self, text: str, threshold: float = DEFAULT_THRESHOLD) -> Dict[str, object]:
+        """Same shape as nlu_multi.predict_intents(): intents above threshold, best first."""
+        confidence_scores = self.scores(text)
+        intents = [label for label, p in sorted(confidence_scores.items(), key=lambda kv: -kv[1])
+                   if p > threshold]
+        return {"intents": intents, "confidence_scores": confidence_scores}
+
+    def stop(self, timeout: float = 5.0):
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    def stats(self) -> dict:
+        batches = self._stats["batches"]
+        return dict(self._stats, loaded=self.loaded, device=self.device, runtime=self.runtime,
+                    avg_batch=round(self._stats["requests"] / batches, 2) if batches else 0.0)
+
+
+# -----------------------
+# Shared instance
+# -----------------------
+_classifier: Optional[IntentClassifier] = None
+_classifier_lock = threading.Lock()
+
+
+def get_classifier() -> IntentClassifier:
+    global _classifier
+    if _classifier is None:
+        with _classifier_lock:
+            if _classifier is None:
+                _classifier = IntentClassifier(
+                    max_batch_size=int(os.getenv("WELLBOT_INTENT_MAX_BATCH", "16")),
+                    max_wait_ms=float(os.getenv("WELLBOT_INTENT_MAX_WAIT_MS", "5")),
+                    runtime=os.getenv("WELLBOT_INTENT_RUNTIME", "torch"),
+                )
+    return _classifier
@@ -0,0 +1,146 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from backend.alias_matcher import AliasMatcher
+
+# 🔹 Keyword -> intent rules (edit the JSON to add intents; no code change needed)
+RULES_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "data_structured", "intent_rules.json"))
+
+_ANY = "*"
+
+
+def load_keyword_sets(path: str = RULES_PATH) -> Dict[str, List[str]]:
+    """keyword_sets from the rules file: table -> keywords, shared by the rules and the answer lookup."""
+    with open(path, "r", encoding="utf-8") as f:
+        return {name: list(words) for name, words in json.load(f).get("keyword_sets", {}).items()}
+
+
+class IntentRuleEngine:
+    """Keyword rules compiled into one Aho-Corasick automaton.
+
+    Every rule is {"intent": ..., "keywords": [...]} and/or {"keyword_set": name},
+    which adds that list from the file's keyword_sets (the COLUMN_KEYWORDS the
+    answer lookup uses). A rule fires when any of its keywords occurs as a
+    substring of the (already normalized) query. One
+    pass over the text finds every firing rule, and intents are returned in the
+    order of their first firing rule, without duplicates, which is the order
+    the old chain of any(...) checks produced.
+    """
+
+    def __init__(self, rules: List[Dict], mtime: Optional[float] = None,
+                 keyword_sets: Optional[Dict[str, List[str]]] = None):
+        keyword_sets = keyword_sets or {}
+        self.rules = []
+        for r in rules:
+            keywords = list(r.get("keywords", []))
+            if "keyword_set" in r:
+                if r["keyword_set"] not in keyword_sets:
+                    raise ValueError(f"rule {r['intent']!r} uses unknown keyword_set {r['keyword_set']!r}")
+                keywords += keyword_sets[r["keyword_set"]]
+            self.rules.append({"intent": r["intent"], "keywords": keywords})
+        self.mtime = mtime
+        self.intents = list(dict.fromkeys(r["intent"] for r in self.rules))
+        self._matcher = AliasMatcher(
+            {i: {_ANY: rule["keywords"]} for i, rule in enumerate(self.rules)},
+            lambda keyword: keyword,
+        )
+
+    @classmethod
+    def from_file(cls, path: str = RULES_PATH) -> "IntentRuleEngine":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["rules"], os.path.getmtime(path), data.get("keyword_sets", {}))
+
+    def match(self, text: str) -> List[str]:
+        """Intents whose rules fire on `text`, in rule order."""
+        fired = sorted(self._matcher.match(text, _ANY))
+        return list(dict.fromkeys(self.rules[i]["intent"] for i in fired))
+
+    def match_batch(self, texts: Iterable[str]) -> List[List[str]]:
+        """match() over many texts; repeated texts are matched once."""
+        texts = list(texts)
+        unique = {text: self.match(text) for text in dict.fromkeys(texts)}
+        return [list(unique[text]) for text in texts]
+
+
+# -----------------------
+# Shared instance (reloaded when the rules file changes)
+# -----------------------
+class IntentRuleStore:
+    def __init__(self, path: str = RULES_PATH, check_interval: float = 2.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._engine: Optional[IntentRuleEngine] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def reload(self) -> IntentRuleEngine:
+        with self._lock:
+            try:
+                self._engine = IntentRuleEngine.from_file(self.path)
+            except Exception as e:
+                print(f"❌ Failed to load intent rules from {self.path}: {e}")
+                if self._engine is None:
+                    self._engine = IntentRuleEngine([], self._mtime())
+            self._checked_at = time.monotonic()
+            return self._engine
+
+    def get(self) -> IntentRuleEngine:
+        engine = self._engine
+        if engine is None:
+            return self.reload()
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            if self._mtime() != engine.mtime:
+                return self.reload()
+        return engine
+
+
+intent_rules = IntentRuleStore()
+
+
+# -----------------------
+# Offline relabeling: python -m backend.intent_rules [file] (default: query_logs)
+# -----------------------
+def _logged_queries() -> List[str]:
+    from backend.main import QueryLog, SessionLocal
+
+    db = SessionLocal()
+    try:
+        return [text for (text,) in db.query(QueryLog.query_text).order_by(QueryLog.id) if text]
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Relabel queries with the keyword intent rules (JSON lines out).")
+    parser.add_argument("input", nargs="?", help="text file with one query per line (default: query_logs table)")
+    args = parser.parse_args()
+
+    # Imported here: backend.dialogue_manager pulls in backend.main
+    import backend.main  # noqa: F401
+    from backend.dialogue_manager import infer_intents_batch
+
+    if args.input:
+        with open(args.input, "r", encoding="utf-8") as f:
+            queries = [line.rstrip("\n") for line in f if line.strip()]
+    else:
+        queries = _logged_queries()
+    for text, intents in zip(queries, infer_intents_batch(queries)):
+        sys.stdout.write(json.dumps({"text": text, "intents": intents}, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
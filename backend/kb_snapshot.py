@@ -0,0 +1,213 @@
+import threading
+import time
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from backend.fuzzy_index import FuzzyIndex
+from backend.text_utils import normalize_text
+
+
+@dataclass(frozen=True)
+class ConditionRecord:
+    """Read-only copy of one `conditions` row, detached from any DB session."""
+    condition_en: str
+    condition_hi: Optional[str] = None
+    description_en: Optional[str] = None
+    description_hi: Optional[str] = None
+    symptom_en: Optional[str] = None
+    symptom_hi: Optional[str] = None
+    first_aid_en: Optional[str] = None
+    first_aid_hi: Optional[str] = None
+    prevention_en: Optional[str] = None
+    prevention_hi: Optional[str] = None
+    disclaimer_en: Optional[str] = None
+    disclaimer_hi: Optional[str] = None
+    intent_category: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    @classmethod
+    def from_row(cls, row) -> "ConditionRecord":
+        return cls(**{f.name: getattr(row, f.name, None) for f in fields(cls)})
+
+
+def _normalized_names(record: ConditionRecord) -> Tuple[Optional[str], Optional[str]]:
+    return tuple(
+        normalize_text(name) if name else None
+        for name in (record.condition_en, record.condition_hi)
+    )
+
+
+class KBSnapshot:
+    """Versioned, immutable view of the conditions table.
+
+    `by_name` keeps DB load order (new conditions are appended), and
+    `normalized` holds (normalize_text(name), condition_en) pairs per language
+    so fuzzy lookups never re-normalize rows.
+    """
+
+    def __init__(self, records: Dict[str, ConditionRecord],
+                 norms: Dict[str, Tuple[Optional[str], Optional[str]]], version: int):
+        self.version = version
+        self.by_name = records
+        self._norms = norms
+        self.normalized: Dict[str, List[Tuple[str, str]]] = {"en": [], "hi": []}
+        for name in records:
+            norm_en, norm_hi = norms[name]
+            if norm_en:
+                self.normalized["en"].append((norm_en, name))
+            if norm_hi:
+                self.normalized["hi"].append((norm_hi, name))
+        self._fuzzy: Dict[str, FuzzyIndex] = {}
+        self._lowered: Optional[Dict[str, str]] = None
+
+    def fuzzy_index(self, lang: str) -> FuzzyIndex:
+        """Fuzzy index over the normalized `lang` names (built on first use)."""
+        index = self._fuzzy.get(lang)
+        if index is None:
+            index = FuzzyIndex(normalized for normalized, _ in self.normalized.get(lang, []))
+            self._fuzzy[lang] = index
+        return index
+
+    def suggestion_index(self) -> FuzzyIndex:
+        """Fuzzy index over lower-cased condition_en names (search-bar suggestions)."""
+        index = self._fuzzy.get("suggest")
+        if index is None:
+            index = FuzzyIndex(name.lower() for name in self.names())
+            self._fuzzy["suggest"] = index
+        return index
+
+    def get(self, condition_en: str) -> Optional[ConditionRecord]:
+        return self.by_name.get(condition_en)
+
+    def lookup(self, name: str) -> Optional[ConditionRecord]:
+        """Case-insensitive get(), like GET /kb/{condition_en}."""
+        if self._lowered is None:
+            lowered: Dict[str, str] = {}
+            for condition_en in self.by_name:
+                if condition_en:
+                    lowered.setdefault(condition_en.lower(), condition_en)
+            self._lowered = lowered
+        key = self._lowered.get((name or "").lower().strip())
+        return self.by_name.get(key) if key is not None else None
+
+    def names(self) -> List[str]:
+        return [name for name in self.by_name if name]
+
+    def __len__(self) -> int:
+        return len(self.by_name)
+
+
+class KBSnapshotStore:
+    """Holds the current KBSnapshot and applies write-path changes copy-on-write.
+
+    Readers grab `get()` once per request and keep using that object. Writers
+    normalize only the changed row, build a new snapshot with version + 1 and
+    swap the reference.
+
+    Writes made by other workers or processes are picked up through the
+    kb_version row (bumped by triggers on `conditions`, db_setup migration 3):
+    get() reads it at most every `check_interval` seconds and reloads when it
+    moved. upsert()/remove() run after the writer's commit and take the
+    stamp along when it moved by exactly their own write, so only a change
+    made elsewhere costs a full reload. Without that table the store only
+    sees its own writes.
+    """
+
+    def __init__(self, session_factory: Callable, model, check_interval: float = 1.0,
+                 version_sql: str = "SELECT version FROM kb_version WHERE id = 1"):
+        self._session_factory = session_factory
+        self._model = model
+        self.check_interval = check_interval
+        self._version_sql = text(version_sql)
+        self._snapshot: Optional[KBSnapshot] = None
+        self._stamp = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _load(self, db) -> List[ConditionRecord]:
+        return [ConditionRecord.from_row(row) for row in db.query(self._model).all()]
+
+    def _read_stamp(self):
+        # Own short-lived session: never run (or roll back) anything on a request's session
+        session = self._session_factory()
+        try:
+            return session.execute(self._version_sql).scalar()
+        except Exception:
+            return None
+        finally:
+            session.close()
+
+    def _advance_stamp(self):
+        """After one of our own committed writes (caller holds the lock)."""
+        if self._stamp is None:
+            return
+        stamp = self._read_stamp()
+        if stamp == self._stamp + 1:
+            self._stamp = stamp
+
+    def _with_session(self, db, fn):
+        if db is not None:
+            return fn(db)
+        session = self._session_factory()
+        try:
+            return fn(session)
+        finally:
+            session.close()
+
+    def reload(self, db=None) -> KBSnapshot:
+        with self._lock:
+            # Stamp first: a write landing between the two reads only costs one extra reload
+            stamp = self._read_stamp()
+            records = self._with_session(db, self._load)
+            by_name = {r.condition_en: r for r in records}
+            norms = {name: _normalized_names(r) for name, r in by_name.items()}
+            version = self._snapshot.version + 1 if self._snapshot else 1
+            self._snapshot = KBSnapshot(by_name, norms, version)
+            self._stamp = stamp
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def get(self, db=None) -> KBSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.reload(db)
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            if self._read_stamp() != self._stamp:
+                return self.reload(db)
+        return snapshot
+
+    def upsert(self, row, previous_name: Optional[str] = None) -> Optional[KBSnapshot]:
+        """Apply a created/updated row after its commit. Not loaded yet => next get() loads it anyway."""
+        record = ConditionRecord.from_row(row)
+        with self._lock:
+            current = self._snapshot
+            if current is None:
+                return None
+            by_name = dict(current.by_name)
+            norms = dict(current._norms)
+            if previous_name and previous_name != record.condition_en:
+                by_name.pop(previous_name, None)
+                norms.pop(previous_name, None)
+            by_name[record.condition_en] = record
+            norms[record.condition_en] = _normalized_names(record)
+            self._snapshot = KBSnapshot(by_name, norms, current.version + 1)
+            self._advance_stamp()
+            return self._snapshot
+
+    def remove(self, condition_en: str) -> Optional[KBSnapshot]:
+        with self._lock:
+            current = self._snapshot
+            if current is None:
+                return None
+            by_name = dict(current.by_name)
+            norms = dict(current._norms)
+            by_name.pop(condition_en, None)
+            norms.pop(condition_en, None)
+            self._snapshot = KBSnapshot(by_name, norms, current.version + 1)
+            self._advance_stamp()
+            return self._snapshot
@@ -1,10 +1,19 @@
-import sqlite3
+import logging
 import os
-import difflib
+import sqlite3
+import threading
+
+from backend.fuzzy_index import index_for
 
 # 🔗 Path to your SQLite database
 db_path = os.path.join(os.path.dirname(__file__), "extend.db")
 
+# 🔹 Debug logging of keyword matching / lookups (off unless WELLBOT_KB_DEBUG=1 or configured).
+# Only the level is set here; handlers are the entry point's job (e.g. uvicorn --log-level debug).
+logger = logging.getLogger(__name__)
+if os.getenv("WELLBOT_KB_DEBUG") == "1":
+    logger.setLevel(logging.DEBUG)
+
 # 🔹 Hindi-to-English symptom mapping
 LANGUAGE_MAP = {
     "बुखार": "fever",
@@ -38,64 +47,84 @@ def extract_keyword(query_text: str, keywords: list) -> str:
     # ✅ Step 2: Exact match
     for word in keywords:
         if word in query_text:
-            print(f"✅ Exact match found: {word}")
+            logger.debug("kb keyword match=exact keyword=%r", word)
             return word
 
     # 🔍 Step 3: Fuzzy match
     query_words = query_text.split()
+    keyword_index = index_for(tuple(keywords))
     for word in query_words:
-        match = difflib.get_close_matches(word, keywords, n=1, cutoff=0.7)
+        match = keyword_index.close_matches(word, n=1, cutoff=0.7)
         if match:
-            print(f"🔍 Fuzzy match found: {match[0]}")
+            logger.debug("kb keyword match=fuzzy token=%r keyword=%r", word, match[0])
             return match[0]
 
-    print(f"⚠️ No match found. Returning raw query: {query_text}")
+    logger.debug("kb keyword match=none query=%r", query_text)
     return query_text  # fallback
 
-def query_db(table_name: str, query_text: str) -> str:
-    conn = None
-    try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+# 🗂️ Searchable column and keywords per table
+COLUMN_MAP = {
+    "symptoms": ("symptom_name", ["headache", "fever", "cough", "cold", "nausea", "pain", "fatigue", "dizziness"]),
+    "medications": ("condition", ["fever", "cold", "pain", "headache", "dizziness", "fatigue"]),
+    "first_aid": ("issue", ["burn", "cut", "sprain", "bleeding", "injury", "headache"]),
+    "wellness_tips": ("topic", ["hydration", "diet", "sleep", "stress", "anxiety", "energy", "routine", "fatigue"])
+}
 
-        # 🗂️ Define searchable columns and keywords per table
-        column_map = {
-            "symptoms": ("symptom_name", ["headache", "fever", "cough", "cold", "nausea", "pain", "fatigue", "dizziness"]),
-            "medications": ("condition", ["fever", "cold", "pain", "headache", "dizziness", "fatigue"]),
-            "first_aid": ("issue", ["burn", "cut", "sprain", "bleeding", "injury", "headache"]),
-            "wellness_tips": ("topic", ["hydration", "diet", "sleep", "stress", "anxiety", "energy", "routine", "fatigue"])
-        }
+# One SQL string per table, so sqlite3's per-connection statement cache reuses the prepared statement
+LOOKUP_SQL = {
+    table: f"SELECT * FROM {table} WHERE LOWER({column}) LIKE ?"
+    for table, (column, _) in COLUMN_MAP.items()
+}
 
-        if table_name not in column_map:
-            return "⚠️ Unknown action. No query executed."
+RESPONSE_PREFIX = {
+    "symptoms": "Symptom info",
+    "medications": "Recommended medicine",
+    "first_aid": "First aid steps",
+    "wellness_tips": "Wellness tip",
+}
 
-        column_name, keywords = column_map[table_name]
-        keyword = extract_keyword(query_text, keywords)
-        print(f"🔎 Final keyword used for DB lookup: {keyword}")
+# -----------------------
+# Per-thread read-only connections
+# -----------------------
+_local = threading.local()
 
-        # 🔍 Case-insensitive match
-        cursor.execute(
-            f"SELECT * FROM {table_name} WHERE LOWER({column_name}) LIKE ?",
-            (f"%{keyword.lower()}%",)
-        )
-        result = cursor.fetchone()
-
-        # 🧠 Return formatted response
-        if result:
-            if table_name == "symptoms":
-                return f"Symptom info: {result[1]}"
-            elif table_name == "medications":
-                return f"Recommended medicine: {result[1]}"
-            elif table_name == "first_aid":
-                return f"First aid steps: {result[1]}"
-            elif table_name == "wellness_tips":
-                return f"Wellness tip: {result[1]}"
-        else:
-            return "I didn’t quite catch that, but I’m listening. Want to try saying it another way."
 
+def _connection() -> sqlite3.Connection:
+    """This thread's read-only connection to db_path, opened on first use."""
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != db_path:
+        if conn is not None:
+            conn.close()
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, cached_statements=len(LOOKUP_SQL) * 2)
+        _local.conn, _local.path = conn, db_path
+        logger.debug("kb connection opened thread=%s path=%r", threading.current_thread().name, db_path)
+    return conn
+
+
+def _drop_connection():
+    conn = getattr(_local, "conn", None)
+    _local.conn = None
+    if conn is not None:
+        conn.close()
+
+
+def query_db(table_name: str, query_text: str) -> str:
+    if table_name not in COLUMN_MAP:
+        return "⚠️ Unknown action. No query executed."
+
+    _, keywords = COLUMN_MAP[table_name]
+    keyword = extract_keyword(query_text, keywords)
+    logger.debug("kb lookup table=%s keyword=%r", table_name, keyword)
+
+    try:
+        # 🔍 Case-insensitive match
+        result = _connection().execute(LOOKUP_SQL[table_name], (f"%{keyword.lower()}%",)).fetchone()
     except sqlite3.OperationalError as e:
+        # Reopen on the next call (file replaced, locked, missing table fixed, ...)
+        _drop_connection()
         return f"⚠️ Database error: {str(e)}"
 
-    finally:
-        if conn:
-            conn.close()
+    # 🧠 Return formatted response
+    if result:
+        return f"{RESPONSE_PREFIX[table_name]}: {result[1]}"
+    return "I didn’t quite catch that, but I’m listening. Want to try saying it another way."
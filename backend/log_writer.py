@@ -0,0 +1,196 @@
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Callable, List, Optional
+
+_STOP = object()
+
+
+class LogWriter:
+    """Write-behind logger for QueryLog / ChatLog / Message rows.
+
+    Request handlers call submit() with transient ORM objects; a background
+    thread drains the bounded queue and persists rows with one bulk insert and
+    one commit per batch, flushing when `batch_size` rows are waiting or
+    `flush_interval` seconds have passed. When the queue is full, submit()
+    blocks for at most `put_timeout` seconds (counted as backpressure) and then
+    drops the row (counted as dropped) rather than stalling the request.
+
+    Flush hooks run as hook(session, batch) after the bulk insert and before the
+    commit, so derived tables (analytics rollups) commit atomically with the rows.
+    If a batch fails, its rows are retried one per transaction so only the bad
+    rows are lost (counted as failed).
+    """
+
+    def __init__(self, session_factory: Callable, max_queue: int = 10000,
+                 batch_size: int = 200, flush_interval: float = 1.0,
+                 put_timeout: float = 0.05):
+        self._session_factory = session_factory
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._flush_hooks: List[Callable] = []
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "failed": 0,
+            "backpressure_events": 0,
+            "batches": 0,
+            "max_depth": 0,
+            "last_batch_size": 0,
+            "last_flush_ms": 0.0,
+        }
+
+    # -----------------------
+    # Producer side
+    # -----------------------
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self._thread.start()
+
+    def add_flush_hook(self, hook: Callable):
+        if hook not in self._flush_hooks:
+            self._flush_hooks.append(hook)
+
+    def submit(self, *rows) -> bool:
+        """Queue rows for persistence. Returns False if any row had to be dropped."""
+        if self._thread is None or not self._thread.is_alive():
+            self.start()
+        ok = True
+        for row in rows:
+            if hasattr(row, "timestamp") and getattr(row, "timestamp", None) is None:
+                row.timestamp = datetime.utcnow()
+            try:
+                self._queue.put_nowait(row)
+            except queue.Full:
+                self._count("backpressure_events")
+                try:
+                    self._queue.put(row, timeout=self.put_timeout)
+                except queue.Full:
+                    self._count("dropped")
+                    ok = False
+                    continue
+            depth = self._queue.qsize()
+            with self._lock:
+                self._stats["enqueued"] += 1
+                if depth > self._stats["max_depth"]:
+                    self._stats["max_depth"] = depth
+        return ok
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until everything queued so far has been written (or timeout)."""
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self, timeout: float = 5.0):
+        """Drain the queue and stop the writer thread (app shutdown / atexit)."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        return dict(stats, depth=self._queue.qsize(), capacity=self._queue.maxsize,
+                    running=bool(self._thread and self._thread.is_alive()))
+
+    # -----------------------
+    # Writer thread
+    # -----------------------
+    def _run(self):
+        stopping = False
+        while not stopping:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            taken = 1
+            batch = []
+            if first is _STOP:
+                stopping = True
+            else:
+                batch.append(first)
+            deadline = time.monotonic() + self.flush_interval
+            while not stopping and len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    row = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                taken += 1
+                if row is _STOP:
+                    stopping = True
+                else:
+                    batch.append(row)
+            if stopping:
+                # Shutdown: take whatever is still queued
+                while True:
+                    try:
+                        row = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    taken += 1
+                    if row is not _STOP:
+                        batch.append(row)
+            if batch:
+                self._write(batch)
+            for _ in range(taken):
+                self._queue.task_done()
+
+    def _count(self, key: str, n: int = 1):
+        # Producers (request threads) and the writer thread both update the stats
+        with self._lock:
+            self._stats[key] += n
+
+    def _commit(self, rows: list):
+        db = self._session_factory()
+        try:
+            db.bulk_save_objects(rows)
+            for hook in self._flush_hooks:
+                hook(db, rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _write(self, batch: list):
+        started = time.perf_counter()
+        written = failed = 0
+        try:
+            self._commit(batch)
+            written = len(batch)
+        except Exception as e:
+            print(f"⚠️ Batch of {len(batch)} log rows failed ({e}), retrying row by row")
+            # One bad row must not cost the rest of the batch
+            for row in batch:
+                try:
+                    self._commit([row])
+                    written += 1
+                except Exception as row_error:
+                    failed += 1
+                    print(f"❌ Failed to write log row {type(row).__name__}: {row_error}")
+        with self._lock:
+            self._stats["written"] += written
+            self._stats["failed"] += failed
+            self._stats["batches"] += 1
+            self._stats["last_batch_size"] = len(batch)
+            self._stats["last_flush_ms"] = round((time.perf_counter() - started) * 1000, 2)
@@ -1,20 +1,30 @@
 
 from fastapi import FastAPI, Depends, HTTPException, status, Header, Request, Query, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse, JSONResponse, Response
 from fastapi.security import HTTPBearer
 from fastapi.openapi.utils import get_openapi
 from pydantic import BaseModel
 from typing import Optional, List, Dict
-from sqlalchemy import create_engine, Column, String, Integer, Float, Text, DateTime, func, desc, ForeignKey, text
+from sqlalchemy import create_engine, Column, String, Integer, Float, Text, DateTime, func, desc, ForeignKey, text, case
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from datetime import datetime, timedelta
-import os, json, re, unicodedata, io, csv
-from difflib import get_close_matches,SequenceMatcher
+import os, json, re, unicodedata, io, csv, atexit, hashlib
+from difflib import SequenceMatcher
 from jose import JWTError, jwt
 from collections import Counter
 from passlib.context import CryptContext
+from backend.alias_registry import AliasRegistry, AliasSnapshot
+from backend.auth_cache import ClaimsCache, UserCache
+from backend.db_setup import create_sqlite_engine, run_migrations
+from backend.kb_snapshot import KBSnapshot, KBSnapshotStore
+from backend.log_writer import LogWriter
+from backend.password_hasher import PasswordHasher, PasswordHasherBusy
+from backend.rollups import update_rollups
+from backend.text_utils import normalize_text
+from backend.translation_service import TranslationCache, TranslationService, engines_from_env, lang_code, load_curated
+from backend.ui_catalog import UICatalog
 
 # --- Password hashing setup ---
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -39,19 +49,23 @@ def deduplicate_conditions(conditions: list[str], threshold: float = 0.8) -> lis
 # -----------------------
 # Alias Map Loader
 # -----------------------
+ALIAS_PATH = os.path.join("data_structured", "condition_aliases.json")
+
 def load_condition_aliases() -> dict:
-    alias_path = os.path.join("data_structured", "condition_aliases.json")
-    if not os.path.exists(alias_path):
-        return {}
-    with open(alias_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return alias_registry.get().aliases
 
 
 # -----------------------
 # SQLAlchemy setup
 # -----------------------
 DATABASE_URL = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'wellness.db')}"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# 🔹 No cap on overflow connections (extra ones are closed when returned). A request holds its
+# get_db connection across threadpool hops (dependencies, endpoint, teardown), so with a cap
+# below the number of in-flight requests every pool thread can end up blocked in checkout
+# while the connection holders wait for a thread.
+DB_POOL_SIZE = int(os.getenv("WELLBOT_DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("WELLBOT_DB_MAX_OVERFLOW", "-1"))
+engine = create_sqlite_engine(DATABASE_URL, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 Base = declarative_base()
 
@@ -122,6 +136,22 @@ class QueryLog(Base):
     language = Column(String)
     email = Column(String, nullable=True)  
 
+class QueryRollup(Base):
+    """Query counts per UTC day/hour x intent x language x matched (see backend/rollups.py)."""
+    __tablename__ = "query_rollups"
+    day = Column(String, primary_key=True)          # YYYY-MM-DD, '' for rows without timestamp
+    hour = Column(Integer, primary_key=True, autoincrement=False)
+    intent = Column(String, primary_key=True)
+    language = Column(String, primary_key=True)
+    matched = Column(Integer, primary_key=True, autoincrement=False)  # 1 = matched a condition
+    count = Column(Integer, nullable=False, default=0)
+
+class UnknownQueryCount(Base):
+    __tablename__ = "unknown_query_counts"
+    query_text = Column(Text, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    last_seen = Column(DateTime)
+
 class ChatLog(Base):
     __tablename__ = "chat_logs"
     id = Column(Integer, primary_key=True, index=True)
@@ -182,6 +212,17 @@ class KBEntry(Base):
 
 
 Base.metadata.create_all(bind=engine)
+run_migrations(engine)
+
+# Write-behind logger: request paths queue QueryLog/ChatLog/Message rows, a background
+# thread bulk-inserts them. Drained on app shutdown and at interpreter exit (Rasa actions).
+log_writer = LogWriter(SessionLocal)
+atexit.register(log_writer.stop)
+
+def _rollup_query_logs(db, rows):
+    update_rollups(db, [row for row in rows if isinstance(row, QueryLog)])
+
+log_writer.add_flush_hook(_rollup_query_logs)
 
 # -----------------------
 # Security helpers
@@ -190,13 +231,20 @@ SECRET_KEY = os.environ.get("WELLBOT_SECRET_KEY", "replace_this_with_a_strong_se
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt runs in a small process pool with a bounded wait queue, so a login/register burst
+# cannot occupy every request thread; overflow gets a 503 instead of stalling /respond.
+# Cost: WELLBOT_BCRYPT_ROUNDS (measure with `python -m backend.password_hasher --calibrate`).
+password_hasher = PasswordHasher(
+    max_workers=int(os.getenv("WELLBOT_HASH_WORKERS", "0")) or None,
+    max_queue=int(os.getenv("WELLBOT_HASH_QUEUE", "16")),
+)
+atexit.register(password_hasher.shutdown)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
 def verify_password(password: str, hashed: str) -> bool:
-    return pwd_context.verify(password, hashed)
+    return password_hasher.verify(password, hashed)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
@@ -204,6 +252,40 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
+# 🔹 Each token is verified by jose once and then served from the LRU until its exp
+claims_cache = ClaimsCache(maxsize=1024)
+
+def verify_token(token: str) -> dict:
+    """Claims of a valid token (cached); raises JWTError like jwt.decode."""
+    claims = claims_cache.get(token)
+    if claims is None:
+        claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        claims_cache.put(token, claims)
+    return claims
+
+def _bearer_token(authorization: Optional[str]) -> Optional[str]:
+    if not authorization:
+        return None
+    parts = authorization.strip().split()
+    if len(parts) == 2 and parts[0].lower() == "bearer":
+        return parts[1]
+    return None
+
+def request_claims(request: Optional[Request], authorization: Optional[str] = None) -> Optional[dict]:
+    """Claims jwt_middleware verified for this request (None if no/invalid token).
+
+    Falls back to verifying `authorization` when the middleware did not run.
+    """
+    if request is not None and hasattr(request.state, "claims"):
+        return request.state.claims
+    token = _bearer_token(authorization)
+    if token is None:
+        return None
+    try:
+        return verify_token(token)
+    except JWTError:
+        return None
+
 # --- JWT Token Verification ---
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
@@ -211,7 +293,7 @@ security = HTTPBearer()
 
 def get_current_admin(token: HTTPAuthorizationCredentials = Depends(security)):
     try:
-        payload = jwt.decode(token.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = verify_token(token.credentials)
         username = payload.get("sub")
         if username is None:
             raise HTTPException(status_code=401, detail="Invalid token")
@@ -230,6 +312,10 @@ app.add_middleware(
     allow_methods=["*"], allow_headers=["*"]
 )
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"})
+
 security_scheme = HTTPBearer()
 
 def custom_openapi():
@@ -263,14 +349,34 @@ def get_db():
 def get_user(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
 
+# 🔹 get_current_user serves detached User snapshots for a few seconds instead of a SELECT per request
+user_cache = UserCache(ttl=float(os.getenv("WELLBOT_USER_CACHE_TTL", "30")))
+
+def get_cached_user(db: Session, email: str) -> Optional[User]:
+    def load():
+        user = get_user(db, email)
+        if user is not None:
+            db.expunge(user)
+        return user
+    return user_cache.get(email, load)
+
 def authenticate_user(db: Session, email: str, password: str):
     user = get_user(db, email)
     if not user:
         return False
-    # First try normal bcrypt verification
+    # First try normal bcrypt verification (re-hashed if stored with a lower cost than BCRYPT_ROUNDS)
     try:
-        if verify_password(password, user.hashed_password):
+        verified, new_hash = password_hasher.verify_and_update(password, user.hashed_password)
+        if verified:
+            if new_hash:
+                try:
+                    user.hashed_password = new_hash
+                    db.commit()
+                except Exception:
+                    db.rollback()
             return user
+    except PasswordHasherBusy:
+        raise
     except Exception:
         # If the stored hash is malformed we will attempt legacy fallback below
         pass
@@ -289,19 +395,14 @@ def authenticate_user(db: Session, email: str, password: str):
                 return user 
     return False
 
-def get_current_user(authorization: str = Header(...), db: Session = Depends(get_db)) -> User:
+def get_current_user(request: Request, authorization: str = Header(...), db: Session = Depends(get_db)) -> User:
+    """Read-only (detached) User for the request's token; re-load it before modifying."""
     credentials_exception = HTTPException(status_code=401, detail="Invalid credentials")
-    if not authorization.startswith("Bearer "):
+    claims = request_claims(request, authorization)
+    email = claims.get("sub") if claims else None
+    if email is None:
         raise credentials_exception
-    token = authorization.split("Bearer ")[1]
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    user = get_user(db, email)
+    user = get_cached_user(db, email)
     if user is None:
         raise credentials_exception
     return user
@@ -346,6 +447,9 @@ class ForgotPasswordRequest(BaseModel):
 class QueryRequest(BaseModel):
     text: str
 
+class BatchQueryRequest(BaseModel):
+    texts: List[str]
+
 class ChatLogCreate(BaseModel):
     user_id: str
     role: str  # "user" or "admin"
@@ -479,6 +583,7 @@ def update_profile(request: UpdateProfileRequest, db: Session = Depends(get_db),
         user.hashed_password = get_password_hash(request.password)
 
     db.commit()
+    user_cache.invalidate(user.email)
     return {"msg": "Profile updated successfully"}
 
 @app.put("/forgot-password")
@@ -496,11 +601,12 @@ def change_password(payload: ChangePasswordRequest, db: Session = Depends(get_db
     user = get_user(db, current_user.email)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    if not verify_password(payload.current_password, user.hashed_password):
-        raise HTTPException(status_code=400, detail="Current password incorrect")
     if len(payload.new_password) < 6:
         raise HTTPException(status_code=400, detail="New password too short")
-    if verify_password(payload.new_password, user.hashed_password):
+    if not verify_password(payload.current_password, user.hashed_password):
+        raise HTTPException(status_code=400, detail="Current password incorrect")
+    # current_password just verified against the stored hash, so compare the plaintexts (no 2nd bcrypt)
+    if payload.new_password == payload.current_password:
         raise HTTPException(status_code=400, detail="New password must differ from current password")
     user.hashed_password = get_password_hash(payload.new_password)
     db.commit()
@@ -558,6 +664,11 @@ class RespondResponse(BaseModel):
     intent: List[str]
     confidence_scores: Dict[str, float]
 
+class TranslateBatchRequest(BaseModel):
+    texts: List[str]
+    lang: str = "Hindi"
+    persist: bool = True  # False for user content: translated in memory only, never written to the cache file
+
 # -----------------------
 # DialogueManager Integration
 # -----------------------
@@ -565,9 +676,10 @@ from backend.dialogue_manager import DialogueManager
 dialogue_manager = DialogueManager()
 
 @app.post("/respond", response_model=RespondResponse)
-def respond(request: RespondRequest, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+def respond(request: RespondRequest, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     try:
-        result = dialogue_manager.generate_response(request.text)
+        # Same session as get_current_user (FastAPI caches get_db per request)
+        result = dialogue_manager.generate_response(request.text, db=db)
 
         # Store chat history in ChatLog
         chat_entry = ChatLog(
@@ -578,7 +690,6 @@ def respond(request: RespondRequest, db: Session = Depends(get_db), current_user
             feedback=None,
             timestamp=datetime.utcnow()
         )
-        db.add(chat_entry)
 
         # Log query
         log = QueryLog(
@@ -590,7 +701,6 @@ def respond(request: RespondRequest, db: Session = Depends(get_db), current_user
             language=result.get("language", "English"),
             email=current_user.email
         )
-        db.add(log)
 
         # Log message
         message = Message(
@@ -600,31 +710,38 @@ def respond(request: RespondRequest, db: Session = Depends(get_db), current_user
             intent=result["intent"],
             timestamp=datetime.utcnow()
         )
-        db.add(message)
+        log_writer.submit(chat_entry, log, message)
         return RespondResponse(
             response=result["response"],
             intent=[result["intent"]],
             confidence_scores={result["intent"]: 1.0}
         )
     except Exception as e:
-        db.rollback()
         return RespondResponse(
             response=f"⚠️ Internal error: {str(e)}",
             intent=["error"],
             confidence_scores={"error": 0.0}
         )
-    finally:
-        db.close()
 
 @app.middleware("http")
 async def jwt_middleware(request: Request, call_next):
     """Auth strategy:
     - Public: GET /kb*, /kb/search, /kb/categories, /kb/respond, /analytics/top-intents
-    - Protected: any non-GET under /kb (create/update/delete), all /analytics except top-intents, all /chat
+    - Protected: any non-GET under /kb (create/update/delete, /kb/respond/batch), all /analytics except top-intents, all /chat
     """
     path = request.url.path
     method = request.method.upper()
 
+    # ✅ Verify any bearer token once; handlers and dependencies read request.state.claims
+    auth = request.headers.get("Authorization")
+    token = _bearer_token(auth)
+    request.state.claims = None
+    if token is not None:
+        try:
+            request.state.claims = verify_token(token)
+        except JWTError:
+            pass
+
     # Always public explicit endpoints
     if path in ("/kb/respond", "/kb/search", "/kb/categories", "/analytics/top-intents"):
         return await call_next(request)
@@ -636,13 +753,9 @@ async def jwt_middleware(request: Request, call_next):
     # Protect mutating /kb operations & broader secure prefixes
     protected_prefixes = ["/kb", "/analytics", "/chat"]
     if any(path.startswith(p) for p in protected_prefixes):
-        auth = request.headers.get("Authorization")
         if not auth or not auth.startswith("Bearer "):
             return JSONResponse(status_code=401, content={"detail": "Missing or invalid token"})
-        token = auth.split(" ")[1]
-        try:
-            jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        except JWTError:
+        if request.state.claims is None:
             return JSONResponse(status_code=401, content={"detail": "Token verification failed"})
     return await call_next(request)
 
@@ -650,12 +763,7 @@ async def jwt_middleware(request: Request, call_next):
 # ------------------------------------------
 # Fuzzy Matching and Respond Route
 # -------------------------------------------
-# Normalize text for fuzzy matching
-def normalize_text(text: str) -> str:
-    return unicodedata.normalize("NFKC", re.sub(r"[^\w\s\u0900-\u097F]", "", text.strip().lower()))
-
 # Fuzzy match against condition names
-_ALIAS_CACHE: dict | None = None
 _KB_LIST_CACHE: list[dict] | None = None
 _KB_LIST_CACHE_TS: float | None = None
 _KB_CATEGORIES_CACHE: list[dict] | None = None
@@ -671,52 +779,50 @@ EXTRA_ALIAS_OVERRIDES: dict[str, str | None] = {
     
 }
 
+# Shared alias registry (KB respond path, resolve_via_alias and the Rasa action server).
+# Parsed once, reloaded when the file's mtime changes or an admin triggers it.
+alias_registry = AliasRegistry(ALIAS_PATH, normalize_text, EXTRA_ALIAS_OVERRIDES)
+
+# In-process, read-only snapshot of the conditions table; kept current by the /kb write paths
+kb_store = KBSnapshotStore(SessionLocal, ConditionInfo)
+
+@app.on_event("startup")
+def warm_alias_registry():
+    alias_registry.reload()
+    kb_store.reload()
+    log_writer.start()
+
+@app.on_event("shutdown")
+def drain_log_writer():
+    log_writer.stop()
+
 def load_alias_cache():
-    global _ALIAS_CACHE
-    if _ALIAS_CACHE is None:
-        try:
-            _ALIAS_CACHE = load_condition_aliases()
-        except Exception:
-            _ALIAS_CACHE = {}
-    return _ALIAS_CACHE
+    return alias_registry.get().aliases
 
 def resolve_via_alias(raw: str) -> str | None:
-    aliases = load_alias_cache()
-    q = normalize_text(raw)
-    for pseudo, canonical in EXTRA_ALIAS_OVERRIDES.items():
-        if normalize_text(pseudo) == q:
-            return canonical
-    for canonical, lang_map in aliases.items():
-        for arr in lang_map.values():
-            for term in arr:
-                if normalize_text(term) == q:
-                    return canonical
-    return None
+    return alias_registry.get().resolve(raw)
 
-def fuzzy_lookup(condition: str, lang: str, db: Session) -> str:
-    resolved = resolve_via_alias(condition)
+def fuzzy_lookup(condition: str, lang: str, db: Session,
+                 snapshot: KBSnapshot | None = None, aliases: AliasSnapshot | None = None) -> str:
+    aliases = aliases or alias_registry.get()
+    resolved = aliases.resolve(condition)
     if resolved:
         return resolved
     normalized_condition = normalize_text(condition)
-    all_conditions = db.query(ConditionInfo).all()
-    candidates = [
-        normalize_text(getattr(entry, f"condition_{lang}"))
-        for entry in all_conditions
-        if getattr(entry, f"condition_{lang}")
-    ]
-    matches = get_close_matches(normalized_condition, candidates, n=1, cutoff=0.7)
-    if not matches:
-        return None
-    for entry in all_conditions:
-        if normalize_text(getattr(entry, f"condition_{lang}")) == matches[0]:
-            return entry.condition_en
-    return None
+    snapshot = snapshot or kb_store.get(db)
+    matches = snapshot.fuzzy_index(lang).close_matches(normalized_condition, n=1, cutoff=0.7)
+    if matches:
+        for normalized, condition_en in snapshot.normalized.get(lang, []):
+            if normalized == matches[0]:
+                return condition_en
+    # Typos of an alias rather than of the condition name ("diarhea", "सिरदद")
+    return aliases.resolve_fuzzy(normalized_condition, cutoff=0.7)
 
 # Suggest similar conditions
-def get_condition_suggestions(query: str, db: Session) -> list:
-    all_conditions = db.query(ConditionInfo).all()
-    candidates = [entry.condition_en for entry in all_conditions if entry.condition_en]
-    matches = get_close_matches(query.lower(), [c.lower() for c in candidates], n=3, cutoff=0.6)
+def get_condition_suggestions(query: str, db: Session, snapshot: KBSnapshot | None = None) -> list:
+    snapshot = snapshot or kb_store.get(db)
+    candidates = snapshot.names()
+    matches = snapshot.suggestion_index().close_matches(query.lower(), n=3, cutoff=0.6)
     suggestions = [c for c in candidates if c.lower() in matches]
     return suggestions
 
@@ -724,7 +830,7 @@ def get_condition_suggestions(query: str, db: Session) -> list:
 # Core KB processing helper (reusable by API & internal callers)
 # -------------------------------------------------------------
 def kb_process_query(raw_text: str, db: Session, user_email: str | None = None) -> dict:
-    """Process a KB query and return structured response.
+    """Process a KB query, log it to query_logs and return structured response.
 
     Returns one of two shapes:
     1. Fallback:
@@ -740,6 +846,22 @@ def kb_process_query(raw_text: str, db: Session, user_email: str | None = None)
          "language": "en" | "hi"
        }
     """
+    response, qlog = resolve_kb_query(raw_text, db, user_email=user_email)
+    if qlog is not None:
+        log_writer.submit(qlog)
+    return response
+
+def resolve_kb_query(raw_text: str, db: Session, user_email: str | None = None,
+                     snapshot: KBSnapshot | None = None,
+                     aliases: AliasSnapshot | None = None) -> tuple[dict, QueryLog | None]:
+    """Resolve a KB query without writing anything.
+
+    Returns (response, query_log_row); the row is None for empty input and
+    small-talk replies. Pass `snapshot`/`aliases` to resolve many queries
+    against one consistent view of the KB (see /kb/respond/batch).
+    """
+    snapshot = snapshot or kb_store.get(db)
+    aliases = aliases or alias_registry.get()
     text = (raw_text or "").strip()
     if not text:
         return {
@@ -748,9 +870,8 @@ def kb_process_query(raw_text: str, db: Session, user_email: str | None = None)
                 "en": "Please enter a wellness question or symptom.",
                 "hi": "कृपया कोई स्वास्थ्य प्रश्न या लक्षण दर्ज करें।"
             }
-        }
+        }, None
     lang = "hi" if any("\u0900" <= c <= "\u097F" for c in text) else "en"
-    aliases = load_condition_aliases()
     matched_conditions: set[str] = set()
     normalized_text = normalize_text(text)
 
@@ -782,7 +903,7 @@ def kb_process_query(raw_text: str, db: Session, user_email: str | None = None)
         }
     }
     if normalized_text in basic_intents:
-        return {"fallback": True, "message": basic_intents[normalized_text]}
+        return {"fallback": True, "message": basic_intents[normalized_text]}, None
 
     # Token splitting for multi-topic queries (very lightweight)
     split_keywords = ["और", "या", "के लिए", "कैसे", "क्या"]
@@ -790,38 +911,29 @@ def kb_process_query(raw_text: str, db: Session, user_email: str | None = None)
     for keyword in split_keywords:
         tokens = [subtoken.strip() for token in tokens for subtoken in token.split(keyword)]
 
-    for token in tokens:
-        for canonical, lang_map in aliases.items():
-            for alias in lang_map.get(lang, []):
-                if normalize_text(alias) in token:
-                    matched_conditions.add(canonical)
+    matched_conditions.update(aliases.matcher.match_tokens(tokens, lang))
 
     # Fallback fuzzy if no alias match
     if not matched_conditions:
-        fallback = fuzzy_lookup(normalized_text, lang, db)
+        fallback = fuzzy_lookup(normalized_text, lang, db, snapshot=snapshot, aliases=aliases)
         if fallback:
             matched_conditions.add(fallback)
 
     # Still no match => suggestions
     if not matched_conditions:
-        suggestions = get_condition_suggestions(normalized_text, db)
+        suggestions = get_condition_suggestions(normalized_text, db, snapshot=snapshot)
         # Log unknown query
-        try:
-            fallback_en = "I couldn't find wellness information for that. Try asking about a symptom, condition, or first aid topic."
-            fallback_hi = "मुझे उस विषय पर सेहत संबंधी जानकारी नहीं मिली। कृपया किसी लक्षण, शिकायत या प्राथमिक उपचार के बारे में पूछें।"
-            qlog_unknown = QueryLog(
-                query_text=text,
-                bot_response=(fallback_en if lang == "en" else fallback_hi)[:500],
-                matched_condition=None,
-                intent="unknown",
-                entities="",
-                language="Hindi" if lang == "hi" else "English",
-                email=user_email
-            )
-            db.add(qlog_unknown)
-            db.commit()
-        except Exception:
-            db.rollback()
+        fallback_en = "I couldn't find wellness information for that. Try asking about a symptom, condition, or first aid topic."
+        fallback_hi = "मुझे उस विषय पर सेहत संबंधी जानकारी नहीं मिली। कृपया किसी लक्षण, शिकायत या प्राथमिक उपचार के बारे में पूछें।"
+        qlog_unknown = QueryLog(
+            query_text=text,
+            bot_response=(fallback_en if lang == "en" else fallback_hi)[:500],
+            matched_condition=None,
+            intent="unknown",
+            entities="",
+            language="Hindi" if lang == "hi" else "English",
+            email=user_email
+        )
         return {
             "fallback": True,
             "message": {
@@ -830,7 +942,7 @@ def kb_process_query(raw_text: str, db: Session, user_email: str | None = None)
             },
             "suggestions": suggestions,
             "language": lang
-        }
+        }, qlog_unknown
 
     # Aggregate response across matched conditions
     response: dict = {
@@ -843,7 +955,7 @@ def kb_process_query(raw_text: str, db: Session, user_email: str | None = None)
         "language": lang
     }
     for condition in matched_conditions:
-        entry = db.query(ConditionInfo).filter(ConditionInfo.condition_en == condition).first()
+        entry = snapshot.get(condition)
         if entry:
             response["conditions"].append({"en": entry.condition_en, "hi": entry.condition_hi})
             response["description"]["en"] += (entry.description_en or "") + "\n"
@@ -858,28 +970,23 @@ def kb_process_query(raw_text: str, db: Session, user_email: str | None = None)
             response["disclaimer"]["hi"] = entry.disclaimer_hi or response["disclaimer"]["hi"]
 
     # Log successful lookup
-    try:
-        intent_category = None
-        if response["conditions"]:
-            first_condition = response["conditions"][0]["en"]
-            entry = db.query(ConditionInfo).filter(ConditionInfo.condition_en == first_condition).first()
-            if entry:
-                intent_category = entry.intent_category
-        entities = ", ".join([c["en"] for c in response["conditions"]]) if response["conditions"] else ""
-        qlog = QueryLog(
-            query_text=text,
-            bot_response=(response["description"]["en"] or response["description"]["hi"]).strip()[:500],
-            matched_condition=entities if entities else None,
-            intent=intent_category if intent_category else "kb_lookup",
-            entities=entities,
-            language="Hindi" if lang == "hi" else "English",
-            email=user_email
-        )
-        db.add(qlog)
-        db.commit()
-    except Exception:
-        db.rollback()
-    return response
+    intent_category = None
+    if response["conditions"]:
+        first_condition = response["conditions"][0]["en"]
+        entry = snapshot.get(first_condition)
+        if entry:
+            intent_category = entry.intent_category
+    entities = ", ".join([c["en"] for c in response["conditions"]]) if response["conditions"] else ""
+    qlog = QueryLog(
+        query_text=text,
+        bot_response=(response["description"]["en"] or response["description"]["hi"]).strip()[:500],
+        matched_condition=entities if entities else None,
+        intent=intent_category if intent_category else "kb_lookup",
+        entities=entities,
+        language="Hindi" if lang == "hi" else "English",
+        email=user_email
+    )
+    return response, qlog
 
 # GET: Suggestions for search bar
 @app.get("/kb/search")
@@ -892,23 +999,84 @@ def search_kb(q: str):
 """Knowledge Base respond endpoint (public; optional auth for email capture)."""
 # POST: Respond to KB query
 @app.post("/kb/respond")
-def respond_kb(req: QueryRequest, authorization: str = Header(None)):
+def respond_kb(req: QueryRequest, request: Request, authorization: str = Header(None)):
     db: Session = SessionLocal()
-    user_email = None
-    if authorization:
-        parts = authorization.strip().split()
-        if len(parts) == 2 and parts[0].lower() == "bearer":
-            token = parts[1]
-            try:
-                payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-                user_email = payload.get("sub")
-            except Exception as e:
-                print(f"[KB_RESPOND] JWT decode failed: {e}")
+    user_email = _email_from_authorization(request, authorization)
     try:
         return kb_process_query(req.text, db, user_email=user_email)
     finally:
         db.close()
 
+def _email_from_authorization(request: Request | None, authorization: str | None) -> str | None:
+    claims = request_claims(request, authorization)
+    return claims.get("sub") if claims else None
+
+# -----------------------
+# UI translation (curated strings -> persistent cache -> offline/online engines in the background)
+# -----------------------
+translation_service = TranslationService(TranslationCache(), load_curated(), engines_from_env())
+ui_catalog = UICatalog.load()
+
+MAX_TRANSLATE_BATCH = 1000
+
+# POST: Translate a page's UI strings in one call; never waits on a model or the network
+@app.post("/translate/batch")
+def translate_batch(req: TranslateBatchRequest, request: Request, authorization: str = Header(None)):
+    """`translations` keeps input order; null means not translated yet (show the source text, ask again later).
+
+    Without a valid token only catalog/curated UI strings are translated; other texts come back null
+    and are not queued, so anonymous callers cannot fill the cache or spend engine time.
+    """
+    if lang_code(req.lang) is None:
+        raise HTTPException(status_code=400, detail=f"Unsupported language: {req.lang}")
+    if len(req.texts) > MAX_TRANSLATE_BATCH:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_TRANSLATE_BATCH} texts per batch")
+    if request_claims(request, authorization) is None:
+        allowed = [t if t in ui_catalog or translation_service.is_curated(t, req.lang) else None for t in req.texts]
+        translations = translation_service.translate_many(allowed, req.lang)
+    else:
+        translations = translation_service.translate_many(req.texts, req.lang, persist=req.persist)
+    return {"lang": lang_code(req.lang), "translations": translations,
+            "pending": sum(1 for t in translations if t is None)}
+
+MAX_KB_BATCH = 2000
+
+# POST: Resolve many KB queries (log replay / offline evaluation)
+@app.post("/kb/respond/batch")
+def respond_kb_batch(req: BatchQueryRequest, request: Request, authorization: str = Header(None)):
+    """Resolve `texts` against one KB snapshot and one session; results keep input order.
+
+    All query-log rows (and their rollup counts) are written with a single bulk insert and commit.
+    """
+    if len(req.texts) > MAX_KB_BATCH:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_KB_BATCH} texts per batch")
+    db: Session = SessionLocal()
+    user_email = _email_from_authorization(request, authorization)
+    try:
+        snapshot = kb_store.get(db)
+        aliases = alias_registry.get()
+        results, logs = [], []
+        for text in req.texts:
+            response, qlog = resolve_kb_query(text, db, user_email=user_email, snapshot=snapshot, aliases=aliases)
+            results.append(response)
+            if qlog is not None:
+                qlog.timestamp = datetime.utcnow()
+                logs.append(qlog)
+        logged = 0
+        if logs:
+            try:
+                db.bulk_save_objects(logs)
+                update_rollups(db, logs)
+                db.commit()
+                logged = len(logs)
+            except Exception as e:
+                # Results are still valid; only the logging write was rolled back, so report 0 logged
+                db.rollback()
+                print(f"❌ /kb/respond/batch: failed to write {len(logs)} query logs: {e}")
+        return {"results": results, "logged": logged, "kb_version": snapshot.version}
+    finally:
+        db.close()
+
 # GET all conditions
 @app.get("/kb", response_model=List[ConditionInfoSchema])
 def get_all_conditions(db: Session = Depends(get_db)):
@@ -1004,11 +1172,13 @@ def create_condition(condition: ConditionInfoSchema, db: Session = Depends(get_d
     db.add(new_entry)
     db.commit()
     db.refresh(new_entry)
+    kb_store.upsert(new_entry)
     # Invalidate KB caches
     _KB_LIST_CACHE = None
     _KB_LIST_CACHE_TS = None
     _KB_CATEGORIES_CACHE = None
     _KB_CATEGORIES_TS = None
+    alias_registry.reload()
     return new_entry
 
 # PUT update condition
@@ -1022,11 +1192,13 @@ def update_condition(condition_en: str, update: ConditionInfoSchema, db: Session
         setattr(condition, key, value)
     db.commit()
     db.refresh(condition)
+    kb_store.upsert(condition, previous_name=condition_en)
     # Invalidate KB caches
     _KB_LIST_CACHE = None
     _KB_LIST_CACHE_TS = None
     _KB_CATEGORIES_CACHE = None
     _KB_CATEGORIES_TS = None
+    alias_registry.reload()
     return condition
 
 # DELETE condition
@@ -1038,18 +1210,20 @@ def delete_condition(condition_en: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Condition not found")
     db.delete(condition)
     db.commit()
+    kb_store.remove(condition_en)
     # Invalidate KB caches
     _KB_LIST_CACHE = None
     _KB_LIST_CACHE_TS = None
     _KB_CATEGORIES_CACHE = None
     _KB_CATEGORIES_TS = None
+    alias_registry.reload()
     return {"message": f"Condition '{condition_en}' deleted successfully"}
 
 @app.get("/analytics/daily")
 def get_daily_query_count(db: Session = Depends(get_db)):
-    today = datetime.utcnow().date()
-    count = db.query(QueryLog).filter(QueryLog.timestamp >= today).count()
-    return {"count": count}
+    today = datetime.utcnow().date().isoformat()
+    count = db.query(func.sum(QueryRollup.count)).filter(QueryRollup.day >= today).scalar()
+    return {"count": count or 0}
 
 @app.get("/analytics/unmatched")
 def get_unmatched_queries(db: Session = Depends(get_db)):
@@ -1108,12 +1282,12 @@ def query_trends(
     end_date = datetime.utcnow().date()
     start_date = end_date - timedelta(days=days - 1)
 
-    # Fetch counts grouped by date within window
+    # Fetch counts grouped by date within window (from the hourly rollups)
     rows = (
-        db.query(func.date(QueryLog.timestamp).label("day"), func.count().label("count"))
-        .filter(func.date(QueryLog.timestamp) >= start_date)
-        .filter(func.date(QueryLog.timestamp) <= end_date)
-        .group_by(func.date(QueryLog.timestamp))
+        db.query(QueryRollup.day.label("day"), func.sum(QueryRollup.count).label("count"))
+        .filter(QueryRollup.day >= start_date.isoformat())
+        .filter(QueryRollup.day <= end_date.isoformat())
+        .group_by(QueryRollup.day)
         .all()
     )
     counts = {str(r.day): r.count for r in rows}
@@ -1176,6 +1350,8 @@ def restore_kb(db: Session = Depends(get_db)):
         clean_data = {k: v for k, v in item.__dict__.items() if k != "_sa_instance_state"}
         db.merge(ConditionInfo(**clean_data))
     db.commit()
+    kb_store.reload(db)
+    alias_registry.reload()
     return {"status": "restored"}
 
 @app.get("/feedback/stats")
@@ -1213,7 +1389,15 @@ def admin_login(username: str = Form(...), password: str = Form(...), db: Sessio
     # Password verification with migration for legacy plaintext (if any)
     verified = False
     try:
-        verified = verify_password(password, admin.password)
+        verified, new_hash = password_hasher.verify_and_update(password, admin.password)
+        if verified and new_hash:
+            try:
+                admin.password = new_hash
+                db.commit()
+            except Exception:
+                db.rollback()
+    except PasswordHasherBusy:
+        raise
     except Exception:
         verified = False
     if not verified:
@@ -1402,29 +1586,88 @@ def recent_queries(limit: int = 50, db: Session = Depends(get_db)):
 
 @app.get("/analytics/intent-distribution")
 def intent_distribution(db: Session = Depends(get_db)):
-    rows = db.query(QueryLog.intent, func.count().label("count")).group_by(QueryLog.intent).order_by(desc("count")).all()
-    return [{"intent": r.intent or "unknown", "count": r.count} for r in rows]
+    rows = db.query(QueryRollup.intent, func.sum(QueryRollup.count).label("count")).group_by(QueryRollup.intent).all()
+    counts = Counter()
+    for r in rows:
+        counts[r.intent or "unknown"] += r.count
+    return [{"intent": intent, "count": count} for intent, count in counts.most_common()]
 
 @app.get("/analytics/hourly-activity")
 def hourly_activity(db: Session = Depends(get_db)):
     # Group by hour (UTC) for today
-    today = datetime.utcnow().date()
+    today = datetime.utcnow().date().isoformat()
     rows = db.query(
-        func.strftime('%H', QueryLog.timestamp).label('hour'),
-        func.count().label('count')
-    ).filter(func.date(QueryLog.timestamp) == today).group_by('hour').order_by('hour').all()
+        QueryRollup.hour.label('hour'),
+        func.sum(QueryRollup.count).label('count')
+    ).filter(QueryRollup.day == today).group_by(QueryRollup.hour).order_by(QueryRollup.hour).all()
     # Ensure all 24 hours represented
-    counts = {r.hour: r.count for r in rows}
+    counts = {f"{r.hour:02d}": r.count for r in rows}
     return [{"hour": f"{h:02d}", "count": counts.get(f"{h:02d}", 0)} for h in range(24)]
 
 @app.get("/analytics/top-unknown")
 def top_unknown(limit: int = 20, db: Session = Depends(get_db)):
     rows = db.query(
-        QueryLog.query_text,
-        func.count().label('count')
-    ).filter(QueryLog.matched_condition == None).group_by(QueryLog.query_text).order_by(desc('count')).limit(limit).all()
+        UnknownQueryCount.query_text,
+        UnknownQueryCount.count
+    ).order_by(desc(UnknownQueryCount.count)).limit(limit).all()
     return [{"query_text": r.query_text, "count": r.count} for r in rows]
 
+# --- Admin dashboard: all overview metrics in one round trip ---
+_DASHBOARD_CACHE: dict | None = None
+_DASHBOARD_TTL_SECONDS = float(os.getenv("WELLBOT_DASHBOARD_TTL", "5"))
+
+def _dashboard_metrics(db: Session) -> dict:
+    """Overview numbers from one session; query volumes come from the rollups."""
+    today = datetime.utcnow().date().isoformat()
+    fb_total, fb_up, fb_down = db.query(
+        func.count(Feedback.id),
+        func.coalesce(func.sum(case((Feedback.thumbs == "up", 1), else_=0)), 0),
+        func.coalesce(func.sum(case((Feedback.thumbs == "down", 1), else_=0)), 0),
+    ).one()
+    total_queries, unmatched_today = db.query(
+        func.coalesce(func.sum(QueryRollup.count), 0),
+        func.coalesce(func.sum(case(((QueryRollup.matched == 0) & (QueryRollup.day == today), QueryRollup.count), else_=0)), 0),
+    ).one()
+    return {
+        "total_users": db.query(func.count(User.email)).scalar() or 0,
+        "health_topics": db.query(func.count(ConditionInfo.condition_en)).scalar() or 0,
+        "feedback": {
+            "total": fb_total,
+            "positive": fb_up,
+            "negative": fb_down,
+            "positive_percent": round((fb_up / fb_total) * 100, 2) if fb_total else 0,
+            "negative_percent": round((fb_down / fb_total) * 100, 2) if fb_total else 0,
+        },
+        "total_queries": total_queries,
+        "unmatched_today": unmatched_today,
+        "unmatched_recent": get_unmatched_queries(db),
+        "kb_categories": get_category_distribution(db),
+        "intent_distribution": intent_distribution(db),
+        "hourly_activity": hourly_activity(db),
+        "query_trends": query_trends(days=7, db=db),
+    }
+
+@app.get("/admin/dashboard")
+def admin_dashboard(request: Request, db: Session = Depends(get_db), admin: str = Depends(get_current_admin)):
+    """Everything the admin overview shows, in one response (replaces ~10 sequential calls).
+
+    The body is cached for WELLBOT_DASHBOARD_TTL seconds and carries an ETag;
+    a matching If-None-Match gets 304 Not Modified.
+    """
+    import time
+    global _DASHBOARD_CACHE
+    now = time.time()
+    cached = _DASHBOARD_CACHE
+    if cached is None or (now - cached["ts"]) >= _DASHBOARD_TTL_SECONDS:
+        body = _dashboard_metrics(db)
+        digest = hashlib.sha1(json.dumps(body, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+        cached = _DASHBOARD_CACHE = {"ts": now, "etag": f'"{digest[:20]}"', "body": body}
+    headers = {"ETag": cached["etag"], "Cache-Control": "private, no-cache"}
+    if_none_match = {tag.strip().removeprefix("W/") for tag in request.headers.get("if-none-match", "").split(",")}
+    if cached["etag"] in if_none_match or "*" in if_none_match:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=cached["body"], headers=headers)
+
 # -----------------------
 # Chat History Fetch Endpoint
 # -----------------------
@@ -1442,13 +1685,11 @@ def get_chat_history(email: str, db: Session = Depends(get_db)):
         for log in logs
     ]
 @app.get("/chat/history/me")
-def get_my_chat_history(authorization: str = Header(None), db: Session = Depends(get_db)):
+def get_my_chat_history(request: Request, authorization: str = Header(None), db: Session = Depends(get_db)):
     if not authorization or not authorization.lower().startswith("bearer "):
         raise HTTPException(status_code=401, detail="Missing token")
-    token = authorization.split()[1]
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-    except Exception:
+    payload = request_claims(request, authorization)
+    if payload is None:
         raise HTTPException(status_code=401, detail="Invalid token")
     email = payload.get("sub")
     if not email:
@@ -1557,14 +1798,33 @@ def maintenance_fix_chat(db: Session = Depends(get_db), admin: str = Depends(get
         "migrated_new_rows": inserted
     }
 
+@app.get("/admin/log-writer/stats")
+def log_writer_stats(admin: str = Depends(get_current_admin)):
+    return log_writer.stats()
+
+@app.get("/admin/password-hasher/stats")
+def password_hasher_stats(admin: str = Depends(get_current_admin)):
+    return password_hasher.stats()
+
+@app.get("/admin/translations/stats")
+def translation_stats(admin: str = Depends(get_current_admin)):
+    return translation_service.stats()
+
+@app.post("/admin/aliases/reload")
+def reload_aliases(admin: str = Depends(get_current_admin)):
+    snapshot = alias_registry.reload()
+    return {
+        "status": "reloaded",
+        "conditions": len(snapshot.aliases),
+        "patterns": snapshot.matcher.pattern_count
+    }
+
 @app.delete("/chat/history/me")
-def delete_my_chat_history(authorization: str = Header(None), db: Session = Depends(get_db)):
+def delete_my_chat_history(request: Request, authorization: str = Header(None), db: Session = Depends(get_db)):
     if not authorization or not authorization.lower().startswith("bearer "):
         raise HTTPException(status_code=401, detail="Missing token")
-    token = authorization.split()[1]
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-    except Exception:
+    payload = request_claims(request, authorization)
+    if payload is None:
         raise HTTPException(status_code=401, detail="Invalid token")
     email = payload.get("sub")
     if not email:
@@ -0,0 +1,211 @@
+import argparse
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+
+# 🔹 bcrypt cost (log2 rounds). Measure on the target host: python -m backend.password_hasher --calibrate
+BCRYPT_ROUNDS = int(os.getenv("WELLBOT_BCRYPT_ROUNDS", "12"))
+
+
+def _context(rounds: int) -> CryptContext:
+    # min_rounds == rounds: hashes made with a lower cost report needs_update and are upgraded on login
+    return CryptContext(schemes=["bcrypt"], deprecated="auto",
+                        bcrypt__default_rounds=rounds, bcrypt__min_rounds=rounds)
+
+
+# -----------------------
+# Worker-side functions (run in the pool processes; keep this module import-light)
+# -----------------------
+_contexts = {}
+
+
+def _ctx(rounds: int) -> CryptContext:
+    ctx = _contexts.get(rounds)
+    if ctx is None:
+        ctx = _contexts[rounds] = _context(rounds)
+    return ctx
+
+
+def _timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def _hash(password: str, rounds: int) -> str:
+    return _ctx(rounds).hash(password)
+
+
+def _verify(password: str, hashed: str, rounds: int) -> bool:
+    return _ctx(rounds).verify(password, hashed)
+
+
+def _verify_and_update(password: str, hashed: str, rounds: int) -> Tuple[bool, Optional[str]]:
+    return _ctx(rounds).verify_and_update(password, hashed)
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Raised when every hashing slot (running + queued) is taken."""
+
+
+class PasswordHasher:
+    """bcrypt hashing/verification in a small dedicated process pool.
+
+    bcrypt is CPU-bound and would otherwise run on FastAPI's shared threadpool
+    threads, so a login burst delays chat requests. Here at most
+    `max_workers` hashes run at once (in separate processes) and at most
+    `max_queue` more callers wait for one of them. Any further caller is
+    rejected at once with PasswordHasherBusy (HTTP 503) instead of waiting,
+    so a burst holds at most max_workers + max_queue request threads. If the
+    pool cannot be started, hashing runs inline with the same bounds.
+    """
+
+    def __init__(self, rounds: int = BCRYPT_ROUNDS, max_workers: Optional[int] = None,
+                 max_queue: int = 16):
+        self.rounds = rounds
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+        self.max_queue = max_queue
+        self._slots = threading.BoundedSemaphore(self.max_workers + max_queue)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._inline = False
+        self._lock = threading.Lock()
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+            "rehashed": 0,
+            "total_bcrypt_ms": 0.0,
+            "total_wait_ms": 0.0,
+            "max_wait_ms": 0.0,
+        }
+
+    def _executor(self) -> Optional[ProcessPoolExecutor]:
+        if self._inline:
+            return None
+        with self._lock:
+            if self._pool is None:
+                try:
+                    # spawn, not fork: the server process has live threads and DB connections
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+                except (OSError, NotImplementedError) as e:
+                    print(f"⚠️ Password hashing pool unavailable, hashing inline: {e}")
+                    self._inline = True
+            return self._pool
+
+    def _run(self, fn, *args):
+        started = time.perf_counter()
+        # Never block for a slot: a waiting caller would hold a request thread just like a running one
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats["rejected"] += 1
+            raise PasswordHasherBusy("Password hashing is overloaded, please retry")
+        with self._lock:
+            self._stats["submitted"] += 1
+            self._stats["in_flight"] += 1
+            self._stats["max_in_flight"] = max(self._stats["max_in_flight"], self._stats["in_flight"])
+        try:
+            pool = self._executor()
+            if pool is None:
+                result, bcrypt_ms = _timed(fn, *args)
+            else:
+                try:
+                    result, bcrypt_ms = pool.submit(_timed, fn, *args).result()
+                except BrokenProcessPool as e:
+                    with self._lock:
+                        if not self._inline:
+                            print(f"⚠️ Password hashing pool broke, hashing inline from now on: {e}")
+                        self._inline = True
+                    result, bcrypt_ms = _timed(fn, *args)
+        except Exception:
+            with self._lock:
+                self._stats["failed"] += 1
+            raise
+        finally:
+            self._slots.release()
+            with self._lock:
+                self._stats["in_flight"] -= 1
+        wait_ms = max(0.0, (time.perf_counter() - started) * 1000 - bcrypt_ms)
+        with self._lock:
+            self._stats["completed"] += 1
+            self._stats["total_bcrypt_ms"] += bcrypt_ms
+            self._stats["total_wait_ms"] += wait_ms
+            self._stats["max_wait_ms"] = max(self._stats["max_wait_ms"], wait_ms)
+        return result
+
+    # -----------------------
+    # Public API
+    # -----------------------
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password, self.rounds)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return self._run(_verify, password, hashed, self.rounds)
+
+    def verify_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """(ok, new_hash); new_hash is set when the stored hash uses a lower cost than `rounds`."""
+        ok, new_hash = self._run(_verify_and_update, password, hashed, self.rounds)
+        if new_hash:
+            with self._lock:
+                self._stats["rehashed"] += 1
+        return ok, new_hash
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        completed = stats["completed"] or 1
+        in_flight = stats["in_flight"]
+        return dict(
+            stats,
+            rounds=self.rounds,
+            workers=self.max_workers,
+            max_queue=self.max_queue,
+            inline=self._inline,
+            queue_depth=max(0, in_flight - self.max_workers),
+            avg_bcrypt_ms=round(stats["total_bcrypt_ms"] / completed, 1),
+            avg_wait_ms=round(stats["total_wait_ms"] / completed, 1),
+        )
+
+
+# -----------------------
+# Cost calibration: python -m backend.password_hasher --calibrate [--target-ms 250]
+# -----------------------
+def calibrate(target_ms: float, rounds_range=range(10, 15), samples: int = 3):
+    print(f"{'rounds':>7}{'hash ms':>10}")
+    best = None
+    for rounds in rounds_range:
+        ctx = _context(rounds)
+        started = time.perf_counter()
+        for _ in range(samples):
+            ctx.hash("calibration-password")
+        ms = (time.perf_counter() - started) * 1000 / samples
+        print(f"{rounds:>7}{ms:>10.1f}")
+        if ms <= target_ms:
+            best = rounds
+    if best is None:
+        print(f"⚠️ Even {rounds_range.start} rounds exceed {target_ms:.0f} ms on this host")
+    else:
+        print(f"✅ WELLBOT_BCRYPT_ROUNDS={best} is the highest cost within {target_ms:.0f} ms per hash")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure bcrypt cost on this host.")
+    parser.add_argument("--calibrate", action="store_true")
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    args = parser.parse_args()
+    calibrate(args.target_ms)
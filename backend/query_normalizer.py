@@ -0,0 +1,94 @@
+import heapq
+import re
+from functools import lru_cache
+from typing import List, Mapping, Optional, Pattern, Sequence, Tuple
+
+PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+class _Stage:
+    """One map compiled for QueryNormalizer (see there)."""
+
+    def __init__(self, mapping: Mapping[str, str]):
+        self.entries: List[Tuple[str, str]] = [(raw, canonical) for raw, canonical in mapping.items() if raw]
+        self.index = {raw: i for i, (raw, _) in enumerate(self.entries)}
+        keys = [raw for raw, _ in self.entries]
+        # The scan reports non-overlapping matches, so any other key present overlaps one of them
+        self.overlapping = {key: [j for j, other in enumerate(keys) if other != key and _overlaps(key, other)]
+                            for key in keys}
+        # Later keys a replacement can form together with its neighbours (or inside itself)
+        self.creates = [[j for j in range(i + 1, len(keys)) if _overlaps(canonical, keys[j])]
+                        for i, (_, canonical) in enumerate(self.entries)]
+        alternation = "|".join(map(re.escape, sorted(keys, key=len, reverse=True)))
+        self.scan: Optional[Pattern] = re.compile(alternation) if keys else None
+
+    def apply(self, text: str) -> str:
+        if self.scan is None:
+            return text
+        found = set(self.scan.findall(text))
+        if not found:
+            return text
+        pending = {self.index[key] for key in found}
+        for key in found:
+            pending.update(self.overlapping[key])
+        heap = list(pending)
+        heapq.heapify(heap)
+        while heap:
+            i = heapq.heappop(heap)
+            raw, canonical = self.entries[i]
+            if raw in text:
+                text = text.replace(raw, canonical)
+                for j in self.creates[i]:
+                    if j not in pending:
+                        pending.add(j)
+                        heapq.heappush(heap, j)
+        return text
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """True if a and b can share characters in some alignment (one contains the other,
+    or a suffix of one is a prefix of the other)."""
+    if not a or not b or a in b or b in a:
+        return True
+    return any(a.endswith(b[:k]) or b.endswith(a[:k]) for k in range(1, min(len(a), len(b))))
+
+
+class QueryNormalizer:
+    """Fast, exact form of "lower, strip punctuation, then str.replace every map entry in order".
+
+    Each stage (e.g. LANGUAGE_MAP, SYMPTOM_CANONICAL, SYNONYM_MAP) is compiled
+    into one longest-match alternation regex; a single scan finds the keys in
+    the text, and only those entries (plus keys that overlap them, which the
+    scan can hide, and later keys a replacement could form across its edges)
+    are replayed with str.replace in map order. Texts without keys skip the
+    stage after the scan. Replaying in map order keeps the loop's results where one
+    alternation pass would differ: overlapping keys ("tip"/"pill" in
+    "tipill", "burned"/"drug" in "burnedrug") and keys formed by an earlier
+    replacement.
+
+    Results are memoized (LRU), so the repeated normalize calls made while
+    answering one query cost a dict lookup.
+    tests/test_query_normalizer.py checks it against the loop.
+    """
+
+    def __init__(self, stages: Sequence[Mapping[str, str]], cache_size: int = 4096):
+        self.stages = [dict(stage) for stage in stages]
+        self._passes = [_Stage(stage) for stage in self.stages]
+        self.normalize = lru_cache(maxsize=cache_size)(self._normalize)
+
+    def _normalize(self, text: str) -> str:
+        text = PUNCTUATION.sub("", text.lower().strip())
+        for stage in self._passes:
+            text = stage.apply(text)
+        return text
+
+    def normalize_sequential(self, text: str) -> str:
+        """The original loop of str.replace calls, kept as the reference for parity checks."""
+        text = PUNCTUATION.sub("", text.lower().strip())
+        for stage in self.stages:
+            for raw, canonical in stage.items():
+                text = text.replace(raw, canonical)
+        return text
+
+    def cache_info(self):
+        return self.normalize.cache_info()
@@ -0,0 +1,113 @@
+"""Pre-aggregated analytics over query_logs.
+
+query_rollups holds one row per (UTC day, hour, intent, language, matched)
+with a running count; unknown_query_counts holds one row per unmatched query
+text. Both are kept current by update_rollups(), which runs inside the same
+transaction that inserts the QueryLog rows (LogWriter flush hook and the
+/kb/respond/batch endpoint), and can be rebuilt from the full log with:
+
+    python -m backend.rollups --backfill
+"""
+import argparse
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, List
+
+from sqlalchemy import DateTime, bindparam, text
+
+UPSERT_ROLLUP_SQL = text(
+    "INSERT INTO query_rollups (day, hour, intent, language, matched, count) "
+    "VALUES (:day, :hour, :intent, :language, :matched, :count) "
+    "ON CONFLICT (day, hour, intent, language, matched) "
+    "DO UPDATE SET count = count + excluded.count"
+)
+
+UPSERT_UNKNOWN_SQL = text(
+    "INSERT INTO unknown_query_counts (query_text, count, last_seen) "
+    "VALUES (:query_text, :count, :last_seen) "
+    "ON CONFLICT (query_text) "
+    "DO UPDATE SET count = count + excluded.count, last_seen = max(last_seen, excluded.last_seen)"
+).bindparams(bindparam("last_seen", type_=DateTime))
+
+# Full rebuild from query_logs. NULL intents/languages are stored as '' so the
+# composite key stays comparable; rows without a timestamp get day '' / hour -1
+# (they still count towards intent totals but never fall in a day window).
+# db_setup migration 2 holds a frozen copy; a schema change here needs a new migration step.
+REBUILD_STATEMENTS: List[str] = [
+    "DELETE FROM query_rollups",
+    """
+    INSERT INTO query_rollups (day, hour, intent, language, matched, count)
+    SELECT coalesce(date(timestamp), ''),
+           coalesce(CAST(strftime('%H', timestamp) AS INTEGER), -1),
+           coalesce(intent, ''),
+           coalesce(language, ''),
+           matched_condition IS NOT NULL,
+           count(*)
+    FROM query_logs
+    GROUP BY 1, 2, 3, 4, 5
+    """,
+    "DELETE FROM unknown_query_counts",
+    """
+    INSERT INTO unknown_query_counts (query_text, count, last_seen)
+    SELECT coalesce(query_text, ''), count(*), max(timestamp)
+    FROM query_logs
+    WHERE matched_condition IS NULL
+    GROUP BY 1
+    """,
+]
+
+
+def update_rollups(db, logs: Iterable) -> int:
+    """Add QueryLog rows (not yet committed) to the rollups in the caller's transaction."""
+    buckets: Counter = Counter()
+    unknown: Counter = Counter()
+    last_seen = {}
+    for log in logs:
+        ts = log.timestamp
+        if ts is None:
+            ts = log.timestamp = datetime.utcnow()
+        matched = 1 if log.matched_condition is not None else 0
+        buckets[(ts.date().isoformat(), ts.hour, log.intent or "", log.language or "", matched)] += 1
+        if not matched:
+            query_text = log.query_text or ""
+            unknown[query_text] += 1
+            if query_text not in last_seen or ts > last_seen[query_text]:
+                last_seen[query_text] = ts
+    if buckets:
+        db.execute(UPSERT_ROLLUP_SQL, [
+            {"day": day, "hour": hour, "intent": intent, "language": language, "matched": matched, "count": count}
+            for (day, hour, intent, language, matched), count in buckets.items()
+        ])
+    if unknown:
+        db.execute(UPSERT_UNKNOWN_SQL, [
+            {"query_text": q, "count": count, "last_seen": last_seen[q]} for q, count in unknown.items()
+        ])
+    return sum(buckets.values())
+
+
+def backfill(engine) -> dict:
+    """Rebuild both rollup tables from query_logs in one transaction."""
+    with engine.begin() as conn:
+        for statement in REBUILD_STATEMENTS:
+            conn.execute(text(statement))
+        rollup_rows = conn.execute(text("SELECT count(*) FROM query_rollups")).scalar()
+        logged = conn.execute(text("SELECT coalesce(sum(count), 0) FROM query_rollups")).scalar()
+        unknown_rows = conn.execute(text("SELECT count(*) FROM unknown_query_counts")).scalar()
+    return {"query_logs": logged, "rollup_rows": rollup_rows, "unknown_queries": unknown_rows}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the analytics rollup tables.")
+    parser.add_argument("--backfill", action="store_true", help="rebuild rollups from the full query_logs history")
+    args = parser.parse_args()
+    if not args.backfill:
+        parser.print_help()
+        return
+    from backend.main import engine
+    result = backfill(engine)
+    print(f"✅ Rolled up {result['query_logs']} query logs into {result['rollup_rows']} rows "
+          f"({result['unknown_queries']} distinct unknown queries)")
+
+
+if __name__ == "__main__":
+    main()
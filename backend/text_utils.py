@@ -0,0 +1,7 @@
+import re
+import unicodedata
+
+
+# Normalize text for fuzzy matching
+def normalize_text(text: str) -> str:
+    return unicodedata.normalize("NFKC", re.sub(r"[^\w\s\u0900-\u097F]", "", text.strip().lower()))
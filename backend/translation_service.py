@@ -0,0 +1,387 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from importlib.util import find_spec
+from typing import Dict, Iterable, List, Optional
+
+CURATED_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "data_structured", "ui_translations_hi.json"))
+CACHE_PATH = os.getenv("WELLBOT_TRANSLATION_CACHE", os.path.join(os.path.dirname(__file__), "translations.db"))
+# 🔹 Engine output is evicted after CACHE_MAX_DAYS, oldest first beyond CACHE_MAX_ROWS (curated rows are kept)
+CACHE_MAX_ROWS = int(os.getenv("WELLBOT_TRANSLATION_CACHE_ROWS", "50000"))
+CACHE_MAX_DAYS = float(os.getenv("WELLBOT_TRANSLATION_CACHE_DAYS", "30"))
+
+# 🔹 Frontend language names and ISO codes both work; English is the source language
+LANG_CODES = {"english": "en", "en": "en", "hindi": "hi", "hi": "hi"}
+SOURCE_LANG = "en"
+
+
+def lang_code(lang: str) -> Optional[str]:
+    return LANG_CODES.get((lang or "").strip().lower())
+
+
+def load_curated(path: str = CURATED_PATH) -> Dict[str, Dict[str, str]]:
+    """{lang_code: {english: translation}} from the curated JSON (`hi` key -> Hindi)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Curated translations not loaded from {path}: {e}")
+        return {}
+    return {code: dict(strings) for code, strings in data.items() if not code.startswith("_")}
+
+
+# -----------------------
+# Persistent cache
+# -----------------------
+class TranslationCache:
+    """(lang, source text) -> translation in a small SQLite file.
+
+    Survives restarts and is shared by every uvicorn worker. Each thread
+    keeps its own connection (WAL, so readers don't wait on the writer).
+    prune() bounds the file: engine rows expire after `max_age` seconds and
+    only the newest `max_rows` of them are kept.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, max_rows: int = CACHE_MAX_ROWS,
+                 max_age: float = CACHE_MAX_DAYS * 86400):
+        self.path = path
+        self.max_rows = max_rows
+        self.max_age = max_age
+        self._local = threading.local()
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            " lang TEXT NOT NULL, source TEXT NOT NULL, translation TEXT NOT NULL,"
+            " engine TEXT NOT NULL, created_at REAL NOT NULL,"
+            " PRIMARY KEY (lang, source))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_translations_created_at ON translations (created_at)")
+        conn.commit()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=10)
+        return conn
+
+    def get_many(self, lang: str, texts: Iterable[str]) -> Dict[str, str]:
+        texts = list(texts)
+        found = {}
+        conn = self._connection()
+        for i in range(0, len(texts), 500):  # stay under SQLite's bound-parameter limit
+            chunk = texts[i:i + 500]
+            rows = conn.execute(
+                f"SELECT source, translation FROM translations WHERE lang = ? AND source IN ({','.join('?' * len(chunk))})",
+                [lang, *chunk],
+            )
+            found.update(rows)
+        return found
+
+    def put_many(self, lang: str, pairs: Dict[str, str], engine: str, replace: bool = True):
+        if not pairs:
+            return
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                f"{verb} INTO translations (lang, source, translation, engine, created_at) VALUES (?, ?, ?, ?, ?)",
+                [(lang, source, translation, engine, now) for source, translation in pairs.items()],
+            )
+
+    def prune(self) -> int:
+        """Drop expired engine rows, then the oldest ones beyond max_rows. Returns rows deleted."""
+        conn = self._connection()
+        with conn:
+            deleted = conn.execute("DELETE FROM translations WHERE engine != 'curated' AND created_at < ?",
+                                   (time.time() - self.max_age,)).rowcount
+            deleted += conn.execute(
+                "DELETE FROM translations WHERE rowid IN (SELECT rowid FROM translations WHERE engine != 'curated'"
+                " ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_rows,),
+            ).rowcount
+        return deleted
+
+    def counts(self) -> Dict[str, int]:
+        rows = self._connection().execute("SELECT engine, COUNT(*) FROM translations GROUP BY engine")
+        return dict(rows)
+
+
+# -----------------------
+# Engines: translate_batch(texts, lang) -> [translation or None]
+# -----------------------
+class MarianEngine:
+    """Offline Helsinki-NLP MarianMT (same batch loop as __archive/IndicTrans2Translator.py).
+
+    The model loads on first use, in the service's background thread.
+    """
+
+    name = "marian"
+    MODELS = {"hi": "Helsinki-NLP/opus-mt-en-hi"}
+
+    def __init__(self, batch_size: int = 16):
+        self.batch_size = batch_size
+        self._models = {}
+
+    def available(self) -> bool:
+        return find_spec("transformers") is not None and find_spec("torch") is not None
+
+    def supports(self, lang: str) -> bool:
+        return lang in self.MODELS
+
+    def _load(self, lang: str):
+        if lang not in self._models:
+            import torch
+            from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+            device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+            tokenizer = AutoTokenizer.from_pretrained(self.MODELS[lang])
+            model = AutoModelForSeq2SeqLM.from_pretrained(self.MODELS[lang]).to(device)
+            model.eval()
+            self._models[lang] = (tokenizer, model, device)
+        return self._models[lang]
+
+    def translate_batch(self, texts: List[str], lang: str) -> List[Optional[str]]:
+        import torch
+
+        tokenizer, model, device = self._load(lang)
+        results = []
+        for i in range(0, len(texts), self.batch_size):
+            batch = texts[i:i + self.batch_size]
+            inputs = tokenizer(batch, return_tensors="pt", padding=True, truncation=True).to(device)
+            with torch.no_grad():
+                outputs = model.generate(**inputs, max_new_tokens=256)
+            results.extend(tokenizer.batch_decode(outputs, skip_special_tokens=True))
+        return results
+
+
+class GoogleEngine:
+    """Online googletrans, then deep_translator (what the frontend used to call per string)."""
+
+    name = "google"
+
+    def available(self) -> bool:
+        return find_spec("googletrans") is not None or find_spec("deep_translator") is not None
+
+    def supports(self, lang: str) -> bool:
+        return True
+
+    def translate_batch(self, texts: List[str], lang: str) -> List[Optional[str]]:
+        translator = deep = None
+        if find_spec("googletrans") is not None:
+            from googletrans import Translator
+            translator = Translator()
+        if find_spec("deep_translator") is not None:
+            from deep_translator import GoogleTranslator
+            deep = GoogleTranslator(source="auto", target=lang)
+        results = []
+        for text in texts:
+            translated = None
+            if translator is not None:
+                try:
+                    translated = translator.translate(text, dest=lang).text
+                except Exception:
+                    pass
+            if translated is None and deep is not None:
+                try:
+                    translated = deep.translate(text)
+                except Exception:
+                    pass
+            results.append(translated)
+        return results
+
+
+ENGINES = {"marian": MarianEngine, "google": GoogleEngine}
+
+
+def engines_from_env(value: Optional[str] = None) -> list:
+    """Engines named in WELLBOT_TRANSLATION_ENGINES (comma-separated, tried in order)."""
+    names = (value if value is not None else os.getenv("WELLBOT_TRANSLATION_ENGINES", "marian,google")).split(",")
+    engines = []
+    for name in (n.strip().lower() for n in names):
+        if not name:
+            continue
+        if name not in ENGINES:
+            print(f"⚠️ Unknown translation engine {name!r}; known: {', '.join(ENGINES)}")
+            continue
+        engine = ENGINES[name]()
+        if engine.available():
+            engines.append(engine)
+        else:
+            print(f"⚠️ Translation engine {name!r} unavailable (dependency not installed)")
+    return engines
+
+
+# -----------------------
+# Service
+# -----------------------
+class TranslationService:
+    """Batch UI-string translation: curated -> persistent cache -> engines.
+
+    translate_many() only reads the curated strings and the cache, so it never
+    waits on a model or the network. Misses come back as None and are queued
+    for a background thread that runs them through the engines in batches and
+    stores the results; the caller shows the source text meanwhile and picks
+    the translation up on its next request. A text no engine could translate
+    is not queued again for `retry_after` seconds.
+
+    persist=False is for user content (queries, comments, answers shown in
+    tables): its translations are kept in memory only, at most
+    `max_transient` of them for `transient_ttl` seconds, never in the cache file.
+    """
+
+    def __init__(self, cache: TranslationCache, curated: Dict[str, Dict[str, str]], engines: list,
+                 batch_size: int = 32, max_pending: int = 5000, retry_after: float = 300.0,
+                 max_transient: int = 5000, transient_ttl: float = 3600.0):
+        self.cache = cache
+        self.curated = curated
+        self.engines = engines
+        self.batch_size = batch_size
+        self.retry_after = retry_after
+        self.max_transient = max_transient
+        self.transient_ttl = transient_ttl
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._queued = set()
+        self._failed: Dict[tuple, float] = {}
+        self._transient: Dict[tuple, tuple] = {}  # (lang, text) -> (translation, expires_at)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "texts": 0, "curated_hits": 0, "cache_hits": 0, "misses": 0,
+                       "translated": 0, "untranslated": 0, "dropped": 0, "engine_errors": 0}
+        # Curated strings win over anything an engine produced earlier
+        for lang, strings in curated.items():
+            cache.put_many(lang, strings, engine="curated")
+
+    def is_curated(self, text: str, lang: str) -> bool:
+        return text in self.curated.get(lang_code(lang) or lang, {})
+
+    def translate_many(self, texts: List[str], lang: str, wait: bool = False,
+                       persist: bool = True) -> List[Optional[str]]:
+        """Translations in input order; None for texts still being translated (or untranslatable).
+
+        wait=True translates misses inline (offline tooling / cache warm-up, not request paths).
+        """
+        code = lang_code(lang) or lang
+        if code == SOURCE_LANG:
+            return list(texts)
+        curated = self.curated.get(code, {})
+        unique = list(dict.fromkeys(t for t in texts if t and t not in curated))
+        found = self.cache.get_many(code, unique) if unique else {}
+        if not persist:
+            found.update(self._transient_get(code, [t for t in unique if t not in found]))
+        misses = [t for t in unique if t not in found]
+        if misses:
+            if wait:
+                found.update(self._translate(code, misses, persist))
+            else:
+                self._enqueue(code, misses, persist)
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["texts"] += len(texts)
+            self._stats["curated_hits"] += sum(1 for t in texts if t in curated)
+            self._stats["cache_hits"] += len(unique) - len(misses)
+            self._stats["misses"] += len(misses)
+        return [t if not t else curated.get(t) or found.get(t) for t in texts]
+
+    def _transient_get(self, lang: str, texts: List[str]) -> Dict[str, str]:
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for text in texts:
+                entry = self._transient.get((lang, text))
+                if entry is not None and entry[1] > now:
+                    found[text] = entry[0]
+        return found
+
+    def _transient_put(self, lang: str, pairs: Dict[str, str]):
+        expires = time.monotonic() + self.transient_ttl
+        with self._lock:
+            for source, translation in pairs.items():
+                self._transient.pop((lang, source), None)
+                self._transient[(lang, source)] = (translation, expires)
+            # dicts keep insertion order: the first entries are the oldest
+            while len(self._transient) > self.max_transient:
+                del self._transient[next(iter(self._transient))]
+
+    def _enqueue(self, lang: str, texts: List[str], persist: bool = True):
+        now = time.monotonic()
+        with self._lock:
+            for text in texts:
+                key = (lang, text)
+                if key in self._queued or self._failed.get(key, 0) > now:
+                    continue
+                try:
+                    self._queue.put_nowait((lang, text, persist))
+                except queue.Full:
+                    self._stats["dropped"] += 1
+                    continue
+                self._queued.add(key)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="translation-service", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            groups: Dict[tuple, List[str]] = {}
+            for lang, text, persist in batch:
+                groups.setdefault((lang, persist), []).append(text)
+            for (lang, persist), texts in groups.items():
+                try:
+                    self._translate(lang, texts, persist)
+                except Exception as e:
+                    print(f"⚠️ Translation batch failed: {e}")
+                finally:
+                    with self._lock:
+                        self._queued.difference_update((lang, t) for t in texts)
+            try:
+                self.cache.prune()
+            except Exception as e:
+                print(f"⚠️ Translation cache prune failed: {e}")
+
+    def _translate(self, lang: str, texts: List[str], persist: bool = True) -> Dict[str, str]:
+        """Run texts through the engines in order; cache and return what got translated."""
+        done: Dict[str, str] = {}
+        remaining = list(texts)
+        for engine in self.engines:
+            if not remaining or not engine.supports(lang):
+                continue
+            try:
+                results = engine.translate_batch(remaining, lang)
+            except Exception as e:
+                print(f"⚠️ Translation engine {engine.name!r} failed: {e}")
+                with self._lock:
+                    self._stats["engine_errors"] += 1
+                continue
+            translated = {src: out.strip() for src, out in zip(remaining, results) if out and out.strip()}
+            if persist:
+                self.cache.put_many(lang, translated, engine=engine.name, replace=False)
+            else:
+                self._transient_put(lang, translated)
+            done.update(translated)
+            remaining = [t for t in remaining if t not in translated]
+        now = time.monotonic()
+        with self._lock:
+            if len(self._failed) > 10000:
+                self._failed = {key: at for key, at in self._failed.items() if at > now}
+            self._stats["translated"] += len(done)
+            self._stats["untranslated"] += len(remaining)
+            for text in remaining:
+                self._failed[(lang, text)] = now + self.retry_after
+        return done
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats, pending=self._queue.qsize(), transient=len(self._transient),
+                         engines=[engine.name for engine in self.engines])
+        stats["cached"] = self.cache.counts()
+        return stats
@@ -0,0 +1,134 @@
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+from typing import Dict, Iterable, List, Optional
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+APP_PATH = os.path.join(ROOT, "frontend", "app.py")
+CATALOG_PATH = os.path.join(ROOT, "data_structured", "ui_catalog.json")
+CATALOG_LANGS = ["en", "hi"]
+
+# 🔹 Calls whose first argument is a UI string literal, and dicts of labels passed to translate() by key
+TRANSLATE_FUNCS = {"translate", "translate_text_for_display"}
+LABEL_DICTS = {"PAGE_LABELS"}
+
+
+class UICatalog:
+    """Versioned English -> {lang: text} message catalog (data_structured/ui_catalog.json).
+
+    Loaded once per process; get() is a dict lookup. Returns None for strings
+    the catalog doesn't have (or has no translation for), so callers can fall
+    back to dynamic translation.
+    """
+
+    def __init__(self, messages: Dict[str, Dict[str, Optional[str]]], version: str = ""):
+        self.version = version
+        self._by_lang: Dict[str, Dict[str, str]] = {lang: {} for lang in CATALOG_LANGS}
+        for source, translations in messages.items():
+            self._by_lang["en"][source] = source
+            for lang, text in translations.items():
+                if text:
+                    self._by_lang.setdefault(lang, {})[source] = text
+
+    @classmethod
+    def load(cls, path: str = CATALOG_PATH) -> "UICatalog":
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ UI catalog not loaded from {path}: {e}")
+            return cls({})
+        return cls(data.get("messages", {}), data.get("version", ""))
+
+    def get(self, text: str, lang: str) -> Optional[str]:
+        return self._by_lang.get(lang, {}).get(text)
+
+    def __contains__(self, text: str) -> bool:
+        return text in self._by_lang["en"]
+
+    def __len__(self) -> int:
+        return len(self._by_lang["en"])
+
+
+# -----------------------
+# Build step: python -m backend.ui_catalog [--translate] [--check]
+# -----------------------
+def extract_strings(path: str = APP_PATH) -> List[str]:
+    """UI string literals in source order: first arguments of translate()/translate_text_for_display()
+    and the values of LABEL_DICTS."""
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    found = []
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in TRANSLATE_FUNCS
+                and node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str)):
+            found.append((node.lineno, node.col_offset, node.args[0].value))
+        elif (isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict)
+              and any(isinstance(t, ast.Name) and t.id in LABEL_DICTS for t in node.targets)):
+            found.extend((v.lineno, v.col_offset, v.value) for v in node.value.values
+                         if isinstance(v, ast.Constant) and isinstance(v.value, str))
+    return list(dict.fromkeys(text for _, _, text in sorted(found)))
+
+
+def catalog_version(messages: Dict[str, dict]) -> str:
+    payload = json.dumps(messages, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()[:12]
+
+
+def build_catalog(strings: Iterable[str], translate: bool = False) -> dict:
+    """Hindi comes from the curated strings, then the backend translation cache, then
+    (with translate=True) the translation engines; anything left stays null (and fails --check)."""
+    from backend.translation_service import TranslationCache, TranslationService, engines_from_env, load_curated
+
+    strings = list(strings)
+    cache = TranslationCache()
+    service = TranslationService(cache, load_curated(), engines_from_env() if translate else [])
+    hindi = service.translate_many(strings, "hi", wait=True)
+    messages = {source: {"hi": text} for source, text in zip(strings, hindi)}
+    return {
+        "_comment": "Generated by `python -m backend.ui_catalog` from the translate() literals in frontend/app.py. "
+                    "Edit curated Hindi in ui_translations_hi.json and rebuild; null = translated at runtime and fails --check.",
+        "version": catalog_version(messages),
+        "languages": CATALOG_LANGS,
+        "messages": messages,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build the frontend UI message catalog.")
+    parser.add_argument("--app", default=APP_PATH)
+    parser.add_argument("--out", default=CATALOG_PATH)
+    parser.add_argument("--translate", action="store_true",
+                        help="translate strings missing from the curated set and cache with the engines")
+    parser.add_argument("--check", action="store_true",
+                        help="exit 1 if the catalog is missing strings used in the app, or a translation "
+                             "for one of them (no write)")
+    args = parser.parse_args(argv)
+
+    strings = extract_strings(args.app)
+    if args.check:
+        catalog = UICatalog.load(args.out)
+        missing = [s for s in strings if s not in catalog]
+        untranslated = [(s, lang) for s in strings if s in catalog
+                        for lang in CATALOG_LANGS if catalog.get(s, lang) is None]
+        for text in missing:
+            print(f"❌ not in catalog: {text!r}")
+        for text, lang in untranslated:
+            print(f"❌ no {lang} translation: {text!r}")
+        print(f"{len(strings)} strings, {len(missing)} missing from {args.out}, {len(untranslated)} untranslated "
+              f"(version {catalog.version or '-'})")
+        return 1 if missing or untranslated else 0
+
+    data = build_catalog(strings, translate=args.translate)
+    with open(args.out, "w", encoding="utf-8", newline="\r\n") as f:
+        f.write(json.dumps(data, ensure_ascii=False, indent=2) + "\n")
+    translated = sum(1 for m in data["messages"].values() if m["hi"])
+    print(f"✅ {len(strings)} strings ({translated} with Hindi) -> {args.out}, version {data['version']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
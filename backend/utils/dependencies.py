@@ -1,7 +1,6 @@
 from sqlalchemy.orm import Session
-from fastapi import Depends, HTTPException, status, Header
-from jose import JWTError, jwt
-from backend.main import SessionLocal, User, SECRET_KEY, ALGORITHM
+from fastapi import Depends, HTTPException, status, Header, Request
+from backend.main import SessionLocal, User, get_cached_user, request_claims
 
 def get_db():
     db = SessionLocal()
@@ -13,24 +12,19 @@ def get_db():
 def get_user(db: Session, email: str):
     return db.query(User).filter(User.email == email).first()
 
-def get_current_user(authorization: str = Header(...), db: Session = Depends(get_db)) -> User:
+def get_current_user(request: Request, authorization: str = Header(...), db: Session = Depends(get_db)) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials. Please login again.",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    if not authorization.startswith("Bearer "):
-        raise credentials_exception
-    token = authorization.split("Bearer ")[1]
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
+    # ✅ Claims verified once per request by jwt_middleware (cached per token)
+    claims = request_claims(request, authorization)
+    email = claims.get("sub") if claims else None
+    if email is None:
         raise credentials_exception
 
-    user = get_user(db, email=email)
+    user = get_cached_user(db, email)
     if user is None:
         raise credentials_exception
     return user
@@ -0,0 +1,123 @@
+"""Throughput of fixed max_length padding vs length-bucketed dynamic padding.
+
+Inference: scores data_structured/intent_dataset.jsonl in batches padded to
+max_length=64 (the old trainers' tokenization), padded per batch in file
+order, and with IntentClassifier.score_many() (length-sorted buckets).
+Training: forward + backward + AdamW step over the same texts, collated
+with padding="max_length" vs DataCollatorWithPadding + LengthGroupedSampler
+(what Trainer does with group_by_length=True).
+
+    python benchmarks/bench_dynamic_padding.py --batch-size 16 --epochs 2
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from backend.intent_classifier import MODEL_DIR, IntentClassifier  # noqa: E402
+
+DATASET = os.path.join(ROOT, "data_structured", "intent_dataset.jsonl")
+
+
+def load_texts():
+    with open(DATASET, "r", encoding="utf-8") as f:
+        return [str(json.loads(line)["text"]).strip() for line in f if line.strip()]
+
+
+def bench_inference(classifier: IntentClassifier, texts, batch_size: int, repeat: int) -> dict:
+    tok = classifier._tokenizer
+    modes = {}
+
+    def fixed():
+        for i in range(0, len(texts), batch_size):
+            enc = tok(texts[i:i + batch_size], return_tensors=classifier._tensor_type, truncation=True,
+                      padding="max_length", max_length=classifier.max_length)
+            classifier._forward(enc)
+
+    def per_batch():
+        for i in range(0, len(texts), batch_size):
+            classifier.score_batch(texts[i:i + batch_size])
+
+    def bucketed():
+        classifier.score_many(texts, batch_size=batch_size)
+
+    for label, fn in (("max_length=64", fixed), ("dynamic, file order", per_batch),
+                      ("dynamic, length-sorted", bucketed)):
+        fn()  # warm-up
+        started = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        modes[label] = len(texts) * repeat / (time.perf_counter() - started)
+    return modes
+
+
+def bench_training(model_dir, texts, batch_size: int, epochs: int, max_length: int = 64) -> dict:
+    import torch
+    from torch.utils.data import DataLoader
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer, DataCollatorWithPadding
+    from transformers.trainer_pt_utils import LengthGroupedSampler
+
+    tokenizer = AutoTokenizer.from_pretrained(str(model_dir))
+    fixed = [dict(tokenizer(t, truncation=True, padding="max_length", max_length=max_length), labels=[0.0] * 6)
+             for t in texts]
+    dynamic = [dict(tokenizer(t, truncation=True, max_length=max_length), labels=[0.0] * 6) for t in texts]
+    collator = DataCollatorWithPadding(tokenizer)
+    loaders = {
+        "max_length=64": DataLoader(fixed, batch_size=batch_size, shuffle=True, collate_fn=collator),
+        "dynamic + group_by_length": DataLoader(
+            dynamic, batch_size=batch_size, collate_fn=collator,
+            sampler=LengthGroupedSampler(batch_size, lengths=[len(f["input_ids"]) for f in dynamic]),
+        ),
+    }
+    results = {}
+    for label, loader in loaders.items():
+        torch.manual_seed(42)
+        model = AutoModelForSequenceClassification.from_pretrained(
+            str(model_dir), num_labels=6, problem_type="multi_label_classification")
+        model.train()
+        optimizer = torch.optim.AdamW(model.parameters(), lr=2e-5)
+        seen = 0
+        started = time.perf_counter()
+        for _ in range(epochs):
+            for batch in loader:
+                loss = model(**batch).loss
+                loss.backward()
+                optimizer.step()
+                optimizer.zero_grad()
+                seen += batch["input_ids"].shape[0]
+        results[label] = seen / (time.perf_counter() - started)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-dir", default=str(MODEL_DIR))
+    parser.add_argument("--runtime", default="torch")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--repeat", type=int, default=5, help="inference passes over the dataset")
+    parser.add_argument("--epochs", type=int, default=1, help="training passes (0 = skip training)")
+    args = parser.parse_args()
+
+    texts = load_texts()
+    classifier = IntentClassifier(model_dir=args.model_dir, runtime=args.runtime, device="cpu")
+    classifier.load()
+    lengths = sorted(len(ids) for ids in classifier._tokenizer(texts, truncation=True, max_length=64)["input_ids"])
+    print(f"{len(texts)} texts, median {lengths[len(lengths) // 2]} tokens, max {lengths[-1]}, "
+          f"batch size {args.batch_size}\n")
+
+    print(f"{'inference (' + args.runtime + ')':<30}{'samples/s':>12}")
+    for label, rate in bench_inference(classifier, texts, args.batch_size, args.repeat).items():
+        print(f"  {label:<28}{rate:>12.1f}")
+
+    if args.epochs:
+        print(f"\n{'training (torch, AdamW)':<30}{'samples/s':>12}")
+        for label, rate in bench_training(args.model_dir, texts, args.batch_size, args.epochs).items():
+            print(f"  {label:<28}{rate:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Timing: indexed find_best_match vs the full alias scan.
+
+Uses the NLU examples and required_fields sets from
+tests/test_find_best_match.py (which checks the two agree). Needs rasa_sdk.
+Run from the repo root (the actions use relative paths):
+
+    python benchmarks/bench_find_best_match.py
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from tests.test_find_best_match import (  # noqa: E402
+    REQUIRED_FIELDS, example_lang, find_best_match, kb_store, nlu_examples,
+)
+
+
+def main():
+    kb = kb_store.get()
+    examples = nlu_examples()
+    scan_s = index_s = 0.0
+    for text in examples:
+        lang = example_lang(text)
+        index = kb.index_for(lang)
+        for fields in REQUIRED_FIELDS:
+            started = time.perf_counter()
+            find_best_match(text, kb.entries, kb.alias_map, lang, required_fields=fields)
+            scan_s += time.perf_counter() - started
+            started = time.perf_counter()
+            find_best_match(text, kb.entries, kb.alias_map, lang, required_fields=fields, index=index)
+            index_s += time.perf_counter() - started
+    calls = len(examples) * len(REQUIRED_FIELDS)
+    print(f"{len(examples)} NLU examples x {len(REQUIRED_FIELDS)} field sets = {calls} calls")
+    print(f"scan  {scan_s / calls * 1e6:8.1f} µs/call")
+    print(f"index {index_s / calls * 1e6:8.1f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Throughput of DialogueManager.generate_response with and without the answer cache.
+
+Seeds a throwaway SQLite database with backend/seed/seed_data.py, points
+the dialogue manager at it, checks that every query gets the same response
+from the precomputed keyword -> answer tables (backend/answer_cache.py) as
+from the per-response ILIKE queries, then times both.
+
+    python benchmarks/bench_generate_response.py --seconds 3
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "backend"))  # seed_data imports `models`
+sys.path.insert(0, os.path.join(ROOT, "backend", "seed"))
+
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import backend.main  # noqa: E402,F401  (backend.dialogue_manager must be imported via main)
+from backend import dialogue_manager as dm  # noqa: E402
+from backend.answer_cache import AnswerCache  # noqa: E402
+from backend.db_setup import create_sqlite_engine  # noqa: E402
+
+QUERIES = [
+    "I have a headache",
+    "what tablet is good for fever?",
+    "can you suggest medicine for cold and cough?",
+    "give me a wellness tip for better sleep",
+    "how do I stay hydrated",
+    "I burned my hand, what should I do?",
+    "my finger is bleeding",
+    "I feel dizzy and tired",
+    "hello",
+    "I feel anxious and stressed",
+    "sore throat since morning",
+    "what is the capital of France",
+]
+
+
+class _NoCache:
+    def lookup(self, table, keyword, db=None):
+        return None
+
+
+def throughput(manager, seconds: float) -> float:
+    done = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        for query in QUERIES:
+            manager.generate_response(query)
+        done += len(QUERIES)
+    return done / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=3.0, help="timing window per mode")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="wellbot-bench-")
+    os.chdir(workdir)  # generate_response appends misses to ./unmatched_queries.log
+    engine = create_sqlite_engine(f"sqlite:///{os.path.join(workdir, 'legacy.db')}")
+    Session = sessionmaker(bind=engine)
+
+    import seed_data
+    seed_data.engine, seed_data.SessionLocal = engine, Session
+    seed_data.seed()
+
+    manager = dm.DialogueManager(intent_backend="rules", session_factory=Session)
+    cache = AnswerCache(Session, dm.LEGACY_LOOKUPS, dm.COLUMN_KEYWORDS)
+
+    dm.answer_cache = _NoCache()
+    expected = [manager.generate_response(q) for q in QUERIES]
+    dm.answer_cache = cache
+    got = [manager.generate_response(q) for q in QUERIES]
+    mismatches = sum(a != b for a, b in zip(expected, got))
+    for query, a, b in zip(QUERIES, expected, got):
+        if a != b:
+            print(f"❌ {query!r}: sql={a} cache={b}")
+    print(f"{len(QUERIES)} queries, {mismatches} mismatches")
+
+    results = {}
+    for label, backend in (("ILIKE per response", _NoCache()), ("answer cache", cache)):
+        dm.answer_cache = backend
+        throughput(manager, 0.2)  # warm-up
+        results[label] = throughput(manager, args.seconds)
+    print(f"{'mode':<22}{'responses/s':>14}{'µs/response':>14}")
+    for label, rps in results.items():
+        print(f"{label:<22}{rps:>14.0f}{1e6 / rps:>14.1f}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Import-time benchmark for the intent predictor modules.
+
+Each module is imported in a fresh interpreter (so nothing is cached in
+sys.modules) and the wall time of the import statement itself is reported
+(interpreter start-up excluded). The predictor modules must stay in
+the milliseconds range; --training adds the training entry points for
+comparison (needs torch, transformers, datasets, pandas and scikit-learn,
+and runs the full tokenization + Trainer setup).
+
+    python benchmarks/bench_import_time.py --repeat 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+PREDICTORS = ["backend.nlu", "backend.nlu_multi", "backend.intent_classifier"]
+TRAINING = ["backend.train_nlu", "backend.train_nlu_multi"]
+
+TIMER = (
+    "import time; t = time.perf_counter(); {stmt}; "
+    "print((time.perf_counter() - t) * 1000)"
+)
+
+
+def time_import(module: str, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-c", TIMER.format(stmt=f"import {module}")],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            return None, proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "failed"
+        samples.append(float(proc.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples), None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--training", action="store_true", help="also time the training entry points")
+    args = parser.parse_args()
+
+    modules = PREDICTORS + (TRAINING if args.training else [])
+    print(f"{'module':<32}{'import ms (median)':>20}")
+    for module in modules:
+        ms, error = time_import(module, args.repeat if module in PREDICTORS else 1)
+        if error:
+            print(f"{module:<32}{'error':>20}  {error}")
+        else:
+            print(f"{module:<32}{ms:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
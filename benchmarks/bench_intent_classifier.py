@@ -0,0 +1,100 @@
+"""Latency benchmark for backend/intent_classifier.py on CPU.
+
+Runs the same closed-loop load (N concurrent clients, each sending queries
+back to back) against the classifier with micro-batching disabled
+(max_batch_size=1, i.e. one forward pass per request like predict_intents())
+and enabled, and prints p50/p99 latency and throughput.
+
+    python benchmarks/bench_intent_classifier.py --clients 16 --requests 50
+
+Needs torch + transformers and trained weights in backend/intent_model_multi
+(python backend/nlu_multi.py).
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.intent_classifier import IntentClassifier  # noqa: E402
+
+QUERIES = [
+    "Hi, I feel anxious and need a wellness tip",
+    "मुझे सिरदर्द है और मुझे प्राथमिक उपचार चाहिए",
+    "Hello, I need medicine and a wellness suggestion",
+    "I feel sad and have a fever",
+    "स्वस्थ रहने के उपाय बताओ और सिरदर्द के लिए क्या करें?",
+    "What should I do for a burn?",
+    "How to treat a bleeding wound?",
+    "मधुमक्खी के काटने पर क्या करें?",
+]
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run(classifier: IntentClassifier, clients: int, requests: int) -> dict:
+    latencies = []
+    lock = threading.Lock()
+
+    def client(n):
+        local = []
+        for i in range(requests):
+            text = QUERIES[(n + i) % len(QUERIES)]
+            started = time.perf_counter()
+            classifier.scores(text)
+            local.append((time.perf_counter() - started) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    classifier.scores(QUERIES[0])  # warm-up (thread start, first allocations)
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+    return {
+        "p50": statistics.median(latencies),
+        "p99": percentile(latencies, 99),
+        "rps": len(latencies) / elapsed,
+        "avg_batch": classifier.stats()["avg_batch"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=50, help="requests per client")
+    parser.add_argument("--max-batch", type=int, default=16)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--threads", type=int, default=0, help="torch intra-op threads (0 = torch default)")
+    args = parser.parse_args()
+
+    if args.threads:
+        import torch
+        torch.set_num_threads(args.threads)
+
+    configs = [
+        ("unbatched", IntentClassifier(max_batch_size=1, max_wait_ms=0, device="cpu")),
+        (f"micro-batch<={args.max_batch}/{args.max_wait_ms}ms",
+         IntentClassifier(max_batch_size=args.max_batch, max_wait_ms=args.max_wait_ms, device="cpu")),
+    ]
+    print(f"{args.clients} clients x {args.requests} requests, CPU\n")
+    print(f"{'mode':<28}{'p50 ms':>10}{'p99 ms':>10}{'req/s':>10}{'avg batch':>11}")
+    for label, classifier in configs:
+        classifier.load()
+        result = run(classifier, args.clients, args.requests)
+        print(f"{label:<28}{result['p50']:>10.1f}{result['p99']:>10.1f}{result['rps']:>10.1f}{result['avg_batch']:>11.2f}")
+        classifier.stop()
+
+
+if __name__ == "__main__":
+    main()
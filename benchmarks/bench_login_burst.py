@@ -0,0 +1,100 @@
+"""/respond latency while a burst of logins hits the bcrypt process pool.
+
+Starts `uvicorn backend.main:app` (or loads --url), then measures /respond
+latency for --users chat clients twice: alone, and while --logins
+concurrent clients post /token back to back. Logins are bcrypt-bound; with
+the bounded hashing pool (backend/password_hasher.py) the chat p99 should
+stay close to the idle run and excess logins get 503 instead of queueing
+behind each other. Prints the server's /admin/password-hasher/stats.
+
+    python benchmarks/bench_login_burst.py --users 16 --logins 32 --seconds 10
+    WELLBOT_HASH_WORKERS=2 WELLBOT_HASH_QUEUE=4 python benchmarks/bench_login_burst.py
+
+The server writes to backend/wellness.db; run it on a scratch copy.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from load_respond import QUERIES, USER, login, start_server, wait_ready  # noqa: E402
+
+
+def percentile(values, p: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+async def run(url: str, token: str, users: int, logins: int, seconds: float) -> dict:
+    chat_ms, login_status = [], {}
+    limits = httpx.Limits(max_connections=users + logins)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60.0) as client:
+        deadline = time.monotonic() + seconds
+
+        async def chat(n: int):
+            i = n
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                await client.post("/respond", json={"text": QUERIES[i % len(QUERIES)]},
+                                  headers={"Authorization": f"Bearer {token}"})
+                chat_ms.append((time.perf_counter() - started) * 1000)
+                i += 1
+
+        async def log_in():
+            while time.monotonic() < deadline:
+                response = await client.post("/token", json={"email": USER["email"], "password": USER["password"]})
+                login_status[response.status_code] = login_status.get(response.status_code, 0) + 1
+
+        await asyncio.gather(*[chat(n) for n in range(users)], *[log_in() for _ in range(logins)])
+    return {"p50": percentile(chat_ms, 0.5), "p99": percentile(chat_ms, 0.99),
+            "chats": len(chat_ms), "logins": login_status}
+
+
+def admin_stats(url: str) -> dict:
+    response = httpx.post(f"{url}/admin/login", data={"username": "admin", "password": "admin"}, timeout=30.0)
+    if response.status_code != 200:
+        return {}
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return httpx.get(f"{url}/admin/password-hasher/stats", headers=headers, timeout=10.0).json()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=16, help="concurrent chat clients")
+    parser.add_argument("--logins", type=int, default=32, help="concurrent login clients during the burst")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--url", help="load an already running server instead of spawning uvicorn")
+    args = parser.parse_args()
+
+    url = args.url or f"http://127.0.0.1:{args.port}"
+    server = None if args.url else start_server(1, args.port)
+    try:
+        wait_ready(url)
+        token = login(url)
+        asyncio.run(run(url, token, args.users, 0, 1.0))  # warm-up
+        idle = asyncio.run(run(url, token, args.users, 0, args.seconds))
+        burst = asyncio.run(run(url, token, args.users, args.logins, args.seconds))
+        stats = admin_stats(url)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    print(f"\n{args.users} chat clients, {args.seconds:.0f}s per run, {os.cpu_count()} CPUs\n")
+    print(f"{'run':<22}{'chat p50 ms':>12}{'chat p99 ms':>12}{'chats':>8}  logins by status")
+    for label, r in (("idle", idle), (f"{args.logins} login clients", burst)):
+        print(f"{label:<22}{r['p50']:>12.1f}{r['p99']:>12.1f}{r['chats']:>8}  {r['logins'] or '-'}")
+    if stats:
+        print(f"\npassword hasher: {stats}")
+
+
+if __name__ == "__main__":
+    main()
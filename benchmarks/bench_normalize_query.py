@@ -0,0 +1,39 @@
+"""Timing: compiled DialogueManager.normalize_query vs the str.replace loop.
+
+Uses the parity corpus from tests/test_query_normalizer.py (which checks the
+two give the same output).
+
+    python benchmarks/bench_normalize_query.py
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from tests.test_query_normalizer import corpus, query_normalizer  # noqa: E402
+
+
+def timed(fn, texts, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in texts:
+            fn(text)
+        best = min(best, time.perf_counter() - started)
+    return best / len(texts) * 1e6
+
+
+def main():
+    sample = corpus()[:2000]
+    query_normalizer.normalize.cache_clear()
+    for text in sample:
+        query_normalizer.normalize(text)
+    print(f"str.replace loop {timed(query_normalizer.normalize_sequential, sample):7.2f} µs/text")
+    print(f"compiled         {timed(query_normalizer._normalize, sample):7.2f} µs/text")
+    print(f"compiled, cached {timed(query_normalizer.normalize, sample):7.2f} µs/text")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""knowledge_base.query_db: per-thread read-only connection vs connect-per-call.
+
+Builds a throwaway extend.db with the four lookup tables, checks that the
+pooled query_db returns the same answers as the previous implementation
+(new sqlite3 connection per call plus print() of every keyword decision),
+then times both, single-threaded and from several threads.
+
+    python benchmarks/bench_query_db.py --calls 20000 --threads 4
+"""
+import argparse
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend import knowledge_base as kb  # noqa: E402
+
+TABLES = {
+    "symptoms": ("symptom_name", "description", [
+        ("headache", "Pain or discomfort in the head or scalp."),
+        ("fever", "Elevated body temperature, often with chills."),
+        ("cough", "A reflex to clear the throat or lungs."),
+        ("dizziness", "Feeling lightheaded or unsteady."),
+    ]),
+    "medications": ("condition", "medicine_name", [
+        ("fever", "Paracetamol"), ("cold", "Cetirizine"), ("headache", "Ibuprofen"),
+    ]),
+    "first_aid": ("issue", "steps", [
+        ("burn", "Cool the burn under running water for 10 minutes."),
+        ("cut", "Clean the wound and apply pressure."),
+        ("sprain", "Rest, ice, compression, elevation."),
+    ]),
+    "wellness_tips": ("topic", "tip_text", [
+        ("hydration", "Drink 8 glasses of water a day."),
+        ("sleep", "Keep a regular sleep schedule."),
+        ("stress", "Try 5 minutes of deep breathing."),
+    ]),
+}
+
+CALLS = [
+    ("symptoms", "i have a headache"), ("symptoms", "feverish since morning"),
+    ("medications", "fever"), ("medications", "something for my cold"),
+    ("first_aid", "i burned my hand"), ("first_aid", "deep cut on finger"),
+    ("wellness_tips", "how to sleep better"), ("wellness_tips", "बुखार"),
+    ("symptoms", "unknown complaint"),
+]
+
+
+def legacy_query_db(table_name: str, query_text: str) -> str:
+    """query_db before the connection pool: connect per call, print() keyword decisions."""
+    conn = None
+    try:
+        conn = sqlite3.connect(kb.db_path)
+        cursor = conn.cursor()
+        if table_name not in kb.COLUMN_MAP:
+            return "⚠️ Unknown action. No query executed."
+        column_name, keywords = kb.COLUMN_MAP[table_name]
+        keyword = kb.extract_keyword(query_text, keywords)
+        print(f"🔎 Final keyword used for DB lookup: {keyword}")
+        cursor.execute(f"SELECT * FROM {table_name} WHERE LOWER({column_name}) LIKE ?",
+                       (f"%{keyword.lower()}%",))
+        result = cursor.fetchone()
+        if result:
+            return f"{kb.RESPONSE_PREFIX[table_name]}: {result[1]}"
+        return "I didn’t quite catch that, but I’m listening. Want to try saying it another way."
+    except sqlite3.OperationalError as e:
+        return f"⚠️ Database error: {str(e)}"
+    finally:
+        if conn:
+            conn.close()
+
+
+def build_db(path: str):
+    conn = sqlite3.connect(path)
+    for table, (key, value, rows) in TABLES.items():
+        conn.execute(f"CREATE TABLE {table} ({key} TEXT PRIMARY KEY, {value} TEXT NOT NULL)")
+        conn.executemany(f"INSERT INTO {table} VALUES (?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def run(fn, calls: int, threads: int) -> float:
+    per_thread = calls // threads
+
+    def worker():
+        for i in range(per_thread):
+            fn(*CALLS[i % len(CALLS)])
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return per_thread * threads / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    kb.db_path = os.path.join(tempfile.mkdtemp(prefix="wellbot-kb-"), "extend.db")
+    build_db(kb.db_path)
+
+    # stdout goes to a buffer so the legacy print() cost is measured without flooding the terminal
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink):
+        expected = [legacy_query_db(t, q) for t, q in CALLS]
+    got = [kb.query_db(t, q) for t, q in CALLS]
+    mismatches = sum(a != b for a, b in zip(expected, got))
+    for (table, query), a, b in zip(CALLS, expected, got):
+        if a != b:
+            print(f"❌ {table} {query!r}: legacy={a!r} pooled={b!r}")
+    print(f"{len(CALLS)} lookups, {mismatches} mismatches\n")
+
+    print(f"{'implementation':<28}{'1 thread/s':>12}{f'{args.threads} threads/s':>14}")
+    for label, fn in (("connect per call + print", legacy_query_db), ("per-thread connection", kb.query_db)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            single = run(fn, args.calls, 1)
+            multi = run(fn, args.calls, args.threads)
+        print(f"{label:<28}{single:>12.0f}{multi:>14.0f}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
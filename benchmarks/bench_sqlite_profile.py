@@ -0,0 +1,176 @@
+"""Before/after benchmark for the SQLite profile in backend/db_setup.py.
+
+Builds two throwaway databases with the app schema and the same seeded rows:
+  * baseline  - plain create_engine(), rollback journal, no secondary indexes
+  * tuned     - create_sqlite_engine() pragmas + run_migrations() indexes
+and times the analytics / history queries the dashboard issues, then runs
+chat writers and dashboard readers concurrently.
+
+    python benchmarks/bench_sqlite_profile.py --rows 200000 --seconds 5
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from backend.db_setup import create_sqlite_engine, run_migrations  # noqa: E402
+from backend.main import Base  # noqa: E402
+
+USERS = [f"user{i}@example.com" for i in range(500)]
+CONDITIONS = ["Fever", "Cold", "Headache", "Cough", "Diarrhea", None, None]
+INTENTS = ["symptom_query", "first_aid", "prevention", "unknown"]
+
+READ_QUERIES = {
+    "queries today": "SELECT count(*) FROM query_logs WHERE timestamp >= :today",
+    "daily counts (7d)": (
+        "SELECT date(timestamp) AS day, count(*) FROM query_logs "
+        "WHERE date(timestamp) >= :week_ago AND date(timestamp) <= :today_d GROUP BY date(timestamp)"
+    ),
+    "unmatched (latest 100)": (
+        "SELECT * FROM query_logs WHERE matched_condition IS NULL ORDER BY timestamp DESC LIMIT 100"
+    ),
+    "user query history": (
+        "SELECT * FROM query_logs WHERE email = :email ORDER BY timestamp DESC LIMIT 50"
+    ),
+    "user chat history": (
+        "SELECT * FROM chat_logs WHERE user_id = :email ORDER BY timestamp DESC LIMIT 100"
+    ),
+    "recent chat (admin)": "SELECT * FROM chat_logs ORDER BY timestamp DESC LIMIT 200",
+    "feedback (latest 100)": "SELECT * FROM feedback ORDER BY timestamp DESC LIMIT 100",
+    "thumbs down count": "SELECT count(*) FROM feedback WHERE thumbs = 'down'",
+}
+
+
+def seed(engine, rows: int):
+    rnd = random.Random(7)
+    now = datetime.utcnow()
+
+    def ts():
+        return now - timedelta(seconds=rnd.randint(0, 90 * 24 * 3600))
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO query_logs (query_text, bot_response, timestamp, matched_condition, intent, entities, language, email) "
+            "VALUES (:q, :r, :t, :m, :i, '[]', 'en', :e)"
+        ), [dict(q=f"query {n}", r="resp", t=ts(), m=rnd.choice(CONDITIONS), i=rnd.choice(INTENTS),
+                 e=rnd.choice(USERS)) for n in range(rows)])
+        conn.execute(text(
+            "INSERT INTO chat_logs (user_id, role, message, response, timestamp, query_lang, response_lang) "
+            "VALUES (:u, 'user', :m, 'resp', :t, 'English', 'English')"
+        ), [dict(u=rnd.choice(USERS), m=f"message {n}", t=ts()) for n in range(rows)])
+        conn.execute(text(
+            "INSERT INTO feedback (query_text, response_text, thumbs, comment, sentiment, timestamp) "
+            "VALUES ('q', 'r', :th, :c, 'neutral', :t)"
+        ), [dict(th=rnd.choice(["up", "down"]), c=rnd.choice(["", "ok", "bad"]), t=ts())
+            for _ in range(rows // 10)])
+
+
+def time_reads(engine, repeat: int) -> dict:
+    now = datetime.utcnow()
+    params = {
+        "today": now.replace(hour=0, minute=0, second=0, microsecond=0),
+        "today_d": now.date().isoformat(),
+        "week_ago": (now - timedelta(days=7)).date().isoformat(),
+        "email": USERS[42],
+    }
+    results = {}
+    with engine.connect() as conn:
+        for name, sql in READ_QUERIES.items():
+            samples = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                conn.execute(text(sql), params).fetchall()
+                samples.append((time.perf_counter() - started) * 1000)
+            results[name] = statistics.median(samples)
+    return results
+
+
+def mixed_load(engine, seconds: float, writers: int, readers: int) -> dict:
+    stop = time.monotonic() + seconds
+    counts = {"writes": 0, "reads": 0, "errors": 0}
+    lock = threading.Lock()
+
+    def bump(key):
+        with lock:
+            counts[key] += 1
+
+    def writer(n):
+        while time.monotonic() < stop:
+            try:
+                with engine.begin() as conn:
+                    conn.execute(text(
+                        "INSERT INTO chat_logs (user_id, role, message, response, timestamp) "
+                        "VALUES (:u, 'user', 'hi', 'hello', :t)"
+                    ), dict(u=USERS[n % len(USERS)], t=datetime.utcnow()))
+                bump("writes")
+            except Exception:
+                bump("errors")
+
+    def reader():
+        sql = text(READ_QUERIES["user chat history"])
+        while time.monotonic() < stop:
+            try:
+                with engine.connect() as conn:
+                    conn.execute(sql, {"email": random.choice(USERS)}).fetchall()
+                    conn.execute(text(READ_QUERIES["queries today"]), {"today": datetime.utcnow().date()}).scalar()
+                bump("reads")
+            except Exception:
+                bump("errors")
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return {k: round(v / seconds, 1) if k != "errors" else v for k, v in counts.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base_url = f"sqlite:///{os.path.join(tmp, 'baseline.db')}"
+        tuned_url = f"sqlite:///{os.path.join(tmp, 'tuned.db')}"
+        baseline = create_engine(base_url, connect_args={"check_same_thread": False})
+        tuned = create_sqlite_engine(tuned_url)
+
+        print(f"Seeding {args.rows} query_logs / chat_logs rows into both databases...")
+        seed(baseline, args.rows)
+        seed(tuned, args.rows)
+        run_migrations(tuned)
+
+        before = time_reads(baseline, args.repeat)
+        after = time_reads(tuned, args.repeat)
+        print(f"\n{'query (median ms)':<28}{'baseline':>10}{'tuned':>10}{'speedup':>10}")
+        for name in READ_QUERIES:
+            speedup = before[name] / after[name] if after[name] else float("inf")
+            print(f"{name:<28}{before[name]:>10.2f}{after[name]:>10.2f}{speedup:>9.1f}x")
+
+        print(f"\nMixed load: {args.writers} writers + {args.readers} readers for {args.seconds}s")
+        for label, engine in (("baseline", baseline), ("tuned", tuned)):
+            result = mixed_load(engine, args.seconds, args.writers, args.readers)
+            print(f"  {label:<9} writes/s={result['writes']:<9} reads/s={result['reads']:<9} "
+                  f"lock errors={result['errors']}")
+        baseline.dispose()
+        tuned.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Accuracy / latency / memory comparison of the intent model runtimes.
+
+Scores data_structured/intent_dataset.jsonl with PyTorch fp32, ONNX fp32 and
+ONNX int8 (see backend/export_onnx.py). Each runtime runs in its own process
+so peak RSS is comparable. Reports exact-match accuracy and micro-F1 against
+the dataset labels, label agreement with PyTorch fp32, single-query p50/p99
+latency and peak resident memory, as a Markdown table.
+
+    python -m backend.export_onnx
+    python benchmarks/compare_intent_runtimes.py --out benchmarks/intent_runtimes.md
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+DATASET = os.path.join(ROOT, "data_structured", "intent_dataset.jsonl")
+
+
+def load_dataset():
+    with open(DATASET, "r", encoding="utf-8") as f:
+        samples = [json.loads(line) for line in f if line.strip()]
+    rows = []
+    for s in samples:
+        intent = s.get("intent")
+        labels = intent if isinstance(intent, list) else [l.strip() for l in str(intent or "").split(",")]
+        rows.append((str(s["text"]).strip(), {l for l in labels if l}))
+    return rows
+
+
+def worker(runtime: str, model_dir: str, threshold: float, repeat: int):
+    from backend.intent_classifier import IntentClassifier
+
+    classifier = IntentClassifier(model_dir=model_dir, runtime=runtime, device="cpu")
+    started = time.perf_counter()
+    classifier.load()
+    load_ms = (time.perf_counter() - started) * 1000
+    rows = load_dataset()
+    texts = [text for text, _ in rows]
+
+    predictions = [sorted(l for l, p in scores.items() if p > threshold)
+                   for scores in classifier.score_many(texts)]
+
+    latencies = []
+    for _ in range(repeat):
+        for text in texts:
+            t = time.perf_counter()
+            classifier.score_batch([text])
+            latencies.append((time.perf_counter() - t) * 1000)
+    latencies.sort()
+    print(json.dumps({
+        "runtime": runtime,
+        "labels": classifier.labels,
+        "predictions": predictions,
+        "load_ms": load_ms,
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def score(rows, labels, predictions):
+    known = set(labels)
+    tp = fp = fn = exact = 0
+    for (_, gold), pred in zip(rows, predictions):
+        gold = gold & known
+        pred = set(pred)
+        tp += len(gold & pred)
+        fp += len(pred - gold)
+        fn += len(gold - pred)
+        exact += gold == pred
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return exact / len(rows), f1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runtimes", default="torch,onnx,onnx-int8")
+    parser.add_argument("--model-dir", default=os.path.join(ROOT, "backend", "intent_model_multi"))
+    parser.add_argument("--threshold", type=float, default=0.3)
+    parser.add_argument("--repeat", type=int, default=3, help="latency passes over the dataset")
+    parser.add_argument("--out", help="also write the Markdown report to this path")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker, args.model_dir, args.threshold, args.repeat)
+        return
+
+    rows = load_dataset()
+    results = {}
+    for runtime in args.runtimes.split(","):
+        proc = subprocess.run(
+            [sys.executable, __file__, "--worker", runtime, "--model-dir", args.model_dir,
+             "--threshold", str(args.threshold), "--repeat", str(args.repeat)],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            print(f"⚠️ {runtime} failed: {proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else proc.returncode}")
+            continue
+        results[runtime] = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    if not results:
+        return
+    reference = results.get("torch")
+    lines = [
+        f"Intent runtimes on {os.path.relpath(DATASET, ROOT)} ({len(rows)} texts, threshold {args.threshold}, CPU)",
+        "",
+        "| runtime | exact match | micro-F1 | agrees w/ torch | p50 ms | p99 ms | load ms | peak RSS MB |",
+        "|---|---|---|---|---|---|---|---|",
+    ]
+    for runtime, r in results.items():
+        exact, f1 = score(rows, r["labels"], r["predictions"])
+        agree = "-"
+        if reference:
+            same = sum(a == b for a, b in zip(reference["predictions"], r["predictions"]))
+            agree = f"{same / len(rows):.1%}"
+        lines.append(f"| {runtime} | {exact:.1%} | {f1:.3f} | {agree} | {r['p50']:.1f} | {r['p99']:.1f} "
+                     f"| {r['load_ms']:.0f} | {r['peak_rss_mb']:.0f} |")
+    report = "\n".join(lines)
+    print(report)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""HTTP load test for POST /respond across uvicorn worker counts.
+
+For each --workers value, starts `uvicorn backend.main:app --workers N`
+from the repo root, registers a load-test user, then runs --users
+concurrent clients posting /respond back to back for --seconds. Prints
+throughput, p50/p99 latency, failed requests (non-200 or an
+"Internal error" reply) and scaling efficiency vs the 1-worker run
+(rps / (rps_1 * N)). Expect near-linear scaling only while N <= CPU cores.
+
+    python benchmarks/load_respond.py --workers 1,2,4 --users 64 --seconds 10
+    python benchmarks/load_respond.py --url http://localhost:8000   # existing server
+
+The server writes chat/query logs to backend/wellness.db; run it on a
+scratch copy of the database.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+QUERIES = [
+    "I have a headache",
+    "what tablet is good for fever?",
+    "give me a wellness tip for better sleep",
+    "I burned my hand, what should I do?",
+    "my finger is bleeding",
+    "I feel dizzy and tired",
+    "hello",
+    "I feel anxious and stressed",
+]
+
+USER = {"email": "loadtest@example.com", "full_name": "Load Test", "age": 30,
+        "language": "English", "password": "loadtest-password"}
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    env = dict(os.environ, WELLBOT_INTENT_BACKEND=os.getenv("WELLBOT_INTENT_BACKEND", "rules"))
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.main:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=ROOT, env=env,
+    )
+
+
+def wait_ready(url: str, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{url}/kb/categories", timeout=1.0).status_code < 500:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.25)
+    raise RuntimeError(f"server at {url} did not come up")
+
+
+def login(url: str) -> str:
+    httpx.post(f"{url}/register", json=USER, timeout=10.0)  # 400 if it already exists
+    response = httpx.post(f"{url}/token", json={"email": USER["email"], "password": USER["password"]},
+                          timeout=10.0)
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def run_load(url: str, token: str, users: int, seconds: float) -> dict:
+    latencies = []
+    failures = 0
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async with httpx.AsyncClient(base_url=url, headers=headers, limits=limits, timeout=30.0) as client:
+        deadline = time.monotonic() + seconds
+
+        async def user(n: int):
+            nonlocal failures
+            i = n
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.post("/respond", json={"text": QUERIES[i % len(QUERIES)]})
+                    ok = response.status_code == 200 and "Internal error" not in response.json()["response"]
+                except httpx.HTTPError:
+                    ok = False
+                latencies.append((time.perf_counter() - started) * 1000)
+                failures += not ok
+                i += 1
+
+        started = time.monotonic()
+        await asyncio.gather(*(user(n) for n in range(users)))
+        elapsed = time.monotonic() - started
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies) if latencies else 0.0,
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] if latencies else 0.0,
+        "requests": len(latencies),
+        "failures": failures,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4", help="comma-separated uvicorn worker counts")
+    parser.add_argument("--users", type=int, default=64, help="concurrent clients")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--url", help="load an already running server instead of spawning uvicorn")
+    args = parser.parse_args()
+
+    runs = []
+    if args.url:
+        token = login(args.url)
+        asyncio.run(run_load(args.url, token, args.users, 1.0))  # warm-up
+        runs.append(("-", asyncio.run(run_load(args.url, token, args.users, args.seconds))))
+    else:
+        for workers in [int(w) for w in args.workers.split(",")]:
+            url = f"http://127.0.0.1:{args.port}"
+            server = start_server(workers, args.port)
+            try:
+                wait_ready(url)
+                token = login(url)
+                asyncio.run(run_load(url, token, args.users, 1.0))  # warm-up
+                runs.append((workers, asyncio.run(run_load(url, token, args.users, args.seconds))))
+            finally:
+                server.terminate()
+                server.wait(timeout=30)
+
+    print(f"\n{args.users} concurrent users, {args.seconds:.0f}s per run, {os.cpu_count()} CPUs\n")
+    print(f"{'workers':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'requests':>10}{'failed':>8}{'scaling':>9}")
+    base = runs[0][1]["rps"] if runs else 0.0
+    for workers, r in runs:
+        scaling = f"{r['rps'] / (base * workers):.0%}" if isinstance(workers, int) and base else "-"
+        print(f"{workers:>8}{r['rps']:>10.0f}{r['p50']:>10.1f}{r['p99']:>10.1f}{r['requests']:>10}"
+              f"{r['failures']:>8}{scaling:>9}")
+    sys.exit(1 if any(r["failures"] for _, r in runs) else 0)
+
+
+if __name__ == "__main__":
+    main()
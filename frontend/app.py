@@ -4,16 +4,17 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
-from googletrans import Translator
 import time
-from functools import lru_cache
+import os
+import sys
+# Shared fuzzy index lives in the backend package (repo root); difflib is the fallback
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
-    from deep_translator import GoogleTranslator as DeepGoogleTranslator
+    from backend.fuzzy_index import FuzzyIndex
 except Exception:
-    DeepGoogleTranslator = None
+    FuzzyIndex = None
 
 API_URL = API_URL = "http://127.0.0.1:8000"
-translator = Translator()
 
 # -----------------------
 # Cached fetch helpers
@@ -28,6 +29,34 @@ def cached_query_trends(days: int, headers: dict):
         pass
     return []
 
+@st.cache_resource(show_spinner=False)
+def dashboard_etags():
+    """Authorization header -> (ETag, body) of the last /admin/dashboard response (kept across reruns)."""
+    return {}
+
+@st.cache_data(ttl=15, show_spinner=False)
+def cached_admin_dashboard(headers: dict):
+    """Every admin overview metric in one request; after the TTL it revalidates with If-None-Match.
+
+    Raises on failure: st.cache_data does not cache exceptions, so the next rerun retries
+    instead of showing cached zeros for the TTL.
+    """
+    etags = dashboard_etags()
+    key = headers.get("Authorization", "")
+    req_headers = dict(headers)
+    last = etags.get(key)
+    if last:
+        req_headers["If-None-Match"] = last[0]
+    res = requests.get(f"{API_URL}/admin/dashboard", headers=req_headers, timeout=10)
+    if res.status_code == 304 and last:
+        return last[1]
+    if res.status_code != 200:
+        raise RuntimeError(f"HTTP {res.status_code}")
+    data = res.json()
+    if res.headers.get("ETag"):
+        etags[key] = (res.headers["ETag"], data)
+    return data
+
 def localize_dates(date_list, lang):
     if lang != "Hindi":
         return date_list
@@ -58,85 +87,160 @@ def localize_dates(date_list, lang):
             localized.append(d)
     return localized
 
+@st.cache_resource(show_spinner=False)
+def condition_fuzzy_index(names: tuple):
+    return FuzzyIndex(names)
+
 # -----------------------
 # Dynamic Translation Function
 # -----------------------
-@lru_cache(maxsize=5000)
-def _auto_translate_cached(text: str, dest: str) -> str:
-    """Internal cached auto translation using googletrans first, then deep_translator.
-    This reduces repeated network calls for the same UI strings.
-    """
-    if not text:
-        return text
-    # Try primary googletrans instance (already instantiated as 'translator')
+# Curated strings (data_structured/ui_translations_hi.json) are available offline; everything else
+# comes from the backend's persistent translation cache via one /translate/batch call per page.
+try:
+    from backend.translation_service import load_curated
+    CURATED_TRANSLATIONS = load_curated()
+except Exception:
+    CURATED_TRANSLATIONS = {}
+
+@st.cache_resource(show_spinner=False)
+def load_ui_catalog():
+    """Prebuilt message catalog (python -m backend.ui_catalog), loaded once per Streamlit server process."""
     try:
-        return translator.translate(text, dest=dest).text
+        from backend.ui_catalog import UICatalog
+        return UICatalog.load()
     except Exception:
-        pass
-    # Fallback: deep_translator if available
-    if DeepGoogleTranslator is not None:
+        return None
+
+ui_catalog = load_ui_catalog()
+
+UI_LANG_CODES = {"Hindi": "hi"}
+TRANSLATE_BATCH_LIMIT = 1000      # backend MAX_TRANSLATE_BATCH: larger requests get 400
+TRANSLATE_RETRY_AFTER = 2.0       # re-ask for strings the backend was still translating
+TRANSLATE_REJECT_BACKOFF = 300.0  # don't resend strings the backend refused for this long
+USER_TRANSLATIONS_MAX = 5000      # per-session user-content translations (like the backend's transient map)
+USER_TRANSLATIONS_TTL = 3600.0
+
+@st.cache_resource(show_spinner=False)
+def translation_state():
+    """UI-string translation state shared by every session and rerun of this Streamlit process
+    (module globals are re-created on each rerun). User content never goes in here."""
+    return {
+        "translations": {},  # (code, text) -> translation
+        "requested": {},     # (code, text) sent to the backend -> monotonic time it may be sent again
+        "unsent": {},        # (code, text) missed by translate() and not sent yet
+    }
+
+_ui_state = translation_state()
+_ui_translations = _ui_state["translations"]
+_ui_requested = _ui_state["requested"]
+_ui_unsent = _ui_state["unsent"]
+
+def _user_translation_state():
+    """persist=False translations (user queries, comments, answers): this session only, bounded, expiring."""
+    if "_ui_user_translations" not in st.session_state:
+        st.session_state["_ui_user_translations"] = {}  # (code, text) -> (translation, expires_at)
+        st.session_state["_ui_user_requested"] = {}     # (code, text) -> monotonic time it may be sent again
+    return st.session_state["_ui_user_translations"], st.session_state["_ui_user_requested"]
+
+def _bound(store: dict, limit: int = USER_TRANSLATIONS_MAX):
+    # dicts keep insertion order: the first entries are the oldest
+    while len(store) > limit:
+        del store[next(iter(store))]
+
+def _translation_headers():
+    # Without a token the backend only translates catalog/curated strings
+    token = st.session_state.get("admin_token") or st.session_state.get("token")
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+def _fetch_translations(texts, code, persist=True):
+    """/translate/batch in chunks of at most TRANSLATE_BATCH_LIMIT. Texts still pending on the server are
+    re-asked after TRANSLATE_RETRY_AFTER; a chunk the server rejects is not resent for TRANSLATE_REJECT_BACKOFF."""
+    translations, requested = (_ui_translations, _ui_requested) if persist else _user_translation_state()
+    for i in range(0, len(texts), TRANSLATE_BATCH_LIMIT):
+        chunk = texts[i:i + TRANSLATE_BATCH_LIMIT]
+        retry_at = time.monotonic() + TRANSLATE_RETRY_AFTER
         try:
-            return DeepGoogleTranslator(source="auto", target=dest).translate(text)
+            res = requests.post(f"{API_URL}/translate/batch", json={"texts": chunk, "lang": code, "persist": persist},
+                                headers=_translation_headers(), timeout=3)
+            results = res.json().get("translations", []) if res.status_code == 200 else None
         except Exception:
-            pass
-    # Last resort: return original
-    return text
+            results = None
+        if results is None:
+            retry_at = time.monotonic() + TRANSLATE_REJECT_BACKOFF
+            results = []
+        expires = time.monotonic() + USER_TRANSLATIONS_TTL
+        for text in chunk:
+            requested.pop((code, text), None)
+            requested[(code, text)] = retry_at
+        for text, translated in zip(chunk, results):
+            if translated:
+                requested.pop((code, text), None)
+                translations[(code, text)] = translated if persist else (translated, expires)
+        if not persist:
+            _bound(translations)
+            _bound(requested)
+
+def flush_translations(lang, retry: bool = True) -> int:
+    """Send the strings translate() missed and (retry=True) re-ask for those whose retry time has come,
+    in as few /translate/batch calls as the batch limit allows. Returns how many got resolved."""
+    code = UI_LANG_CODES.get(lang)
+    if not code:
+        return 0
+    user_translations, user_requested = _user_translation_state()
+    batch = {True: {}, False: {}}
+    for key in list(_ui_unsent):
+        if key[0] == code:
+            _ui_unsent.pop(key, None)
+            batch[True][key[1]] = None
+    if retry:
+        now = time.monotonic()
+        for persist, requested in ((True, _ui_requested), (False, user_requested)):
+            for key, retry_at in list(requested.items()):
+                if key[0] == code and retry_at <= now:
+                    batch[persist][key[1]] = None
+    before = len(_ui_translations) + len(user_translations)
+    for persist, texts in batch.items():
+        if texts:
+            _fetch_translations(list(texts), code, persist)
+    return max(0, len(_ui_translations) + len(user_translations) - before)
+
+def _known_translation(text, code):
+    hit = ui_catalog.get(text, code) if ui_catalog is not None else None
+    hit = hit or CURATED_TRANSLATIONS.get(code, {}).get(text) or _ui_translations.get((code, text))
+    if hit:
+        return hit
+    user = _user_translation_state()[0].get((code, text))
+    return user[0] if user and user[1] > time.monotonic() else None
+
+def translate_many(texts, lang, persist=True):
+    """Translate a list of UI strings with as few backend calls as the batch limit allows; unresolved
+    ones stay English.
+
+    persist=False for user content: neither the backend cache nor this process keeps it beyond the session.
+    """
+    code = UI_LANG_CODES.get(lang)
+    if not code:
+        return list(texts)
+    requested = _ui_requested if persist else _user_translation_state()[1]
+    new = [t for t in dict.fromkeys(texts)
+           if t and not _known_translation(t, code) and (code, t) not in requested]
+    if new:
+        _fetch_translations(new, code, persist)
+    return [_known_translation(t, code) or t for t in texts]
 
 def translate(text, lang):
-    # Custom curated overrides for critical UX phrases (more reliable than MT)
-    hindi_fallback = {
-        "This email is already registered. Please login instead.": "यह ईमेल पहले से पंजीकृत है। कृपया लॉगिन करें।",
-        "Registration successful!": "पंजीकरण सफल रहा!",
-    "Registration successful! Please login.": "पंजीकरण सफल रहा! कृपया लॉगिन करें।",
-        "Login successful!": "लॉगिन सफल रहा!",
-    "Login successful! Please view your profile.": "लॉगिन सफल रहा! कृपया अपनी प्रोफ़ाइल देखें।",
-    "Email already registered. Login successful! Redirecting to profile...": "ईमेल पहले से पंजीकृत है। लॉगिन सफल! प्रोफ़ाइल पर ले जाया जा रहा है...",
-        "⚠ This email is already registered. Please login instead.": "⚠ यह ईमेल पहले से पंजीकृत है। कृपया लॉगिन करें।",
-        "⚠ No account found with this email. Please register first.": "⚠ इस ईमेल से कोई खाता नहीं मिला। कृपया पहले पंजीकरण करें।",
-        "⚠ Incorrect password. Please try again or reset it.": "⚠ पासवर्ड गलत है। कृपया पुनः प्रयास करें या इसे रीसेट करें।",
-        "Profile updated successfully.": "प्रोफ़ाइल सफलतापूर्वक अपडेट की गई।",
-        "Password must be at least 6 characters.": "पासवर्ड कम से कम 6 अक्षरों का होना चाहिए।",
-        "Email and password cannot be empty.": "ईमेल और पासवर्ड खाली नहीं हो सकते।",
-        "Please login first.": "कृपया पहले लॉगिन करें।",
-        "Failed to fetch profile. Please login again.": "प्रोफ़ाइल प्राप्त करने में विफल। कृपया पुनः लॉगिन करें।",
-        "Wellness Tips for You": "आपके लिए वेलनेस टिप्स",
-        "Wellness Tips": "वेलनेस टिप्स",
-        "Stay hydrated.": "पानी पीते रहें।",
-        "Exercise regularly.": "नियमित व्यायाम करें।",
-        "Eat balanced meals.": "संतुलित भोजन करें।",
-        "Your Profile Details": "आपकी प्रोफ़ाइल जानकारी",
-        "Profile Overview": "प्रोफ़ाइल अवलोकन",
-        "Logout successful.": "आप सफलतापूर्वक लॉगआउट हो गए हैं।",
-        "Password reset successful.": "पासवर्ड रीसेट सफल रहा।",
-        "Registration failed": "पंजीकरण विफल रहा।",
-        "Login failed": "लॉगिन विफल रहा।",
-        "Failed to update profile.": "प्रोफ़ाइल अपडेट करने में विफल।",
-        "Password reset failed": "पासवर्ड रीसेट विफल रहा।",
-        "Feedback submitted successfully.": "प्रतिक्रिया सफलतापूर्वक सबमिट की गई।",
-        "Failed to submit feedback.": "प्रतिक्रिया सबमिट करने में विफल।",
-        "Add New Entry": "नई प्रविष्टि जोड़ें",
-        "Edit/Delete Existing Entry": "मौजूदा प्रविष्टि संपादित/हटाएं",
-        "Entry added (demo only)": "प्रविष्टि जोड़ी गई (डेमो के लिए)",
-        "Admin login successful!": "एडमिन लॉगिन सफल रहा!",
-        "Invalid admin credentials.": "अमान्य एडमिन क्रेडेंशियल्स।",
-        "Failed to fetch KB entries.": "KB प्रविष्टियाँ प्राप्त करने में विफल।",
-        "Total Users": "कुल उपयोगकर्ता",
-        "Unmatched Queries Today": "आज की अप्रयुक्त क्वेरीज़",
-        "Top 10 Questions": "शीर्ष 10 प्रश्न",
-        "Positive Feedback %": "सकारात्मक प्रतिक्रिया %",
-        "Negative Feedback %": "नकारात्मक प्रतिक्रिया %",
-        "Top Feedbacks": "शीर्ष प्रतिक्रियाएँ",
-        "Unmatched Queries": "अप्रयुक्त क्वेरीज़",
-        "Expand your KB by reviewing these queries.": "इन क्वेरीज़ की समीक्षा करके अपना KB बढ़ाएँ।"
-    }
-    if lang == "Hindi":
-        if text in hindi_fallback:
-            return hindi_fallback[text]
-        # Use cached auto translation pipeline
-        return _auto_translate_cached(text, "hi")
+    """Single label: catalog/cache lookup only. A miss renders in English and is sent with the rest of
+    the page's misses by flush_translations() at the end of the run."""
+    code = UI_LANG_CODES.get(lang)
+    if not code or not text:
+        return text
+    hit = _known_translation(text, code)
+    if hit is not None:
+        return hit
+    if (code, text) not in _ui_requested:
+        _ui_unsent[(code, text)] = True
     return text
 
-
 # Top-level language detection helper used across the app
 def detect_lang_from_text(text: str) -> str:
     """Return 'Hindi' if text contains Devanagari characters, else 'English'."""
@@ -149,25 +253,32 @@ def detect_lang_from_text(text: str) -> str:
 # -----------------------
 # Helpers: Content Translation for Tables
 # -----------------------
-def translate_text_for_display(text: str, lang: str):
-    """Translate a single string to Hindi for display if needed.
-    Skips if already contains Devanagari characters or is obviously non-linguistic.
+def _display_candidate(text):
+    """Stripped text if it is worth translating for display, else None.
+    Skips text that already contains Devanagari characters or is obviously non-linguistic.
     """
-    if lang != "Hindi" or not isinstance(text, str):
-        return text
-
-
+    if not isinstance(text, str):
+        return None
     t = text.strip()
     if not t:
-        return text
+        return None
     # Skip if already Hindi (has Devanagari)
     if any('\u0900' <= ch <= '\u097F' for ch in t):
-        return text
+        return None
     # Skip very short tokens or emails / URLs
     lower_t = t.lower()
     if '@' in lower_t or lower_t.startswith('http'):
-        return text
+        return None
     if len(t) < 3:
+        return None
+    return t
+
+def translate_text_for_display(text: str, lang: str):
+    """Translate a single string to Hindi for display if needed."""
+    if lang != "Hindi":
+        return text
+    t = _display_candidate(text)
+    if t is None:
         return text
     try:
         return translate(t, lang)
@@ -181,12 +292,23 @@ def localize_dataframe_content(df: pd.DataFrame, lang: str, columns: list):
     if df is None or df.empty:
         return df
     df_loc = df.copy()
+    columns = [col for col in columns if col in df_loc.columns]
+    # One batch translation for every distinct cell instead of a call per cell
+    try:
+        candidates = {}
+        for col in columns:
+            for v in df_loc[col].astype(str).unique():
+                t = _display_candidate(v)
+                if t is not None:
+                    candidates[v] = t
+        mapping = dict(zip(candidates, translate_many(list(candidates.values()), lang, persist=False)))
+    except Exception:
+        return df_loc
     for col in columns:
-        if col in df_loc.columns:
-            try:
-                df_loc[col] = df_loc[col].astype(str).apply(lambda v: translate_text_for_display(v, lang))
-            except Exception:
-                pass
+        try:
+            df_loc[col] = df_loc[col].astype(str).map(lambda v: mapping.get(v, v))
+        except Exception:
+            pass
     return df_loc
 
 # -----------------------
@@ -264,6 +386,8 @@ DEFAULT_SESSION = {
 for k, v in DEFAULT_SESSION.items():
     if k not in st.session_state:
         st.session_state[k] = v
+# Misses left over from a run that stopped early, plus strings the backend was still translating
+flush_translations(st.session_state.language)
 # -----------------------
 # Sidebar Setup
 # -----------------------
@@ -298,22 +422,24 @@ if lang_choice != st.session_state.language:
     st.rerun()
 
 # ✅ Now build the menu
+# Routing uses stable page keys; labels are translated only for display
+PAGE_LABELS = {
+    "home": "Home",
+    "register": "Register",
+    "login": "Login",
+    "profile": "Profile",
+    "chatbot": "Chatbot",
+    "logout": "Logout",
+    "admin": "Admin",
+}
+
 def build_menu():
-    lang = st.session_state.language
-    home = translate("Home", lang)
-    register = translate("Register", lang)
-    login = translate("Login", lang)
-    profile = translate("Profile", lang)
-    logout = translate("Logout", lang)
-    chatbot = translate("Chatbot", lang)
-    admin_lbl = translate("Admin", lang)
-    items = [home]
+    items = ["home"]
     if not st.session_state.get("token"):
-        items += [register, login, chatbot]
+        items += ["register", "login", "chatbot"]
     else:
-        items += [profile, chatbot, logout]
-    if admin_lbl not in items:
-        items.append(admin_lbl)
+        items += ["profile", "chatbot", "logout"]
+    items.append("admin")
     return items
 
 menu = build_menu()
@@ -323,8 +449,14 @@ if st.session_state.get("pending_redirect"):
     st.session_state.menu_choice = st.session_state.pending_redirect
     st.session_state.pending_redirect = None
     st.rerun()
+# Page no longer offered (login state changed) or a pre-page-key label: fall back to the first page
+if st.session_state.get("menu_choice") not in menu and "menu_choice" in st.session_state:
+    del st.session_state["menu_choice"]
 
-choice = st.sidebar.selectbox(translate("📌 Menu", st.session_state.language), menu, key="menu_choice")
+choice = st.sidebar.selectbox(
+    translate("📌 Menu", st.session_state.language), menu, key="menu_choice",
+    format_func=lambda page: translate(PAGE_LABELS[page], st.session_state.language),
+)
 
 # -----------------------
 # Clean box component
@@ -340,7 +472,7 @@ def clean_box(title, content_lines):
 # -----------------------
 # Home Page
 # -----------------------
-if choice == translate("Home", st.session_state.language):
+if choice == "home":
     st.title(translate("Welcome to WellBot", st.session_state.language))
     st.markdown(f"### {translate('🌿 Daily Affirmation', st.session_state.language)}")
     st.success(translate("You are strong, capable, and worthy of wellness.", st.session_state.language))
@@ -349,7 +481,7 @@ if choice == translate("Home", st.session_state.language):
 
 # -----------------------
 # Registration
-elif choice == translate("Register", st.session_state.language):
+elif choice == "register":
     st.subheader(translate("Register", st.session_state.language))
     # If already logged in, don't auto-redirect; inform user.
     if st.session_state.get("token"):
@@ -357,7 +489,7 @@ elif choice == translate("Register", st.session_state.language):
         go_col1, go_col2 = st.columns(2)
         with go_col1:
             if st.button(translate("Go to Profile", st.session_state.language)):
-                st.session_state.menu_choice = translate("Profile", st.session_state.language)
+                st.session_state.menu_choice = "profile"
                 st.rerun()
         with go_col2:
             if st.button(translate("Logout", st.session_state.language)):
@@ -395,18 +527,18 @@ elif choice == translate("Register", st.session_state.language):
                     st.session_state.language = preserved_lang
                     st.session_state.email = norm_email
                     st.success(translate("Registration successful! Please login.", st.session_state.language))
-                    st.session_state.pending_redirect = translate("Login", st.session_state.language)
+                    st.session_state.pending_redirect = "login"
                     st.rerun()
                 elif res.status_code == 400 and res.json().get("detail") == "User already exists":
                     st.info(translate("⚠ This email is already registered. Please login instead.", st.session_state.language))
-                    st.session_state.pending_redirect = translate("Login", st.session_state.language)
+                    st.session_state.pending_redirect = "login"
                     st.rerun()
                 else:
                     st.error(res.json().get("detail", translate("Registration failed", language)))
 
 #------------------------
 # Login
-elif choice == translate("Login", st.session_state.language):
+elif choice == "login":
 
     st.subheader(translate("Login", st.session_state.language))
     with st.form("login_form", clear_on_submit=False):
@@ -427,7 +559,7 @@ elif choice == translate("Login", st.session_state.language):
                     lang = st.session_state.language
                     st.success(translate("Login successful! Please view your profile.", lang))
                     # Redirect user to Profile after short delay
-                    st.session_state.pending_redirect = translate("Profile", st.session_state.language)
+                    st.session_state.pending_redirect = "profile"
                     time.sleep(0.4)
                     st.rerun()
                 else:
@@ -446,7 +578,7 @@ elif choice == translate("Login", st.session_state.language):
 
 # -----------------------
 # Profile
-elif choice == translate("Profile", st.session_state.language):
+elif choice == "profile":
     if not st.session_state.token:
         st.warning(translate("⚠ Please login first.", st.session_state.language))
     else:
@@ -659,7 +791,7 @@ elif choice == translate("Profile", st.session_state.language):
 
 # -----------------------
 # Logout (only appears when logged in due to dynamic menu)
-elif choice == translate("Logout", st.session_state.language):
+elif choice == "logout":
     preserved_lang = st.session_state.get("language", "English")
     for key in DEFAULT_SESSION:
         st.session_state[key] = DEFAULT_SESSION[key]
@@ -669,17 +801,17 @@ elif choice == translate("Logout", st.session_state.language):
 
 # -----------------------
 # Chatbot Interface
-elif choice == translate("Chatbot", st.session_state.language):
+elif choice == "chatbot":
     if not st.session_state.get("token"):
         st.warning(translate("Please login to use the chatbot.", st.session_state.language))
         c1, c2 = st.columns(2)
         with c1:
             if st.button(translate("Go to Login", st.session_state.language)):
-                st.session_state.menu_choice = translate("Login", st.session_state.language)
+                st.session_state.menu_choice = "login"
                 st.rerun()
         with c2:
             if st.button(translate("Register", st.session_state.language)):
-                st.session_state.menu_choice = translate("Register", st.session_state.language)
+                st.session_state.menu_choice = "register"
                 st.rerun()
         st.stop()
     import difflib
@@ -820,12 +952,18 @@ elif choice == translate("Chatbot", st.session_state.language):
             if st.session_state.known_conditions:
                 # Map lower-case -> original for case recovery
                 lower_map = {c.lower(): c for c in st.session_state.known_conditions if isinstance(c, str)}
-                matches = difflib.get_close_matches(
-                    orig_query.lower(),
-                    list(lower_map.keys()),
-                    n=1,
-                    cutoff=float(st.session_state.get("fuzzy_cutoff", 0.75))
-                )
+                cutoff = float(st.session_state.get("fuzzy_cutoff", 0.75))
+                if FuzzyIndex is not None:
+                    matches = condition_fuzzy_index(tuple(lower_map.keys())).close_matches(
+                        orig_query.lower(), n=1, cutoff=cutoff
+                    )
+                else:
+                    matches = difflib.get_close_matches(
+                        orig_query.lower(),
+                        list(lower_map.keys()),
+                        n=1,
+                        cutoff=cutoff
+                    )
                 if matches:
                     best_match = lower_map[matches[0]]
             st.session_state.last_query = best_match
@@ -1185,7 +1323,7 @@ def show_kb_management(T):
     kb_form(edit_data=st.session_state.edit_mode)
 
 # --- Admin Dashboard Block ---
-if choice == translate("Admin", st.session_state.language):
+if choice == "admin":
     st.title(translate("Admin Dashboard", st.session_state.language))
     # --- Early login gate BEFORE creating tabs ---
     if not st.session_state.admin_logged_in:
@@ -1268,71 +1406,55 @@ if choice == translate("Admin", st.session_state.language):
     with tabs[overview_idx]:
         st.header(translate("Overview", st.session_state.language))
         headers = _auth_headers()
-        colA1, colA2, colA3, colA4, colA5 = st.columns(5)
-        with colA1:
-            try:
-                r = requests.get(f"{API_URL}/analytics/total-users", headers=headers)
-                total_users = r.json().get("total_users", 0) if r.status_code == 200 else 0
-            except Exception:
-                total_users = 0
-            st.metric(translate("Total Users", st.session_state.language), total_users)
-        with colA2:
-            try:
-                r = requests.get(f"{API_URL}/analytics/health-topics", headers=headers)
-                health_topics = r.json().get("health_topics", 0) if r.status_code == 200 else 0
-            except Exception:
-                health_topics = 0
-            st.metric(translate("Health Topics", st.session_state.language), health_topics)
-        with colA3:
-            try:
-                fb_stats_inline = requests.get(f"{API_URL}/feedback/stats").json()
-            except Exception:
-                fb_stats_inline = {}
-            pos_pct_inline = f"{fb_stats_inline.get('positive',0) / max(fb_stats_inline.get('total',1),1) * 100:.1f}%"
-            st.metric(translate("Positive Feedback %", st.session_state.language), pos_pct_inline)
-        with colA4:
-            try:
-                q = requests.get(f"{API_URL}/analytics/total-queries", headers=headers)
-                total_queries = q.json().get("total_queries", 0) if q.status_code == 200 else 0
-            except Exception:
-                total_queries = 0
-            st.metric(translate("Queries Handled", st.session_state.language), total_queries)
-        with colA5:
-            try:
-                unmatched = requests.get(f"{API_URL}/analytics/unmatched", headers=headers).json()
-            except Exception:
-                unmatched = []
-            st.metric(translate("Unmatched Queries Today", st.session_state.language), len(unmatched) if isinstance(unmatched, list) else 0)
-        # Quick trend sparkline
-        with st.expander(translate("Recent Query Volume (last 7 days)", st.session_state.language), expanded=True):
-            trends7 = cached_query_trends(7, headers)
-            if isinstance(trends7, list) and trends7:
-                df7 = pd.DataFrame(trends7)
-                # Use localized x-axis labels for Hindi instead of default English date strings
-                try:
-                    x_labels7 = localize_dates(df7['day'].tolist(), st.session_state.language)
-                except Exception:
-                    x_labels7 = df7['day'].tolist()
-                fig7 = go.Figure()
-                fig7.add_trace(go.Scatter(
-                    x=x_labels7,
-                    y=df7['count'],
-                    mode='lines+markers',
-                    line=dict(color='#2563eb', width=3),
-                    marker=dict(size=6)
-                ))
-                fig7.update_layout(
-                    height=220,
-                    margin=dict(t=10,l=40,r=20,b=40),
-                    xaxis_title=translate('Day', st.session_state.language),
-                    yaxis_title=translate('Queries', st.session_state.language),
-                    plot_bgcolor='white'
-                )
-                fig7.update_xaxes(showgrid=False)
-                fig7.update_yaxes(showgrid=True, gridcolor='#f1f5f9')
-                st.plotly_chart(fig7, use_container_width=True)
-            else:
-                st.caption(translate("Not enough data for trend.", st.session_state.language))
+        try:
+            dashboard = cached_admin_dashboard(headers)
+        except Exception as e:
+            dashboard = None
+            st.error(translate("Failed to load dashboard metrics:", st.session_state.language) + f" {e}")
+        if dashboard is not None:
+            colA1, colA2, colA3, colA4, colA5 = st.columns(5)
+            with colA1:
+                st.metric(translate("Total Users", st.session_state.language), dashboard.get("total_users", 0))
+            with colA2:
+                st.metric(translate("Health Topics", st.session_state.language), dashboard.get("health_topics", 0))
+            with colA3:
+                fb_stats_inline = dashboard.get("feedback", {})
+                pos_pct_inline = f"{fb_stats_inline.get('positive',0) / max(fb_stats_inline.get('total',1),1) * 100:.1f}%"
+                st.metric(translate("Positive Feedback %", st.session_state.language), pos_pct_inline)
+            with colA4:
+                st.metric(translate("Queries Handled", st.session_state.language), dashboard.get("total_queries", 0))
+            with colA5:
+                st.metric(translate("Unmatched Queries Today", st.session_state.language), dashboard.get("unmatched_today", 0))
+            # Quick trend sparkline
+            with st.expander(translate("Recent Query Volume (last 7 days)", st.session_state.language), expanded=True):
+                trends7 = dashboard.get("query_trends", [])
+                if isinstance(trends7, list) and trends7:
+                    df7 = pd.DataFrame(trends7)
+                    # Use localized x-axis labels for Hindi instead of default English date strings
+                    try:
+                        x_labels7 = localize_dates(df7['day'].tolist(), st.session_state.language)
+                    except Exception:
+                        x_labels7 = df7['day'].tolist()
+                    fig7 = go.Figure()
+                    fig7.add_trace(go.Scatter(
+                        x=x_labels7,
+                        y=df7['count'],
+                        mode='lines+markers',
+                        line=dict(color='#2563eb', width=3),
+                        marker=dict(size=6)
+                    ))
+                    fig7.update_layout(
+                        height=220,
+                        margin=dict(t=10,l=40,r=20,b=40),
+                        xaxis_title=translate('Day', st.session_state.language),
+                        yaxis_title=translate('Queries', st.session_state.language),
+                        plot_bgcolor='white'
+                    )
+                    fig7.update_xaxes(showgrid=False)
+                    fig7.update_yaxes(showgrid=True, gridcolor='#f1f5f9')
+                    st.plotly_chart(fig7, use_container_width=True)
+                else:
+                    st.caption(translate("Not enough data for trend.", st.session_state.language))
 
         # --- Knowledge Base Management Tab ---
         with tabs[kb_idx]:
@@ -1384,9 +1506,7 @@ if choice == translate("Admin", st.session_state.language):
             # Category distribution pie
             st.markdown("### 🧠 " + translate("Top Query Categories", st.session_state.language))
             try:
-                res = requests.get(f"{API_URL}/kb/categories")
-                data = res.json()
-                df = pd.DataFrame(data)
+                df = pd.DataFrame(dashboard.get("kb_categories", []), columns=["category", "count"])
                 category_hi = {
                     "Diseases & Conditions": "बीमारियाँ और स्थितियाँ",
                     "Lifestyle & Prevention": "जीवनशैली और रोकथाम",
@@ -1415,7 +1535,7 @@ if choice == translate("Admin", st.session_state.language):
             with colA:
                 st.subheader(translate("Intent Distribution", st.session_state.language))
                 try:
-                    intent_dist = requests.get(f"{API_URL}/analytics/intent-distribution", headers=headers).json()
+                    intent_dist = dashboard.get("intent_distribution", [])
                     if isinstance(intent_dist, list) and intent_dist:
                         df_int = pd.DataFrame(intent_dist)
                         df_int = df_int[df_int["intent"] != "kb_lookup"]
@@ -1440,7 +1560,7 @@ if choice == translate("Admin", st.session_state.language):
             with colB:
                 st.subheader(translate("Hourly Activity (UTC Today)", st.session_state.language))
                 try:
-                    hourly = requests.get(f"{API_URL}/analytics/hourly-activity", headers=headers).json()
+                    hourly = dashboard.get("hourly_activity", [])
                     if isinstance(hourly, list) and hourly:
                         df_hr = pd.DataFrame(hourly)
                         st.line_chart(df_hr.set_index("hour")["count"])
@@ -1828,3 +1948,11 @@ if choice == translate("Admin", st.session_state.language):
             st.markdown("---")
             st.caption(translate("System utilities and future environment health checks will appear here.",
                                  st.session_state.language))
+
+# -----------------------
+# Translations missed on this page: one batch, then one rerun to show whatever came back
+# -----------------------
+if flush_translations(st.session_state.language, retry=False) and not st.session_state.get("_translation_rerun"):
+    st.session_state["_translation_rerun"] = True
+    st.rerun()
+st.session_state["_translation_rerun"] = False
@@ -5,15 +5,15 @@ from rasa_sdk import Action, Tracker
 from rasa_sdk.executor import CollectingDispatcher
 from rasa_sdk.events import SlotSet
 from .actions_kb import ActionQueryKB
+from .kb_store import AliasTokenIndex, kb_store, clean_text
 
 # ✅ DB logging imports
-from backend.main import SessionLocal, Message
+from backend.main import Message, log_writer
 from datetime import datetime
 
 # ✅ Logging helper
 def log_message(email: str, user_text: str, bot_response: str, intent: str):
     try:
-        db = SessionLocal()
         new_entry = Message(
             email=email,
             user_text=user_text,
@@ -22,21 +22,17 @@ def log_message(email: str, user_text: str, bot_response: str, intent: str):
             source="milestone3",
             timestamp=datetime.utcnow()
         )
-        db.add(new_entry)
-        db.commit()
-        db.close()
+        log_writer.submit(new_entry)
     except Exception as e:
         print(f"❌ Failed to log message: {e}")
 
-# ✅ Load structured KB
+# ✅ Structured KB (cached by kb_store, reloaded when the file changes)
 def load_kb():
-    with open("data_structured/structured_conditions_verified.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+    return kb_store.get().entries
 
-# ✅ Load unified alias map
+# ✅ Unified alias map (shared alias registry)
 def load_condition_aliases():
-    with open("data_structured/condition_aliases.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+    return kb_store.get().alias_map
 
 # ✅ Detect language from full message
 def get_lang(tracker: Tracker) -> str:
@@ -55,11 +51,17 @@ def find_best_match(
     lang: str,
     intent: Optional[str] = None,
     required_fields: Optional[List[str]] = None,
-    debug: bool = False
+    debug: bool = False,
+    index: Optional[AliasTokenIndex] = None
 ) -> Optional[Dict]:
     # Normalize user message
-    user_message_clean = re.sub(r"[^\w\s]", " ", user_message.lower()).strip()
+    user_message_clean = clean_text(user_message)
     user_tokens = set(user_message_clean.split())
+    threshold = 2 if lang == "en" else 1
+
+    # ✅ Prebuilt token index (kb_store): same result, scores only candidate entries
+    if index is not None and not debug:
+        return index.best_match(user_message_clean, required_fields, threshold)
 
     best_entry = None
     best_score = 0
@@ -75,7 +77,7 @@ def find_best_match(
         aliases += alias_map.get(condition_key, {}).get(lang, [])
 
         for alias in aliases:
-            alias_clean = re.sub(r"[^\w\s]", " ", alias.lower()).strip()
+            alias_clean = clean_text(alias)
 
             # ✅ Exact phrase match
             if alias_clean.strip() == user_message_clean.strip():
@@ -101,7 +103,6 @@ def find_best_match(
                 best_entry = entry
 
     # ✅ Final return logic
-    threshold = 2 if lang == "en" else 1
     if debug:
         print(f"🏁 Best score: {best_score} | Threshold: {threshold}")
     if best_entry and best_score >= threshold:
@@ -124,10 +125,17 @@ class ActionProvideSymptoms(Action):
         duration = tracker.get_slot("duration")
         user_message = tracker.latest_message.get("text", "").lower()
 
-        data = load_kb()
-        alias_map = load_condition_aliases()
+        kb = kb_store.get()
 
-        entry = find_best_match(...)
+        entry = find_best_match(
+            user_message=user_message,
+            data=kb.entries,
+            alias_map=kb.alias_map,
+            lang=lang,
+            intent="ask_about_symptom",
+            required_fields=["possible_symptom", "disclaimer"],
+            index=kb.index_for(lang)
+        )
 
         if entry:
             response = (
@@ -163,10 +171,17 @@ class ActionProvideFirstAid(Action):
         medication = tracker.get_slot("medication")
         user_message = tracker.latest_message.get("text", "").lower()
 
-        data = load_kb()
-        alias_map = load_condition_aliases()
+        kb = kb_store.get()
 
-        entry = find_best_match(...)
+        entry = find_best_match(
+            user_message=user_message,
+            data=kb.entries,
+            alias_map=kb.alias_map,
+            lang=lang,
+            intent="query_first_aid",
+            required_fields=["first_aid_tips", "disclaimer"],
+            index=kb.index_for(lang)
+        )
 
         if entry:
             response = (
@@ -210,9 +225,16 @@ class ActionProvideWellnessTip(Action):
                 f"⚠️ Disclaimer:\nThis information is for educational purposes only and should not be considered medical advice."
             )
         else:
-            data = load_kb()
-            alias_map = load_condition_aliases()
-            entry = find_best_match(...)
+            kb = kb_store.get()
+            entry = find_best_match(
+                user_message=user_message,
+                data=kb.entries,
+                alias_map=kb.alias_map,
+                lang=lang,
+                intent="ask_about_wellness_tip",
+                required_fields=["prevention_tips", "disclaimer"],
+                index=kb.index_for(lang)
+            )
             if entry:
                 response = (
                     f"🧘 Wellness Tip related to *{entry['condition'][lang]}*:\n"
@@ -237,13 +259,12 @@ class ActionHealthInfo(Action):
 
         lang = get_lang(tracker)
         user_message = tracker.latest_message.get("text", "").lower()
-        data = load_kb()
-        alias_map = load_condition_aliases()
+        kb = kb_store.get()
 
         entry = find_best_match(
             user_message=user_message,
-            data=data,
-            alias_map=alias_map,
+            data=kb.entries,
+            alias_map=kb.alias_map,
             lang=lang,
             intent="ask_about_condition",
             required_fields=[
@@ -252,7 +273,8 @@ class ActionHealthInfo(Action):
                 "first_aid_tips",
                 "prevention_tips",
                 "disclaimer"
-            ]
+            ],
+            index=kb.index_for(lang)
         )
 
         if entry:
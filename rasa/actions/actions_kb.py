@@ -2,20 +2,20 @@ from typing import Any, Text, Dict, List, Optional
 from rasa_sdk import Action, Tracker
 from rasa_sdk.executor import CollectingDispatcher
 from rasa_sdk.events import SlotSet
-import requests, json, os, re
+import json, os, re
 
 # ✅ Backend imports
-from backend.main import SessionLocal, ConditionInfo
+from backend.main import SessionLocal, ConditionInfo, alias_registry
+from .kb_client import kb_client
 
 
 # ✅ DB logging imports
-from backend.main import SessionLocal, Message
+from backend.main import Message, log_writer
 from datetime import datetime
 
 # ✅ Logging helper
 def log_message(email: str, user_text: str, bot_response: str, intent: str):
     try:
-        db = SessionLocal()
         new_entry = Message(
             email=email,
             user_text=user_text,
@@ -24,23 +24,15 @@ def log_message(email: str, user_text: str, bot_response: str, intent: str):
             source="milestone3",
             timestamp=datetime.utcnow()
         )
-        db.add(new_entry)
-        db.commit()
-        db.close()
+        log_writer.submit(new_entry)
     except Exception as e:
         print(f"❌ Failed to log message: {e}")
 
-# ✅ Load alias map
-def load_condition_aliases() -> Dict:
-    alias_path = os.path.join("data_structured", "condition_aliases.json")
-    with open(alias_path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
 class ActionQueryKB(Action):
     def name(self) -> Text:
         return "action_query_kb"
 
-    def run(self, dispatcher: CollectingDispatcher,
+    async def run(self, dispatcher: CollectingDispatcher,
             tracker: Tracker,
             domain: Dict[Text, Any]) -> List[Dict[Text, Any]]:
 
@@ -52,32 +44,27 @@ class ActionQueryKB(Action):
         if not lang or lang not in ["hi", "en"]:
             lang = "hi" if any("\u0900" <= c <= "\u097F" for c in user_text) else "en"
 
-        aliases = load_condition_aliases()
+        aliases = alias_registry.get()
         matched = False
 
         if condition:
-            for canonical, lang_map in aliases.items():
-                if condition in lang_map.get(lang, []):
-                    condition = canonical
-                    matched = True
-                    break
+            canonical = aliases.canonical_for(condition, lang)
+            if canonical:
+                condition = canonical
+                matched = True
 
         if not matched:
-            for canonical, lang_map in aliases.items():
-                if any(alias in user_text for alias in lang_map.get(lang, [])):
-                    condition = canonical
-                    matched = True
-                    break
+            canonical = aliases.first_mentioned(user_text, lang)
+            if canonical:
+                condition = canonical
+                matched = True
 
         if not matched:
             try:
-                suggest_url = f"http://localhost:8000/kb/search?q={condition or user_text}"
-                suggest_res = requests.get(suggest_url)
-                if suggest_res.status_code == 200:
-                    suggestions = suggest_res.json().get("suggestions", [])
-                    if suggestions:
-                        condition = suggestions[0]
-                        matched = True
+                suggestions = await kb_client.search(condition or user_text)
+                if suggestions:
+                    condition = suggestions[0]
+                    matched = True
             except Exception as e:
                 print(f"❌ Suggestion fetch failed: {e}")
 
@@ -91,10 +78,9 @@ class ActionQueryKB(Action):
             return []
 
         try:
-            url = f"http://localhost:8000/kb/{condition}"
-            response = requests.get(url)
+            data = await kb_client.get_condition(condition)
 
-            if response.status_code == 404:
+            if data is None:
                 fallback_response = "माफ़ कीजिए, उस बीमारी की जानकारी नहीं मिली।"
                 dispatcher.utter_message(
                     text=fallback_response,
@@ -103,8 +89,6 @@ class ActionQueryKB(Action):
                 log_message("anonymous", user_text, fallback_response, "unknown")
                 return []
 
-            data = response.json()
-
             if intent == "ask_about_condition" and "description" in data:
                 bot_response = data["description"][lang]
             elif intent == "ask_about_symptom" and "possible_symptom" in data:
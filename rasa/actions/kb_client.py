@@ -0,0 +1,173 @@
+import asyncio
+import os
+import time
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+KB_BASE_URL = os.getenv("WELLBOT_KB_URL", "http://localhost:8000")
+
+# 🔹 "auto": call the KB in-process when backend.main is importable (the action
+# server already imports it for logging), else HTTP. "http" / "inprocess" force one.
+KB_CLIENT_MODE = os.getenv("WELLBOT_KB_CLIENT", "auto")
+
+
+class KBClient:
+    """KB lookups for the action server: /kb/search and /kb/{condition}.
+
+    HTTP mode keeps one pooled keep-alive httpx.AsyncClient with connect/read
+    timeouts and retries transport errors and 5xx responses with a short
+    backoff. In-process mode reads backend.main's KB snapshot directly; every
+    `kb_refresh` seconds a worker thread asks the store for it again (which
+    reloads it when another process changed the conditions table), so the
+    event loop only waits on the DB for the first load. Both cache results,
+    including "not found", for `cache_ttl` seconds.
+    """
+
+    def __init__(self, base_url: str = KB_BASE_URL, mode: str = KB_CLIENT_MODE,
+                 timeout: float = 2.0, connect_timeout: float = 0.5, retries: int = 2,
+                 cache_ttl: float = 30.0, cache_size: int = 512, max_connections: int = 20,
+                 kb_refresh: float = 1.0):
+        self.base_url = base_url
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.retries = retries
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.limits = httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_connections)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._cache: Dict[Tuple[str, str], Tuple[float, object]] = {}
+        self._service = self._load_service() if mode in ("auto", "inprocess") else None
+        if mode == "inprocess" and self._service is None:
+            raise RuntimeError("WELLBOT_KB_CLIENT=inprocess but backend.main could not be imported")
+        self.mode = "inprocess" if self._service is not None else "http"
+        self.kb_refresh = kb_refresh
+        self._kb_snapshot = None
+        self._kb_refresh_task: Optional[asyncio.Task] = None
+        self._snapshot_at = 0.0
+
+    @staticmethod
+    def _load_service():
+        try:
+            import backend.main as service
+            return service
+        except Exception as e:
+            print(f"⚠️ In-process KB unavailable, using HTTP: {e}")
+            return None
+
+    # -----------------------
+    # TTL cache
+    # -----------------------
+    def _cached(self, key: Tuple[str, str]):
+        hit = self._cache.get(key)
+        if hit is None:
+            return False, None
+        expires, value = hit
+        if expires < time.monotonic():
+            self._cache.pop(key, None)
+            return False, None
+        return True, value
+
+    def _store(self, key: Tuple[str, str], value):
+        if len(self._cache) >= self.cache_size:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (time.monotonic() + self.cache_ttl, value)
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    # -----------------------
+    # HTTP transport
+    # -----------------------
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=self.limits,
+            )
+        return self._client
+
+    async def _get(self, path: str, params: Optional[dict] = None) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                response = await self._http().get(path, params=params)
+                if response.status_code < 500 or attempt >= self.retries:
+                    return response
+            except httpx.TransportError:
+                if attempt >= self.retries:
+                    raise
+            attempt += 1
+            await asyncio.sleep(0.05 * 2 ** attempt)
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # -----------------------
+    # In-process KB
+    # -----------------------
+    async def _snapshot(self):
+        # store.get() may hit the DB (version check / reload): never run it on the event loop
+        store = self._service.kb_store
+        now = time.monotonic()
+        if self._kb_snapshot is None:
+            self._kb_snapshot = await asyncio.to_thread(store.get)
+            self._snapshot_at = now
+        elif now - self._snapshot_at >= self.kb_refresh and (
+                self._kb_refresh_task is None or self._kb_refresh_task.done()):
+            self._snapshot_at = now
+            self._kb_refresh_task = asyncio.create_task(self._refresh_snapshot(store))
+        return self._kb_snapshot
+
+    async def _refresh_snapshot(self, store):
+        try:
+            self._kb_snapshot = await asyncio.to_thread(store.get)
+        except Exception as e:
+            print(f"⚠️ KB snapshot refresh failed, serving the previous one: {e}")
+
+    # -----------------------
+    # Public API
+    # -----------------------
+    async def search(self, query: str) -> List[str]:
+        """Condition-name suggestions, like GET /kb/search?q=..."""
+        key = ("search", (query or "").lower())
+        found, value = self._cached(key)
+        if found:
+            return value
+        if self._service is not None:
+            suggestions = self._service.get_condition_suggestions(query, None, snapshot=await self._snapshot())
+        else:
+            response = await self._get("/kb/search", params={"q": query})
+            response.raise_for_status()
+            suggestions = response.json().get("suggestions", [])
+        self._store(key, suggestions)
+        return suggestions
+
+    async def get_condition(self, condition: str) -> Optional[dict]:
+        """Condition row as returned by GET /kb/{condition}; None if it does not exist."""
+        key = ("condition", (condition or "").lower().strip())
+        found, value = self._cached(key)
+        if found:
+            return value
+        if self._service is not None:
+            record = (await self._snapshot()).lookup(condition)
+            data = None
+            if record is not None:
+                data = asdict(record)
+                data.pop("created_at", None)
+        else:
+            response = await self._get(f"/kb/{condition}")
+            if response.status_code == 404:
+                data = None
+            else:
+                response.raise_for_status()
+                data = response.json()
+        self._store(key, data)
+        return data
+
+
+kb_client = KBClient()
@@ -0,0 +1,184 @@
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.alias_matcher import AliasMatcher
+from backend.main import alias_registry
+
+KB_PATH = os.path.join("data_structured", "structured_conditions_verified.json")
+
+# (cleaned alias, its token set) for one KB entry, in the order find_best_match tries them
+AliasTokens = Tuple[Tuple[str, frozenset], ...]
+
+
+def clean_text(text: str) -> str:
+    return re.sub(r"[^\w\s]", " ", text.lower()).strip()
+
+
+class AliasTokenIndex:
+    """Per-language lookup structures for find_best_match over one KBView.
+
+    Keeps find_best_match's order of precedence: the first entry (in KB order)
+    with an alias contained in the message wins; otherwise the entry with the
+    largest alias/message token overlap (earliest entry on ties) if it reaches
+    the threshold. Substring hits come from one Aho-Corasick pass over the
+    message; overlaps are counted from the alias-token postings of the
+    message tokens, so only entries sharing a token are ever scored.
+    """
+
+    def __init__(self, entries: List[Dict], aliases: List[AliasTokens], lang: str):
+        self.entries = entries
+        self.lang = lang
+        # An empty alias (missing name in `lang`) is a substring of every message
+        self.always = [i for i, entry_aliases in enumerate(aliases)
+                       if any(not alias for alias, _ in entry_aliases)]
+        self.matcher = AliasMatcher(
+            {i: {lang: [alias for alias, _ in entry_aliases if alias]} for i, entry_aliases in enumerate(aliases)},
+            str,
+        )
+        # token -> [(entry index, alias index)]
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        for i, entry_aliases in enumerate(aliases):
+            for j, (_, tokens) in enumerate(entry_aliases):
+                for token in tokens:
+                    self.postings.setdefault(token, []).append((i, j))
+        self._eligible: Dict[Tuple[str, ...], List[bool]] = {}
+
+    def eligible(self, required_fields: Optional[Iterable[str]]) -> List[bool]:
+        key = tuple(required_fields or ())
+        flags = self._eligible.get(key)
+        if flags is None:
+            flags = [
+                not any(field not in entry or not entry[field].get(self.lang) for field in key)
+                for entry in self.entries
+            ]
+            self._eligible[key] = flags
+        return flags
+
+    def best_match(self, message_clean: str, required_fields: Optional[Iterable[str]],
+                   threshold: int) -> Optional[Dict]:
+        ok = self.eligible(required_fields)
+
+        # ✅ Exact phrase / substring match: first eligible entry wins
+        hits = [i for i in self.matcher.match(message_clean, self.lang) if ok[i]]
+        hits += [i for i in self.always if ok[i]]
+        if hits:
+            return self.entries[min(hits)]
+
+        # ✅ Token overlap scoring, only for aliases sharing a token with the message
+        overlap: Counter = Counter()
+        for token in set(message_clean.split()):
+            for i, j in self.postings.get(token, ()):
+                if ok[i]:
+                    overlap[(i, j)] += 1
+        best_entry, best_score = None, 0
+        for (i, _), score in overlap.items():
+            if score > best_score or (score == best_score and i < best_entry):
+                best_entry, best_score = i, score
+        if best_entry is not None and best_score >= threshold:
+            return self.entries[best_entry]
+        return None
+
+
+class KBView:
+    """Immutable view of the structured KB plus the alias map it was paired with.
+
+    `aliases[lang][i]` holds the cleaned aliases of `entries[i]` (its own
+    condition name first, then condition_aliases.json terms) with their token
+    sets, so matching never re-normalizes alias strings; index_for(lang)
+    builds the AliasTokenIndex over them.
+    """
+
+    def __init__(self, entries: List[Dict], alias_map: Dict, mtime: Optional[float]):
+        self.entries = entries
+        self.alias_map = alias_map
+        self.mtime = mtime
+        self.aliases: Dict[str, List[AliasTokens]] = {}
+        self._indexes: Dict[str, AliasTokenIndex] = {}
+        for lang in ("en", "hi"):
+            self.index_for(lang)
+
+    def _entry_aliases(self, entry: Dict, lang: str) -> AliasTokens:
+        names = [entry["condition"].get(lang) or ""]
+        names += self.alias_map.get(entry["condition"]["en"].strip(), {}).get(lang, [])
+        return tuple((alias, frozenset(alias.split())) for alias in map(clean_text, names))
+
+    def aliases_for(self, lang: str) -> List[AliasTokens]:
+        prepared = self.aliases.get(lang)
+        if prepared is None:
+            prepared = [self._entry_aliases(entry, lang) for entry in self.entries]
+            self.aliases[lang] = prepared
+        return prepared
+
+    def index_for(self, lang: str) -> AliasTokenIndex:
+        index = self._indexes.get(lang)
+        if index is None:
+            index = AliasTokenIndex(self.entries, self.aliases_for(lang), lang)
+            self._indexes[lang] = index
+        return index
+
+
+class ActionKBStore:
+    """Action-server cache of structured_conditions_verified.json.
+
+    The file is parsed once; get() re-stats it at most every `check_interval`
+    seconds and rebuilds the view when its mtime changes or when the shared
+    alias registry has swapped in a new alias snapshot.
+    """
+
+    def __init__(self, path: str = KB_PATH, registry=alias_registry, check_interval: float = 2.0):
+        self.path = path
+        self.registry = registry
+        self.check_interval = check_interval
+        self._view: Optional[KBView] = None
+        self._aliases = None
+        self._entries: List[Dict] = []
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def _read(self) -> List[Dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"❌ Failed to load KB from {self.path}: {e}")
+            return self._entries
+
+    def reload(self, reread: bool = True) -> KBView:
+        with self._lock:
+            mtime = self._mtime()
+            if reread or self._view is None:
+                self._entries = self._read()
+            else:
+                mtime = self._view.mtime
+            aliases = self.registry.get()
+            self._view = KBView(self._entries, aliases.aliases, mtime)
+            self._aliases = aliases
+            self._checked_at = time.monotonic()
+            return self._view
+
+    def get(self) -> KBView:
+        view = self._view
+        if view is None:
+            return self.reload()
+        if self.registry.get() is not self._aliases:
+            view = self.reload(reread=False)
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            if self._mtime() != view.mtime:
+                return self.reload()
+        return view
+
+
+kb_store = ActionKBStore()
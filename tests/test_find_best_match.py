@@ -0,0 +1,71 @@
+"""Indexed find_best_match vs the full alias scan (python -m pytest tests).
+
+Runs every example in rasa/data/nlu.yml (entity markup stripped, lower-cased
+like the actions do) through find_best_match with and without the kb_store
+AliasTokenIndex, for each required_fields set the actions use. Skipped when
+rasa_sdk is not installed.
+"""
+import os
+import re
+import sys
+
+import pytest
+
+pytest.importorskip("rasa_sdk")
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "rasa"))
+
+from actions.actions import find_best_match  # noqa: E402
+from actions.kb_store import kb_store  # noqa: E402
+
+NLU_PATH = os.path.join(ROOT, "rasa", "data", "nlu.yml")
+ENTITY = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+
+REQUIRED_FIELDS = [
+    None,
+    ["possible_symptom", "disclaimer"],
+    ["first_aid_tips", "disclaimer"],
+    ["prevention_tips", "disclaimer"],
+    ["description", "possible_symptom", "first_aid_tips", "prevention_tips", "disclaimer"],
+]
+
+
+def nlu_examples():
+    examples = []
+    with open(NLU_PATH, "r", encoding="utf-8") as f:
+        for line in f:
+            stripped = line.strip()
+            if line.startswith("    - ") and stripped[2:]:
+                examples.append(ENTITY.sub(r"\1", stripped[2:]).lower())
+    return examples
+
+
+def example_lang(text: str) -> str:
+    return "hi" if re.search(r"[अ-ह]", text) else "en"
+
+
+@pytest.fixture(scope="module")
+def kb():
+    # The actions load their data files by paths relative to the repo root
+    cwd = os.getcwd()
+    os.chdir(ROOT)
+    try:
+        yield kb_store.get()
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.mark.parametrize("fields", REQUIRED_FIELDS, ids=lambda f: "+".join(f) if f else "any")
+def test_index_matches_full_scan(kb, fields):
+    mismatches = []
+    for text in nlu_examples():
+        lang = example_lang(text)
+        expected = find_best_match(text, kb.entries, kb.alias_map, lang, required_fields=fields)
+        got = find_best_match(text, kb.entries, kb.alias_map, lang, required_fields=fields,
+                              index=kb.index_for(lang))
+        if got is not expected:
+            name = lambda e: e["condition"]["en"] if e else None  # noqa: E731
+            mismatches.append((text, name(expected), name(got)))
+    assert not mismatches, f"{len(mismatches)} mismatches (text, scan, index), e.g. {mismatches[:5]}"
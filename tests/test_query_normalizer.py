@@ -0,0 +1,104 @@
+"""Compiled QueryNormalizer vs the original str.replace loop (python -m pytest tests).
+
+The corpus is every text in data_structured/intent_dataset.jsonl and
+rasa/data/nlu.yml, the KB condition names and aliases, every map key on its
+own and in a sentence, every pair of keys joined with and without a space,
+and a seeded fuzz of run-together key fragments. Each text is normalized
+once and twice (generate_response passes already normalized text into
+extract_keyword).
+"""
+import json
+import os
+import random
+import re
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+import backend.main  # noqa: E402,F401  (backend.dialogue_manager must be imported via main)
+from backend.dialogue_manager import query_normalizer  # noqa: E402
+from backend.query_normalizer import QueryNormalizer  # noqa: E402
+
+DATASET = os.path.join(ROOT, "data_structured", "intent_dataset.jsonl")
+KB_PATH = os.path.join(ROOT, "data_structured", "structured_conditions_verified.json")
+ALIASES_PATH = os.path.join(ROOT, "data_structured", "condition_aliases.json")
+NLU_PATH = os.path.join(ROOT, "rasa", "data", "nlu.yml")
+ENTITY = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+
+# Run-together keys where one longest-match alternation pass disagreed with the loop
+OVERLAPPING_KEYS = ["hydratipill", "burnedrug", "redwoundrug", "tipill", "i took a drugpill", "woundrug"]
+
+
+def corpus():
+    texts = []
+    with open(DATASET, "r", encoding="utf-8") as f:
+        texts += [json.loads(line)["text"] for line in f if line.strip()]
+    with open(NLU_PATH, "r", encoding="utf-8") as f:
+        texts += [ENTITY.sub(r"\1", line.strip()[2:]) for line in f
+                  if line.startswith("    - ") and line.strip()[2:]]
+    with open(KB_PATH, "r", encoding="utf-8") as f:
+        for entry in json.load(f):
+            texts += [name for name in entry["condition"].values() if name]
+    with open(ALIASES_PATH, "r", encoding="utf-8") as f:
+        for langs in json.load(f).values():
+            for names in langs.values():
+                texts += names
+
+    keys = [key for stage in query_normalizer.stages for key in stage]
+    for key in keys:
+        texts += [key, f"I have {key}!", f"{key}s", f"my {key} since morning", key.upper()]
+    texts += [f"{a} {b}" for a in keys for b in keys]
+    texts += [f"{a}{b}" for a in keys for b in keys]
+    return list(dict.fromkeys(texts))
+
+
+def fuzz(n=20000, seed=16):
+    """Run-together fragments (whole keys, their prefixes/suffixes, replacements) so keys overlap."""
+    rng = random.Random(seed)
+    pieces = []
+    for stage in query_normalizer.stages:
+        for key, canonical in stage.items():
+            pieces += [key, canonical, key[:len(key) // 2 + 1], key[len(key) // 2:]]
+    return [" " * rng.randint(0, 1) + "".join(rng.choice(pieces) + " " * (rng.random() < 0.2)
+                                             for _ in range(rng.randint(2, 4)))
+            for _ in range(n)]
+
+
+def assert_parity(normalizer, texts):
+    mismatches = []
+    for text in texts:
+        expected = normalizer.normalize_sequential(text)
+        got = normalizer._normalize(text)
+        if got != expected or normalizer._normalize(got) != normalizer.normalize_sequential(expected):
+            mismatches.append((text, expected, got))
+    assert not mismatches, f"{len(mismatches)} mismatches, e.g. {mismatches[:5]}"
+
+
+def test_corpus_matches_sequential_loop():
+    assert_parity(query_normalizer, corpus())
+
+
+def test_overlapping_keys_match_sequential_loop():
+    assert_parity(query_normalizer, OVERLAPPING_KEYS)
+    assert query_normalizer.normalize("hydratipill") == "hydratimedicine"
+    assert query_normalizer.normalize("burnedrug") == "burnemedicine"
+
+
+def test_fuzzed_run_together_keys_match_sequential_loop():
+    assert_parity(query_normalizer, fuzz())
+
+
+@pytest.mark.parametrize("stage,text", [
+    ({"ab": "x", "bc": "y"}, "abc"),         # overlap: earlier entry wins, not the leftmost match
+    ({"bc": "y", "ab": "x"}, "abc"),
+    ({"a": "b", "bb": "c"}, "ab"),           # replacement forms a later key with its neighbour
+    ({"x": "", "ab": "z"}, "axb"),           # deletion joins the neighbours into a later key
+    ({"fever": "fever", "feverish": "fever"}, "feverish"),  # earlier key is a prefix of a later one
+    ({"a": "bcd", "c": "e"}, "a"),           # later key inside a replacement
+])
+def test_small_maps_match_sequential_loop(stage, text):
+    normalizer = QueryNormalizer([stage])
+    assert normalizer._normalize(text) == normalizer.normalize_sequential(text)